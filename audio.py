@@ -4,6 +4,29 @@ import pygame
 
 AUDIO_BASE = os.path.join(os.path.dirname(__file__), "Assets", "Sounds")
 
+# Voice categories: (priority, reserved channels, max voices per sound).
+# Higher priority voices may steal shared channels from lower ones.
+SFX_CATEGORIES = {
+    "player": (4, 2, 1),    # player hit / death
+    "ui": (4, 2, 2),        # menu clicks, pause, level up, game over
+    "boss": (3, 2, 2),
+    "pickup": (2, 2, 2),
+    "death": (2, 6, 4),     # enemy deaths
+    "shoot": (1, 4, 3),
+}
+SHARED_CHANNELS = 6         # overflow channels any category can use or steal
+
+# AudioManager sound attribute -> category (anything unlisted is "ui")
+SFX_ATTR_CATEGORIES = {
+    "snd_player_hit": "player",
+    "snd_player_death": "player",
+    "snd_boss_explosion": "boss",
+    "snd_pickup_boss": "boss",
+    "snd_pickup_boost": "pickup",
+    "snd_enemy_death": "death",
+    "snd_shoot": "shoot",
+}
+
 
 def load_sound(name: str):
     """Load a single sound from the shared audio folder."""
@@ -14,11 +37,36 @@ def load_sound(name: str):
 
 
 class AudioManager:
+    """Music plus a small SFX voice manager.
+
+    ``play_sfx`` only queues a request; ``flush`` (once per frame) starts
+    the queued sounds. Identical requests within a frame merge into one
+    voice. Each category owns a few reserved channels and can overflow into
+    a shared pool. Past a sound's voice cap, its oldest voice is restarted.
+    When no channel is free, the lowest-priority shared voice is stolen.
+    """
+
     def __init__(self):
         pygame.mixer.init()
         self.music_volume = 0.5
         self.sfx_volume = 0.8
 
+        # Voice manager state
+        self._pending = {}          # sound -> None, insertion ordered
+        self._category = {}         # sound -> category name
+        self._applied_volume = {}   # sound -> volume last set on it
+        self._voices = {}           # sound -> [channel index, oldest first]
+        self._channels = []
+        self._category_channels = {}
+        self._shared_channels = []
+        self._channel_prio = []
+        self._channel_started = []
+        self._frame = 0
+        self.merged = 0
+        self.stolen = 0
+        self.dropped = 0
+        self._setup_channels()
+
         # SFX placeholders – wired up by the game on boot
         self.snd_pause = None
         self.snd_unpause = None
@@ -40,11 +88,100 @@ class AudioManager:
 
     def set_sfx_volume(self, v: float):
         self.sfx_volume = max(0.0, min(1.0, v))
+        # Applied lazily, once per sound, on its next play
+        self._applied_volume.clear()
+
+    # ===== SFX VOICES =====
+    def _setup_channels(self):
+        total = sum(reserved for _, reserved, _ in SFX_CATEGORIES.values()) + SHARED_CHANNELS
+        pygame.mixer.set_num_channels(total)
+        # Reserve them all so nothing but the voice manager picks channels
+        pygame.mixer.set_reserved(total)
+        self._channels = [pygame.mixer.Channel(i) for i in range(total)]
+        self._channel_prio = [0] * total
+        self._channel_started = [0] * total
+        index = 0
+        for name, (_, reserved, _) in SFX_CATEGORIES.items():
+            self._category_channels[name] = list(range(index, index + reserved))
+            index += reserved
+        self._shared_channels = list(range(index, total))
+
+    def bind_sfx(self):
+        """Map the loaded ``snd_*`` sounds to their voice categories."""
+        self._category.clear()
+        for attr, value in vars(self).items():
+            if attr.startswith("snd_") and value is not None:
+                self._category[value] = SFX_ATTR_CATEGORIES.get(attr, "ui")
 
     def play_sfx(self, sound: pygame.mixer.Sound | None):
         if sound:
+            if sound in self._pending:
+                self.merged += 1
+            else:
+                self._pending[sound] = None
+
+    def flush(self):
+        """Start this frame's queued sounds (one voice per distinct sound)."""
+        self._frame += 1
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = {}
+        for sound in pending:
+            self._start(sound)
+
+    def _start(self, sound):
+        category = self._category.get(sound, "ui")
+        prio, _, cap = SFX_CATEGORIES[category]
+        channels = self._channels
+        voices = [i for i in self._voices.get(sound, ()) if channels[i].get_sound() is sound]
+        self._voices[sound] = voices
+
+        if len(voices) >= cap:
+            # Per-sound cap: restart its oldest voice
+            index = voices.pop(0)
+            self.stolen += 1
+        else:
+            index = self._free_channel(category)
+            if index is None:
+                index = self._steal_channel(prio)
+                if index is None:
+                    self.dropped += 1
+                    return
+                self.stolen += 1
+                stolen_sound = channels[index].get_sound()
+                if stolen_sound is not None and index in self._voices.get(stolen_sound, ()):
+                    self._voices[stolen_sound].remove(index)
+
+        if self._applied_volume.get(sound) != self.sfx_volume:
             sound.set_volume(self.sfx_volume)
-            sound.play()
+            self._applied_volume[sound] = self.sfx_volume
+        channels[index].play(sound)
+        self._channel_prio[index] = prio
+        self._channel_started[index] = self._frame
+        voices.append(index)
+
+    def _free_channel(self, category):
+        channels = self._channels
+        for index in self._category_channels[category]:
+            if not channels[index].get_busy():
+                return index
+        for index in self._shared_channels:
+            if not channels[index].get_busy():
+                return index
+        return None
+
+    def _steal_channel(self, prio):
+        """Shared channel with the lowest-priority, oldest voice at or below ``prio``."""
+        best = None
+        for index in self._shared_channels:
+            p = self._channel_prio[index]
+            if p > prio:
+                continue
+            key = (p, self._channel_started[index])
+            if best is None or key < best[0]:
+                best = (key, index)
+        return best[1] if best else None
 
     def stop_music(self):
         pygame.mixer.music.stop()
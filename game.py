@@ -1,27 +1,63 @@
+import argparse
 import os
 import math
 import random
 import sys
+import time
+from itertools import islice
+
+_IMPORT_T0 = time.perf_counter()
+
+if __name__ == "__main__" and "--headless" in sys.argv:
+    # Must be set before pygame/audio initialise (audio opens the mixer on import)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 import pygame
 from audio import audio
 from game_constants import *
-from game_entities import Bullet, Enemy, XPOrb, GasPickup, EvolutionPickup, Player
+from game_entities import EvolutionPickup, Player, BULLET_POOL, ENEMY_POOL, XP_ORB_POOL, GAS_POOL
+from game_enemy_kinds import KIND_BOSS, KIND_TABLE
+from game_sprites import ENEMY_SPRITES, WorldBatchRenderer
+from game_pools import flush_pools, pool_stats
 from game_powerups import POWERUPS, EVOLUTIONS, apply_powerup, apply_evolution, powerup_name, powerup_desc, evolution_name, evolution_desc, available_powerups
+from game_spawning import GAME_SPAWN_TABLE
+from game_population import PopulationManager
+from game_orbs import OrbField
+from game_projectiles import EnemyProjectilePool
+from game_pipeline import SimPipeline
+from game_quality import QualityGovernor
+from game_gc import GCManager
+from game_frames import FrameStats
+from game_assets import baked_assets
+from game_startup import BackgroundLoader, StartupReport
+from game_lod import EnemyLOD, LOD_NEAR
+from game_random import RandomStreams
+from game_replay import (
+    ReplayRecorder, Replay, run_replay, print_replay_report,
+    ACTION_RELOAD, ACTION_LEVELUP, ACTION_SKIP_LEVELUP, ACTION_EVOLUTION,
+)
 from game_ui import Button
 import game_ui
 from upgrade_system import UpgradeManager
 from upgrade_trees import UPGRADES_BY_ID, ALL_TREES, get_tier3_upgrades, get_all_effects_for_tier3
 
+_IMPORT_MS = (time.perf_counter() - _IMPORT_T0) * 1000.0
+
 
 # --- main game ---
 class Game:
     def __init__(self):
+        # Phase timings for --startup-report; module imports were timed at load
+        self.startup = StartupReport(_IMPORT_T0)
+        self.startup.add("imports", _IMPORT_MS)
         pygame.init()
         self.w, self.h = WIDTH, HEIGHT
         self.window = pygame.display.set_mode((self.w, self.h))
         self.screen = self.window
         pygame.display.set_caption("Space Invaders: Cosmic Ranger")
         self.clock = pygame.time.Clock()
+        self.startup.lap("display")
 
         # pixel font (bundled)
         font_path = os.path.join(os.path.dirname(__file__), "Assets", "UI", "Press_Start_2P", "PressStart2P-Regular.ttf")
@@ -39,26 +75,24 @@ class Game:
             self.font_tiny = pygame.font.SysFont("PressStart2P", 16)
             self.font_micro = pygame.font.SysFont("PressStart2P", 12)
             self.font_menu_title = pygame.font.SysFont("PressStart2P", 40)
+        self.startup.lap("fonts")
 
         # Try loading menu background image (optional). Falls back to starfield if missing.
+        self._menu_bg_path = os.path.join(os.path.dirname(__file__), "Assets", "Images", "menu-bg.png")
+        self._menu_bg_cache = None
         try:
-            img_path = os.path.join(os.path.dirname(__file__), "Assets", "Images", "menu-bg.png")
-            if os.path.isfile(img_path):
-                self.menu_bg_image_original = pygame.image.load(img_path).convert_alpha()
-            else:
-                self.menu_bg_image_original = None
+            self.menu_bg_image_original = baked_assets.image(self._menu_bg_path)
         except Exception:
             self.menu_bg_image_original = None
 
         # Try loading a title image for the main menu (optional). Fallback to text if missing.
         try:
             title_path = os.path.join(os.path.dirname(__file__), "Assets", "Images", "game-title.png")
-            if os.path.isfile(title_path):
-                self.game_title_image_original = pygame.image.load(title_path).convert_alpha()
-            else:
-                self.game_title_image_original = None
+            self.game_title_image_original = baked_assets.image(title_path)
         except Exception:
             self.game_title_image_original = None
+        game_ui.load_button_images()
+        self.startup.lap("images")
 
         self.state = STATE_MENU
         self.menu_buttons_shift = 0
@@ -145,23 +179,17 @@ class Game:
             COLOR_GRAY,
         )
 
-        # starfield
-        def rand_star_pos():
-            sx = clamp(random.gauss(0, WORLD_SIZE / 5), -WORLD_SIZE / 2, WORLD_SIZE / 2)
-            sy = clamp(random.gauss(0, WORLD_SIZE / 5), -WORLD_SIZE / 2, WORLD_SIZE / 2)
-            return sx, sy
-
-        self.stars = [
-            {
-                "x": rand_star_pos()[0],
-                "y": rand_star_pos()[1],
-                "r": random.randint(1, 4),
-                "blink": random.uniform(0, 1.0),
-                "blink_speed": random.uniform(0.8, 1.6),
-                "shape": random.choice(["dot", "diamond", "wide"]),
-            }
-            for _ in range(STAR_COUNT)
-        ]
+        # Seeded random streams per subsystem; reseeded by reset_game.
+        # Set run_seed to replay the same run (None picks a fresh seed).
+        self.run_seed = None
+        self.rng = RandomStreams()
+        # Every run's input is recorded and written to replay_path when it ends
+        self.record_replays = True
+        self.replay_path = os.path.join(os.path.dirname(__file__), "replays", "last_run.avzr")
+        self.recorder = None
+
+        # starfield: generated by the background loader (see _generate_stars)
+        self._stars = None
         self.star_flashes = []
 
         self.levelup_options = []  # List of upgrade IDs for level-up screen
@@ -197,6 +225,30 @@ class Game:
         # test mode controls (renamed from dev mode)
         self.test_mode = False
         self.test_power_queue = []
+        # F3 toggles the profiler overlay (frame time, entity counts, pool stats)
+        self.show_profiler = False
+        # Off-screen enemies tick at reduced rates (see game_lod)
+        self.lod = EnemyLOD(self)
+        # Batched, culled drawing of enemies, bullets, orbs and pickups
+        self.world_batch = WorldBatchRenderer(ENEMY_SPRITES)
+        # Trades cosmetic detail for frame time (see game_quality)
+        self.quality = QualityGovernor()
+        # Freezes static data and moves collections to natural pauses (see game_gc)
+        self.gc = GCManager()
+        # Per-run frame-time histogram and hitch snapshots, saved at game over
+        self.frame_stats = FrameStats(self)
+        self.frame_report_dir = os.path.join(os.path.dirname(__file__), "runs")
+        self.show_frame_report = False
+        # Optional scripted input (bots/benchmarks); None reads the real devices
+        self.input_source = None
+        self.aim_pos = (0, 0)
+        # Fixed-step loop state: sim ticks run last frame and how far (0..1)
+        # the render sits between the previous and current tick
+        self.sim_steps = 0
+        self.render_alpha = 1.0
+        # Overlap sim ticks with presenting the previous frame (see game_pipeline)
+        self.pipelined = False
+        self.pipeline = None
 
         btn_y = self.h // 4 + 80
         self.btn_window_dropdown = Button(
@@ -217,8 +269,18 @@ class Game:
         )
 
         self.reset_game()
-        self._load_audio_assets()
+        self.startup.lap("world")
+
+        # Music only needs its paths; SFX decoding and the starfield go to a
+        # background thread so the menu shows first (see game_startup)
+        self._load_music_paths()
+        self.assets_ready = False
+        self.loader = BackgroundLoader(self.startup)
+        self.loader.add("sfx", self._decode_sfx)
+        self.loader.add("stars", self._generate_stars)
+        self.loader.start()
         self._update_music(0)
+        self.startup.lap("audio")
 
     def _get_desktop_size(self):
         try:
@@ -266,45 +328,118 @@ class Game:
         p = self._to_logical_pos(pygame.mouse.get_pos())
         return p if p is not None else (-1, -1)
 
-    def _load_audio_assets(self):
+    def _poll_input(self):
+        """Return (keys, fire, aim_pos) for this frame.
+
+        `keys` supports `keys[pygame.K_*]` lookups; `aim_pos` is in logical
+        screen coordinates like `_mouse_pos()`.
+        """
+        if self.input_source is not None:
+            return self.input_source.poll(self)
+        return pygame.key.get_pressed(), pygame.mouse.get_pressed()[0], self._mouse_pos()
+
+    # ===== ASSET LOADING =====
+    SFX_FILES = {
+        "snd_player_death": "player-death.mp3",
+        "snd_player_hit": "player-hit.mp3",
+        "snd_enemy_death": "enemy-death.mp3",
+        "snd_shoot": "shooting.mp3",
+        "snd_level_up": "level-up.mp3",
+        "snd_pause": "pause.mp3",
+        "snd_unpause": "unpause.mp3",
+        "snd_game_over": "game-over.mp3",
+        "snd_boss_explosion": "boss-explosion.wav",
+        "snd_menu_click": "main-menu-click.wav",
+        "snd_pickup_boost": "pickup-boost.wav",
+        "snd_pickup_boss": "pickup-from-boss.wav",
+    }
+
+    def _load_music_paths(self):
         base = os.path.join(os.path.dirname(__file__), "Assets", "Sounds")
 
-        def load(name):
-            path = os.path.join(base, name)
-            return pygame.mixer.Sound(path) if os.path.isfile(path) else None
-
         def music_path(name):
             path = os.path.join(base, name)
             return path if os.path.isfile(path) else None
 
-        audio.snd_player_death = load("player-death.mp3")
-        audio.snd_player_hit = load("player-hit.mp3")
-        audio.snd_enemy_death = load("enemy-death.mp3")
-        audio.snd_shoot = load("shooting.mp3")
-        audio.snd_level_up = load("level-up.mp3")
-        audio.snd_pause = load("pause.mp3")
-        audio.snd_unpause = load("unpause.mp3")
-        audio.snd_game_over = load("game-over.mp3")
-        audio.snd_boss_explosion = load("boss-explosion.wav")
-        audio.snd_menu_click = load("main-menu-click.wav")
-        audio.snd_pickup_boost = load("pickup-boost.wav")
-        audio.snd_pickup_boss = load("pickup-from-boss.wav")
-
         audio.music_menu = music_path("menu-bg.mp3")
         audio.music_ingame = music_path("ingame-bg.mp3")
         audio.music_defeat = music_path("defeat-bg.wav")
 
-    def reset_game(self):
+    def _decode_sfx(self):
+        """Loader job: decode every SFX (baked PCM copy when fresh, see tools/bake_assets.py)."""
+        base = os.path.join(os.path.dirname(__file__), "Assets", "Sounds")
+        return {attr: baked_assets.sound(os.path.join(base, name)) for attr, name in self.SFX_FILES.items()}
+
+    def _generate_stars(self):
+        """Loader job: build the starfield.
+
+        Uses its own stream (cosmetic only) so that building it off the main
+        thread never races the fx stream.
+        """
+        rng = random.Random(f"{self.rng.seed}:stars")
+        gauss, randint, uniform, choice = rng.gauss, rng.randint, rng.uniform, rng.choice
+        half = WORLD_SIZE / 2
+        sigma = WORLD_SIZE / 5
+        shapes = ["dot", "diamond", "wide"]
+        return [
+            {
+                "x": min(half, max(-half, gauss(0, sigma))),
+                "y": min(half, max(-half, gauss(0, sigma))),
+                "r": randint(1, 4),
+                "blink": uniform(0, 1.0),
+                "blink_speed": uniform(0.8, 1.6),
+                "shape": choice(shapes),
+            }
+            for _ in range(STAR_COUNT)
+        ]
+
+    def finish_loading(self):
+        """Install the background loader's results (blocks until it is done)."""
+        if self.assets_ready:
+            return
+        results = self.loader.wait()
+        for attr, sound in results["sfx"].items():
+            setattr(audio, attr, sound)
+        audio.bind_sfx()
+        self._stars = results["stars"]
+        self.assets_ready = True
+        self.gc.freeze()
+
+    @property
+    def stars(self):
+        if self._stars is None:
+            self.finish_loading()
+        return self._stars
+
+    def reset_game(self, seed=None):
+        self._save_replay()
+        self.rng.reseed(seed if seed is not None else self.run_seed)
+        self.recorder = None
+        if self.record_replays:
+            self.recorder = ReplayRecorder(self.rng.seed, FPS, self.test_mode, self.w, self.h)
+        # Hand the previous run's entities back to their free lists
+        BULLET_POOL.release_many(getattr(self, "bullets", ()))
+        ENEMY_POOL.release_many(getattr(self, "enemies", ()))
+        XP_ORB_POOL.release_many(getattr(self, "orbs", ()))
+        if getattr(self, "orb_field", None) is not None:
+            self.orb_field.clear()
+        GAS_POOL.release_many(getattr(self, "gas_pickups", ()))
+        flush_pools()
         self.player = Player(0, 0)
-        self.upgrade_manager = UpgradeManager(self.player)
+        self.upgrade_manager = UpgradeManager(self.player, rng=self.rng)
         self.player.upgrade_manager = self.upgrade_manager  # Reference for combat checks
+        self.population = PopulationManager(self)
+        self.lod.reset()
+        # Recorded runs must replay exactly: keep sim-affecting quality knobs fixed
+        self.quality.lock_sim(self.record_replays)
         self.bullets = []
         self.enemies = []
-        self.orbs = []
+        self.orbs = []      # awake XP orbs; sleeping ones live in orb_field
+        self.orb_field = OrbField(self)
         self.gas_pickups = []
         self.evolution_pickups = []
         self.minions = []
-        self.enemy_bullets = []
+        self.enemy_bullets = EnemyProjectilePool()
         self.elapsed_time = 0.0
         self.spawn_timer = 0.0
         self.enemy_spawn_rate = ENEMY_SPAWN_RATE
@@ -353,11 +488,20 @@ class Game:
             self.test_power_queue = [u.id for u in tier3_list]
         else:
             self.test_power_queue.clear()
+        self.frame_stats.reset()
+        # The new run's long-lived state is in place: stop rescanning it (see game_gc)
+        self.gc.freeze()
 
     def run(self):
         running = True
+        sim_time = 0.0  # real time not yet simulated
+        pipeline = self.pipeline = SimPipeline(self) if self.pipelined else None
+        frame_start = time.perf_counter()
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            frame_time = min(self.clock.tick(RENDER_FPS) / 1000.0, MAX_FRAME_TIME)
+            self.quality.record(self.clock.get_rawtime())
+            if not self.assets_ready and self.loader.done:
+                self.finish_loading()
             for e in pygame.event.get():
                 if e.type == pygame.QUIT:
                     running = False
@@ -374,11 +518,56 @@ class Game:
                         self.state = STATE_HALT
                     elif self.state == STATE_HALT:
                         self.state = STATE_PLAYING
+                if e.type == pygame.KEYDOWN and e.key == pygame.K_F3:
+                    self.show_profiler = not self.show_profiler
                 self.handle_event(e)
             # If halted, skip updates so game world is frozen; still draw the last frame
-            if self.state != STATE_HALT:
-                self.update(dt)
-            self.draw()
+            steps = 0
+            if self.state == STATE_HALT:
+                sim_time = 0.0
+            else:
+                # Simulate in fixed SIM_DT ticks whatever the display rate is
+                sim_time += frame_time
+                while sim_time >= SIM_DT and steps < MAX_SIM_STEPS:
+                    sim_time -= SIM_DT
+                    steps += 1
+                if sim_time >= SIM_DT:
+                    # Too far behind: drop the backlog rather than spiral
+                    sim_time %= SIM_DT
+                self.render_alpha = sim_time / SIM_DT
+            self.sim_steps = steps
+            playing = self.state == STATE_PLAYING
+            if pipeline is not None:
+                # This frame's ticks run on the sim thread while the last frame is presented
+                pipeline.start(steps)
+                t_draw = time.perf_counter()
+                self.present_frame()
+                pipeline.wait()
+                self.draw_frame()
+                update_ms = pipeline.wait_ms
+                draw_ms = (time.perf_counter() - t_draw) * 1000.0 - update_ms
+            else:
+                t_update = time.perf_counter()
+                for _ in range(steps):
+                    self.update(SIM_DT)
+                t_draw = time.perf_counter()
+                self.draw()
+                update_ms = (t_draw - t_update) * 1000.0
+                draw_ms = (time.perf_counter() - t_draw) * 1000.0
+            audio.flush()
+            now = time.perf_counter()
+            if playing:
+                self.frame_stats.record((now - frame_start) * 1000.0, update_ms, draw_ms)
+            frame_start = now
+            if self.state == STATE_GAME_OVER and self.frame_stats.written is None and self.frame_stats.frame.n:
+                self._save_frame_report()
+            if self.startup.enabled and not self.startup.printed:
+                self.startup.first_frame()
+                if self.assets_ready:
+                    self.startup.print_report()
+        if pipeline is not None:
+            pipeline.close()
+        self._save_replay()
         pygame.quit()
         sys.exit()
 
@@ -496,11 +685,7 @@ class Game:
 
             if clicked == "start":
                 audio.play_sfx(audio.snd_menu_click)
-                self.reset_game()
-                if self.test_mode:
-                    self.roll_levelup()
-                else:
-                    self.state = STATE_PLAYING
+                self.start_run()
             elif clicked == "settings":
                 audio.play_sfx(audio.snd_menu_click)
                 self.state = STATE_SETTINGS
@@ -510,11 +695,7 @@ class Game:
         elif self.state == STATE_GAME_OVER:
             if self.btn_restart.is_clicked(e):
                 audio.play_sfx(audio.snd_menu_click)
-                self.reset_game()
-                if self.test_mode:
-                    self.roll_levelup()
-                else:
-                    self.state = STATE_PLAYING
+                self.start_run()
             elif self.btn_main_menu.is_clicked(e):
                 audio.play_sfx(audio.snd_menu_click)
                 self.state = STATE_MENU
@@ -533,17 +714,13 @@ class Game:
                     skip_rect = pygame.Rect(WIDTH // 2 - 80, y + h + 30, 160, 40)
                     if skip_rect.collidepoint(mx, my):
                         audio.play_sfx(audio.snd_menu_click)
-                        self.state = STATE_PLAYING
+                        self.skip_levelup()
                         return
                 
-                for i, uid in enumerate(self.levelup_options):
+                for i in range(len(self.levelup_options)):
                     rect = pygame.Rect(start_x + i * (w + gap), y, w, h)
                     if rect.collidepoint(mx, my):
-                        self.apply_levelup_choice(uid)
-                        if self.test_mode and self.test_power_queue:
-                            self.roll_levelup()
-                        else:
-                            self.state = STATE_PLAYING
+                        self.choose_levelup(i)
                         break
         elif self.state == STATE_EVOLUTION:
             if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
@@ -554,11 +731,10 @@ class Game:
                 total_w = 3 * w + 2 * gap
                 start_x = WIDTH // 2 - total_w // 2
                 y = HEIGHT // 2 - h // 2
-                for i, eid in enumerate(self.evolution_options):
+                for i in range(len(self.evolution_options)):
                     rect = pygame.Rect(start_x + i * (w + gap), y, w, h)
                     if rect.collidepoint(mx, my):
-                        apply_evolution(self.player, eid)
-                        self.state = STATE_PLAYING
+                        self.choose_evolution(i)
                         break
         elif self.state == STATE_SETTINGS:
             if self.btn_settings_back.is_clicked(e):
@@ -607,14 +783,11 @@ class Game:
                 test_rect = self._test_toggle_rect()
                 if test_rect.collidepoint(mx, my):
                     audio.play_sfx(audio.snd_menu_click)
-                    self.test_mode = not self.test_mode
-                    if self.test_mode:
-                        # In test mode, provide ALL upgrades from new tree system
-                        self.test_power_queue = list(UPGRADES_BY_ID.keys())
-                    else:
-                        self.test_power_queue.clear()
+                    self.set_test_mode(not self.test_mode)
         elif self.state == STATE_PLAYING:
             if e.type == pygame.KEYDOWN and e.key == pygame.K_r:
+                if self.recorder is not None:
+                    self.recorder.action(ACTION_RELOAD)
                 self.player.start_reload()
             if self.btn_pause.is_clicked(e):
                 audio.play_sfx(audio.snd_pause)
@@ -625,12 +798,8 @@ class Game:
                 audio.play_sfx(audio.snd_unpause)
                 self.state = STATE_PLAYING
             elif self.btn_pause_reset.is_clicked(e):
-                self.reset_game()
+                self.start_run()
                 audio.play_sfx(audio.snd_unpause)
-                if self.test_mode:
-                    self.roll_levelup()
-                else:
-                    self.state = STATE_PLAYING
             elif self.btn_pause_quit.is_clicked(e):
                 audio.play_sfx(audio.snd_unpause)
                 self.state = STATE_MENU
@@ -656,7 +825,10 @@ class Game:
         self._update_starfield(dt)
 
         if self.state == STATE_PLAYING:
+            self._store_prev_positions()
             self.update_playing(dt)
+            if self.state == STATE_DEAD_ANIM:
+                self._save_replay()
         elif self.state == STATE_DEAD_ANIM:
             self.death_timer -= dt
             self._update_death_fx(dt)
@@ -664,6 +836,60 @@ class Game:
                 self.state = STATE_GAME_OVER
 
         self._update_music(dt)
+        flush_pools()
+        self.gc.tick(self.state)
+
+    # ===== RENDER INTERPOLATION =====
+    def _store_prev_positions(self):
+        """Remember where moving entities start this tick, for interpolation."""
+        p = self.player
+        p.prev_x, p.prev_y = p.x, p.y
+        for group in (self.enemies, self.bullets, self.orbs):
+            for o in group:
+                o.prev_x = o.x
+                o.prev_y = o.y
+        self.enemy_bullets.store_prev()
+
+    def _apply_interpolation(self, alpha):
+        """Move drawables to where they were `alpha` of the way through the last tick.
+
+        Returns the saved sim positions for _restore_interpolation.
+        """
+        back = 1.0 - alpha
+        objs = []
+        dicts = []
+        p = self.player
+        objs.append((p, p.x, p.y))
+        ox = (p.prev_x - p.x) * back
+        oy = (p.prev_y - p.y) * back
+        p.x += ox
+        p.y += oy
+        for group in (self.enemies, self.bullets, self.orbs):
+            for o in group:
+                x, y = o.x, o.y
+                objs.append((o, x, y))
+                o.x = x + (o.prev_x - x) * back
+                o.y = y + (o.prev_y - y) * back
+        enemy_bullets = self.enemy_bullets.interpolate(back)
+        # Orbiters are placed around the player every tick; carry them with it
+        for group in (p.aura_orbs, self.minions, self.drones, self.magic_lenses,
+                      self.magic_shields, self.magic_scythes, self.magic_spears):
+            for d in group:
+                if "x" in d and "y" in d:
+                    dicts.append((d, d["x"], d["y"]))
+                    d["x"] += ox
+                    d["y"] += oy
+        return objs, dicts, enemy_bullets
+
+    def _restore_interpolation(self, saved):
+        objs, dicts, enemy_bullets = saved
+        self.enemy_bullets.restore(enemy_bullets)
+        for o, x, y in objs:
+            o.x = x
+            o.y = y
+        for d, x, y in dicts:
+            d["x"] = x
+            d["y"] = y
 
     def _update_death_fx(self, dt):
         for fx in list(self.death_fx):
@@ -674,21 +900,27 @@ class Game:
                 self.death_fx.remove(fx)
 
     def _update_starfield(self, dt):
+        # The menu doesn't wait for the background loader; gameplay does (via self.stars)
+        if not self.assets_ready and self.state != STATE_PLAYING:
+            return
         # decay active flashes
         for f in list(self.star_flashes):
             f["life"] -= dt
             if f["life"] <= 0:
                 self.star_flashes.remove(f)
 
+        # Only the first star_count stars are live at lower quality
+        n_stars = min(len(self.stars), self.quality.star_count)
+
         # spawn new flash occasionally
-        if random.random() < 0.12 and self.stars:
-            star = random.choice(self.stars)
-            radius = random.randint(2, 4)
-            life = random.uniform(0.25, 0.65)
+        if self.rng.fx.random() < 0.12 and n_stars:
+            star = self.stars[self.rng.fx.randrange(n_stars)]
+            radius = self.rng.fx.randint(2, 4)
+            life = self.rng.fx.uniform(0.25, 0.65)
             self.star_flashes.append({"x": star["x"], "y": star["y"], "r": radius, "life": life, "life_max": life})
 
         # star blink progress
-        for s in self.stars:
+        for s in islice(self.stars, n_stars):
             s["blink"] += dt * s["blink_speed"]
             if s["blink"] > 1:
                 s["blink"] -= 1
@@ -740,7 +972,9 @@ class Game:
 
     def update_playing(self, dt):
         self.elapsed_time += dt
-        keys = pygame.key.get_pressed()
+        keys, fire, self.aim_pos = self._poll_input()
+        if self.recorder is not None:
+            self.aim_pos = self.recorder.record_tick(self, keys, fire, self.aim_pos)
         self.player.update(dt, keys)
         
         # Update upgrade manager for timed effects
@@ -790,20 +1024,20 @@ class Game:
             self.boost_dir = (mdx, mdy)
 
             back_ang = math.atan2(mdy, mdx) + math.pi
-            for _ in range(12):
-                offset_ang = back_ang + random.uniform(-0.18, 0.18)
-                spd = random.uniform(28, 70)
-                size = random.uniform(self.player.radius * 0.5, self.player.radius * 0.9)
+            for _ in range(max(1, int(12 * self.quality.particle_mult))):
+                offset_ang = back_ang + self.rng.fx.uniform(-0.18, 0.18)
+                spd = self.rng.fx.uniform(28, 70)
+                size = self.rng.fx.uniform(self.player.radius * 0.5, self.player.radius * 0.9)
                 self.boost_particles.append({
                     "x": self.player.x - mdx * self.player.radius * 1.02,
                     "y": self.player.y - mdy * self.player.radius * 1.02,
                     "vx": math.cos(offset_ang) * spd,
                     "vy": math.sin(offset_ang) * spd,
-                    "life": random.uniform(0.05, 0.09),
+                    "life": self.rng.fx.uniform(0.05, 0.09),
                     "life_max": 0.09,
                     "color": (140, 240, 255),
-                    "rot": random.uniform(0, math.tau),
-                    "rot_speed": random.uniform(-9.0, 9.0),
+                    "rot": self.rng.fx.uniform(0, math.tau),
+                    "rot_speed": self.rng.fx.uniform(-9.0, 9.0),
                     "size": size,
                 })
 
@@ -835,8 +1069,8 @@ class Game:
         self._update_summons(dt)
 
         # shooting
-        if pygame.mouse.get_pressed()[0] and self.player.can_shoot():
-            mx, my = self._mouse_pos()
+        if fire and self.player.can_shoot():
+            mx, my = self.aim_pos
             # Adjust mouse position for zoom - screen center is player position
             center_x, center_y = self.w / 2, self.h / 2
             # Mouse offset from center, scaled by zoom
@@ -867,21 +1101,19 @@ class Game:
 
         if self.player.guided_shots and self.enemies:
             for b in self.bullets:
-                if getattr(b, "guidance_disabled", False):
+                if b.guidance_disabled:
                     continue
-                if not getattr(b, "target", None) or b.target not in self.enemies:
+                tgt = b.target[0] if b.target else None
+                if not tgt or tgt.uid != b.target[1] or tgt not in self.enemies:
                     if not self.enemies:
                         break
-                    b.target = min(self.enemies, key=lambda en: (en.x - b.x) ** 2 + (en.y - b.y) ** 2)
-                tgt = b.target
-                if not tgt or tgt not in self.enemies:
-                    b.target = None
-                    continue
+                    tgt = min(self.enemies, key=lambda en: (en.x - b.x) ** 2 + (en.y - b.y) ** 2)
+                    b.target = (tgt, tgt.uid)
                 dx = tgt.x - b.x
                 dy = tgt.y - b.y
                 l = math.hypot(dx, dy)
                 if l < 1.0:
-                    ang = random.uniform(0, math.tau)
+                    ang = self.rng.combat.uniform(0, math.tau)
                     dx, dy = math.cos(ang), math.sin(ang)
                     l = 1.0
                 base_speed = max(math.hypot(b.vx, b.vy), self.player.bullet_speed)
@@ -905,11 +1137,17 @@ class Game:
         for b in self.bullets:
             b.update(dt)
             # Initialize bounce properties if needed
-            bounce_count = getattr(self.player, "bounce_count", 0)
-            if bounce_count > 0 and getattr(b, "bounces_left", None) is None:
+            bounce_count = self.player.stats.bounce_count
+            if bounce_count > 0 and b.bounced_enemies is None:
                 b.bounces_left = bounce_count
-                b.bounced_enemies = set()  # Track which enemies we bounced off
-        self.bullets = [b for b in self.bullets if not b.offscreen(cam) or getattr(b, "bounces_left", 0) > 0]
+                b.bounced_enemies = set()  # Uids of the enemies we bounced off
+        live_bullets = []
+        for b in self.bullets:
+            if not b.offscreen(cam) or b.bounces_left > 0:
+                live_bullets.append(b)
+            else:
+                BULLET_POOL.release(b)
+        self.bullets = live_bullets
 
         if self.boost_effect_timer > 0:
             self.boost_effect_timer = max(0.0, self.boost_effect_timer - dt)
@@ -923,46 +1161,51 @@ class Game:
             txt["y"] -= 20 * dt
             if txt["life"] <= 0:
                 self.damage_texts.remove(txt)
+        budget = self.quality.damage_text_budget
+        if len(self.damage_texts) > budget:
+            # Over the quality budget: the oldest numbers go first
+            del self.damage_texts[:len(self.damage_texts) - budget]
 
         # spawn progression: unlock variants over time
         self.spawn_timer += dt
         # scale spawn rate every 30s
         self.enemy_spawn_rate = ENEMY_SPAWN_RATE + 0.25 * int(self.elapsed_time // 30)
         interval = 1.0 / self.enemy_spawn_rate
+        spawn_count = 0
         while self.spawn_timer >= interval:
             self.spawn_timer -= interval
-            self.spawn_enemy()
-
-        for e in self.enemies:
-            e.update(dt, (self.player.x, self.player.y))
-        for o in self.orbs:
-            o.update(dt, self.player)
-
-        # enemy-enemy separation to prevent stacking
-        if len(self.enemies) > 1:
-            for _ in range(2):  # a couple of relaxation passes
-                for i in range(len(self.enemies)):
-                    ei = self.enemies[i]
-                    for j in range(i + 1, len(self.enemies)):
-                        ej = self.enemies[j]
+            spawn_count += 1
+        if spawn_count:
+            self.spawn_many(spawn_count)
+        self.population.update(dt)
+
+        self.lod.update_enemies(dt, view_half_w, view_half_h)
+        self.orb_field.update(dt)
+
+        # enemy-enemy separation to prevent stacking (on-screen tier only)
+        near = self.lod.near
+        if len(near) > 1:
+            for _ in range(self.quality.separation_passes):  # a couple of relaxation passes
+                for i in range(len(near)):
+                    ei = near[i]
+                    for j in range(i + 1, len(near)):
+                        ej = near[j]
                         dx = ej.x - ei.x
                         dy = ej.y - ei.y
                         dist = math.hypot(dx, dy)
                         min_dist = ei.radius + ej.radius
                         if dist < 1e-4:
-                            dx = random.uniform(-0.01, 0.01)
-                            dy = random.uniform(-0.01, 0.01)
+                            dx = self.rng.combat.uniform(-0.01, 0.01)
+                            dy = self.rng.combat.uniform(-0.01, 0.01)
                             dist = math.hypot(dx, dy) or 1.0
                         if dist < min_dist:
                             overlap = (min_dist - dist)
                             nx, ny = dx / dist, dy / dist
-                            # bosses resist being pushed; regulars share the shove
-                            wi = 0.5
-                            wj = 0.5
-                            if getattr(ei, "kind", "") == "boss" and getattr(ej, "kind", "") != "boss":
-                                wi, wj = 0.2, 0.8
-                            elif getattr(ej, "kind", "") == "boss" and getattr(ei, "kind", "") != "boss":
-                                wi, wj = 0.8, 0.2
+                            # heavier kinds (bosses) resist being pushed
+                            mi = KIND_TABLE[ei.kind_id].mass
+                            mj = KIND_TABLE[ej.kind_id].mass
+                            wi = mj / (mi + mj)
+                            wj = mi / (mi + mj)
                             push = overlap * 0.5
                             ei.x -= nx * push * wi
                             ei.y -= ny * push * wi
@@ -977,64 +1220,70 @@ class Game:
                 dy = en.y - self.player.y
                 if dx * dx + dy * dy <= rad_sq:
                     en.hp -= self.player.aura_dps * dt
-                    if random.random() < 0.15:
+                    if self.rng.fx.random() < 0.15 * self.quality.particle_mult:
                         self._emit_status_particle(en, "fire")
 
         self._apply_laser_damage(dt, cam)
 
         # ambient status particles while effects are active
-        for en in self.enemies:
-            if en.burn_timer > 0 and random.random() < 0.55:
+        fx_mult = self.quality.particle_mult
+        for en in self.lod.near:
+            if en.burn_timer > 0 and self.rng.fx.random() < 0.55 * fx_mult:
                 self._emit_status_particle(en, "fire")
-            if en.poison_timer > 0 and random.random() < 0.55:
+            if en.poison_timer > 0 and self.rng.fx.random() < 0.55 * fx_mult:
                 self._emit_status_particle(en, "poison")
-            if en.ice_timer > 0 and random.random() < 0.5:
+            if en.ice_timer > 0 and self.rng.fx.random() < 0.5 * fx_mult:
                 self._emit_status_particle(en, "ice")
 
         # DoT ticks with floating numbers and FX
         tick = 0.35
         for en in list(self.enemies):
+            # Off-screen enemies still take DoT damage but skip the numbers/FX
+            visible = en.lod_tier == LOD_NEAR
             if en.burn_timer > 0 and en.burn_dps > 0:
                 en.burn_tick += dt
                 while en.burn_tick >= tick:
                     en.burn_tick -= tick
                     dmg = en.burn_dps * tick
                     en.hp -= dmg
-                    self.damage_texts.append({"x": en.x + random.uniform(-4, 4), "y": en.y - 8, "val": max(1, int(dmg + 0.5)), "life": 0.5, "color": (255, 110, 80)})
-                    self._spawn_status_fx(en.x, en.y, kind="fire")
+                    if visible:
+                        self.damage_texts.append({"x": en.x + self.rng.fx.uniform(-4, 4), "y": en.y - 8, "val": max(1, int(dmg + 0.5)), "life": 0.5, "color": (255, 110, 80)})
+                        self._spawn_status_fx(en.x, en.y, kind="fire")
             if en.poison_timer > 0 and en.poison_dps > 0:
                 en.poison_tick += dt
                 while en.poison_tick >= tick:
                     en.poison_tick -= tick
                     dmg = en.poison_dps * tick
                     en.hp -= dmg
-                    self.damage_texts.append({"x": en.x + random.uniform(-4, 4), "y": en.y - 8, "val": max(1, int(dmg + 0.5)), "life": 0.5, "color": (140, 255, 160)})
-                    self._spawn_status_fx(en.x, en.y, kind="poison")
+                    if visible:
+                        self.damage_texts.append({"x": en.x + self.rng.fx.uniform(-4, 4), "y": en.y - 8, "val": max(1, int(dmg + 0.5)), "life": 0.5, "color": (140, 255, 160)})
+                        self._spawn_status_fx(en.x, en.y, kind="poison")
             if en.ice_timer > 0 and en.ice_dps > 0:
                 en.ice_tick += dt
                 while en.ice_tick >= tick:
                     en.ice_tick -= tick
                     dmg = en.ice_dps * tick
                     en.hp -= dmg
-                    self.damage_texts.append({"x": en.x + random.uniform(-4, 4), "y": en.y - 8, "val": max(1, int(dmg + 0.5)), "life": 0.5, "color": (170, 210, 255)})
-                    self._spawn_status_fx(en.x, en.y, kind="ice")
+                    if visible:
+                        self.damage_texts.append({"x": en.x + self.rng.fx.uniform(-4, 4), "y": en.y - 8, "val": max(1, int(dmg + 0.5)), "life": 0.5, "color": (170, 210, 255)})
+                        self._spawn_status_fx(en.x, en.y, kind="ice")
 
         # DoT deaths
         for en in list(self.enemies):
             if en.hp <= 0:
-                was_cursed = getattr(en, "curse_timer", 0) > 0
-                was_frozen = getattr(en, "ice_timer", 0) > 0
-                self.kills += 1
-                self.player.kills += 1
+                was_cursed = en.curse_timer > 0
+                was_frozen = en.ice_timer > 0
+                self.kills += en.reward
+                self.player.kills += en.reward
                 self.upgrade_manager.on_kill(enemy_was_cursed=was_cursed, enemy_was_frozen=was_frozen)
-                self.orbs.append(XPOrb(en.x, en.y, XP_PER_ORB))
+                self.orb_field.drop(en.x, en.y, XP_PER_ORB * en.reward)
                 
                 # Splinter on kill
                 if self.player.splinter_on_kill:
                     self._spawn_splinter_bullets(en.x, en.y)
                 
-                if random.random() < 0.05:
-                    self.gas_pickups.append(GasPickup(en.x, en.y))
+                if self.rng.loot.random() < 0.05:
+                    self.gas_pickups.append(GAS_POOL.acquire(en.x, en.y))
                 if self.player.burn_chain:
                     for other in self.enemies:
                         if other is en:
@@ -1044,83 +1293,65 @@ class Game:
                         if dx * dx + dy * dy <= 140 * 140:
                             other.burn_timer = max(other.burn_timer, 3.0)
                             other.burn_dps = max(other.burn_dps, self.player.damage * 0.2 * self.player.burn_bonus_mult)
-                if getattr(en, "kind", "") == "boss":
+                if en.kind_id == KIND_BOSS:
                     self._spawn_evolution_pickup(en.x, en.y)
                 self._spawn_enemy_pop(en.x, en.y)
                 self.enemies.remove(en)
+                ENEMY_POOL.release(en)
 
         # enemy shooting
         for en in self.enemies:
-            can_shoot = (getattr(en, "kind", "") in ("shooter", "elite_shooter")) or (getattr(en, "kind", "") == "boss" and getattr(en, "boss_stage", 0) >= 3)
-            if can_shoot:
-                if not hasattr(en, "shoot_cd"):
-                    en.shoot_cd = random.uniform(1.0, 2.4)
+            info = KIND_TABLE[en.kind_id]
+            if info.shooter or (info.boss and en.boss_stage >= 3):
+                if en.shoot_cd is None:
+                    en.shoot_cd = self.rng.combat.uniform(1.0, 2.4)
                 en.shoot_cd -= dt
                 if en.shoot_cd <= 0:
-                    en.shoot_cd = random.uniform(1.0, 2.0) if en.kind != "boss" else random.uniform(0.6, 1.2)
+                    is_boss = info.boss
+                    en.shoot_cd = self.rng.combat.uniform(1.0, 2.0) if not is_boss else self.rng.combat.uniform(0.6, 1.2)
                     dx = self.player.x - en.x
                     dy = self.player.y - en.y
                     l = math.hypot(dx, dy) or 1
-                    speed = 3.0 if en.kind != "boss" else 8.0  # Slower bullets
-                    self.enemy_bullets.append({"x": en.x, "y": en.y, "vx": dx / l * speed, "vy": dy / l * speed, "r": 10 if en.kind == "boss" else 8, "dmg": 1})  # Bigger bullets
+                    speed = 3.0 if not is_boss else 8.0  # Slower bullets
+                    self.enemy_bullets.spawn(en.x, en.y, dx / l * speed, dy / l * speed, 10 if is_boss else 8)  # Bigger bullets
 
-        # Summoner enemies spawn minions
+        # Summoner enemies spawn minions (capped by the population manager)
+        new_minions = []
         for en in self.enemies:
-            base_kind = getattr(en, "kind", "").replace("elite_", "")
-            if base_kind == "summoner":
-                if not hasattr(en, "summon_cd"):
-                    en.summon_cd = random.uniform(3.0, 5.0)
+            if KIND_TABLE[en.kind_id].summoner:
+                if en.summon_cd is None:
+                    en.summon_cd = self.rng.combat.uniform(3.0, 5.0)
                 en.summon_cd -= dt
                 if en.summon_cd <= 0:
-                    en.summon_cd = random.uniform(3.0, 5.0)
+                    en.summon_cd = self.rng.combat.uniform(3.0, 5.0)
                     # Spawn 2-3 minions around this enemy
-                    minion_count = random.randint(2, 3)
+                    minion_count = self.rng.spawn.randint(2, 3)
                     for _ in range(minion_count):
-                        ang = random.uniform(0, math.tau)
+                        if not self.population.allow_minion():
+                            break
+                        ang = self.rng.spawn.uniform(0, math.tau)
                         mx = en.x + math.cos(ang) * 40
                         my = en.y + math.sin(ang) * 40
-                        self.spawning_manager.spawn_minion(mx, my)
-
-        # enemy bullets update/collisions
-        for eb in list(self.enemy_bullets):
-            eb["x"] += eb["vx"] * dt * FPS
-            eb["y"] += eb["vy"] * dt * FPS
-            
-            # Check orbiting shield blocking
-            blocked = False
-            for shield in self.magic_shields:
-                shield_x = shield.get("x", self.player.x)
-                shield_y = shield.get("y", self.player.y)
-                dist = math.hypot(eb["x"] - shield_x, eb["y"] - shield_y)
-                
-                if dist < 25:  # Shield hit radius
-                    # Shield blocks the bullet
-                    blocked = True
-                    if eb in self.enemy_bullets:
-                        self.enemy_bullets.remove(eb)
-                    # Reflect if player has reflect upgrade
-                    if getattr(self.player, "shield_reflect", False):
-                        # Reflect bullet back
-                        eb["vx"] = -eb["vx"] * 1.5
-                        eb["vy"] = -eb["vy"] * 1.5
-                    break
-            if blocked:
-                continue
-            
-            if circle_collision(self.player.x, self.player.y, self.player.radius, eb["x"], eb["y"], eb["r"]):
-                if self.player.invuln <= 0:
-                    self.player.take_damage(1)
-                    self.player.hit_flash = 0.2
-                if eb in self.enemy_bullets:
-                    self.enemy_bullets.remove(eb)
-                continue
-            if abs(eb["x"] - self.player.x) > 2000 or abs(eb["y"] - self.player.y) > 2000:
-                self.enemy_bullets.remove(eb)
+                        new_minions.append(ENEMY_POOL.acquire(mx, my, int(ENEMY_BASE_HP * 0.3), ENEMY_BASE_SPEED * 1.2, "minion"))
+        self.enemies.extend(new_minions)
+
+        # enemy bullets: integration, shield blocks, player hits and range culling in one pass
+        player = self.player
+        shields = [(sh.get("x", player.x), sh.get("y", player.y)) for sh in self.magic_shields]
+        hits, reflected = self.enemy_bullets.step(
+            dt, player.x, player.y, player.radius, shields, 25, 2000, reflect=player.stats.shield_reflect)
+        for _ in range(hits):
+            if player.invuln <= 0:
+                player.take_damage(1)
+                player.hit_flash = 0.2
+        # Reflective shield: blocked shots fly back as player bullets
+        for x, y, vx, vy in reflected:
+            self.bullets.append(BULLET_POOL.acquire(x, y, vx, vy, int(player.damage), math.hypot(vx, vy)))
 
         # bullet-enemy
         for b in list(self.bullets):
             for en in list(self.enemies):
-                if en.hit_sources.get(getattr(b, "uid", None), 0.0) > 0:
+                if en.hit_sources.get(b.uid, 0.0) > 0:
                     continue
                 if circle_collision(b.x, b.y, b.radius, en.x, en.y, en.radius):
                     if hasattr(b, "uid"):
@@ -1135,11 +1366,11 @@ class Game:
                     dy = en.y - b.y
                     l = math.hypot(dx, dy) or 1
                     push = 12
-                    if getattr(en, "kind", "") == "boss":
+                    if en.kind_id == KIND_BOSS:
                         push *= 0.25
                     en.x += dx / l * push
                     en.y += dy / l * push
-                    if getattr(en, "kind", "") != "boss":
+                    if en.kind_id != KIND_BOSS:
                         en.knockback_pause = 0.2
                         en.knockback_slow = 0.2
                     # status bonus damage
@@ -1156,7 +1387,7 @@ class Game:
                             extra_damage += int(b.damage * 0.2 * self.player.poison_bonus_mult)
                     if extra_damage > 0:
                         en.hp -= extra_damage
-                    self.damage_texts.append({"x": en.x + random.uniform(-6, 6), "y": en.y - 10, "val": b.damage + extra_damage, "life": 0.6, "color": status_color})
+                    self.damage_texts.append({"x": en.x + self.rng.fx.uniform(-6, 6), "y": en.y - 10, "val": b.damage + extra_damage, "life": 0.6, "color": status_color})
                     # apply status effects
                     if b.status.get("ice"):
                         en.ice_timer = max(en.ice_timer, 2.0)
@@ -1181,29 +1412,29 @@ class Game:
                     killed = en.hp <= 0
                     
                     # Bullet bouncing off enemies
-                    bounces_left = getattr(b, "bounces_left", 0)
-                    bounced_enemies = getattr(b, "bounced_enemies", set())
+                    bounces_left = b.bounces_left
+                    bounced_enemies = b.bounced_enemies or set()
                     
                     should_remove_bullet = True
-                    if bounces_left > 0 and id(en) not in bounced_enemies:
+                    if bounces_left > 0 and en.uid not in bounced_enemies:
                         # Bounce to next enemy
-                        bounced_enemies.add(id(en))
+                        bounced_enemies.add(en.uid)
                         b.bounced_enemies = bounced_enemies
                         b.bounces_left -= 1
                         
                         # Apply bounce damage bonus
-                        bonus = getattr(self.player, "bounce_damage_bonus", 0)
+                        bonus = self.player.stats.bounce_damage_bonus
                         if bonus > 0:
                             b.damage = int(b.damage * (1 + bonus))
                         
                         # Find next target to bounce to
-                        other_enemies = [e for e in self.enemies if id(e) not in bounced_enemies and e.hp > 0]
+                        other_enemies = [e for e in self.enemies if e.uid not in bounced_enemies and e.hp > 0]
                         if other_enemies:
                             # Bounce homing - seek nearest enemy
-                            if getattr(self.player, "bounce_homing", False):
+                            if self.player.stats.bounce_homing:
                                 closest = min(other_enemies, key=lambda e: (e.x - b.x) ** 2 + (e.y - b.y) ** 2)
                             else:
-                                closest = random.choice(other_enemies)
+                                closest = self.rng.combat.choice(other_enemies)
                             ddx = closest.x - b.x
                             ddy = closest.y - b.y
                             dist = max(1, math.hypot(ddx, ddy))
@@ -1219,34 +1450,38 @@ class Game:
                                     b.pierce_left -= 1
                                     if b.pierce_left < 0 and b in self.bullets:
                                         self.bullets.remove(b)
+                                        BULLET_POOL.release(b)
                                 else:
                                     if b in self.bullets:
                                         self.bullets.remove(b)
+                                        BULLET_POOL.release(b)
                             else:
                                 if b.pierce_left > 0:
                                     b.pierce_left -= 1
                                 else:
                                     if b in self.bullets:
                                         self.bullets.remove(b)
+                                        BULLET_POOL.release(b)
                         else:
                             if b in self.bullets:
                                 self.bullets.remove(b)
+                                BULLET_POOL.release(b)
 
                     if en.hp <= 0:
-                        was_cursed = getattr(en, "curse_timer", 0) > 0
-                        was_frozen = getattr(en, "ice_timer", 0) > 0
-                        self.kills += 1
-                        self.player.kills += 1
+                        was_cursed = en.curse_timer > 0
+                        was_frozen = en.ice_timer > 0
+                        self.kills += en.reward
+                        self.player.kills += en.reward
                         self.upgrade_manager.on_kill(enemy_was_cursed=was_cursed, enemy_was_frozen=was_frozen)
-                        self.orbs.append(XPOrb(en.x, en.y, XP_PER_ORB))
+                        self.orb_field.drop(en.x, en.y, XP_PER_ORB * en.reward)
                         
                         # Splinter on kill - spawn bullets from dead enemy
                         if self.player.splinter_on_kill:
                             self._spawn_splinter_bullets(en.x, en.y)
                         
                         # chance to drop gas
-                        if random.random() < 0.05:
-                            self.gas_pickups.append(GasPickup(en.x, en.y))
+                        if self.rng.loot.random() < 0.05:
+                            self.gas_pickups.append(GAS_POOL.acquire(en.x, en.y))
                         if self.player.burn_chain:
                             for other in self.enemies:
                                 if other is en:
@@ -1256,11 +1491,12 @@ class Game:
                                 if dx * dx + dy * dy <= 140 * 140:
                                     other.burn_timer = max(other.burn_timer, 3.0)
                                     other.burn_dps = max(other.burn_dps, self.player.damage * 0.2 * self.player.burn_bonus_mult)
-                        if getattr(en, "kind", "") == "boss":
+                        if en.kind_id == KIND_BOSS:
                             self._spawn_evolution_pickup(en.x, en.y)
                             audio.play_sfx(audio.snd_boss_explosion)
                         self._spawn_enemy_pop(en.x, en.y)
                         self.enemies.remove(en)
+                        ENEMY_POOL.release(en)
                         audio.play_sfx(audio.snd_enemy_death)
                     break
 
@@ -1294,16 +1530,16 @@ class Game:
                         return
 
         # player-xp (add pickup sfx)
-        for o in list(self.orbs):
-            if circle_collision(self.player.x, self.player.y, self.player.radius, o.x, o.y, o.radius):
-                leveled = self.player.add_xp(o.xp)
-                self.orbs.remove(o)
-                self.upgrade_manager.on_xp_pickup()
-                if leveled:
-                    # level-up gating
-                    if self.player.level_ups_since_reward == POWERUP_FIRST or self.player.level_ups_since_reward >= POWERUP_INTERVAL:
-                        self.player.level_ups_since_reward = 0
-                        self.roll_levelup()
+        # All orbs touched this frame are banked in one add_xp call
+        xp, picked = self.orb_field.collect()
+        if picked:
+            leveled = self.player.add_xp(xp)
+            self.upgrade_manager.on_xp_pickup()
+            if leveled:
+                # level-up gating
+                if self.player.level_ups_since_reward == POWERUP_FIRST or self.player.level_ups_since_reward >= POWERUP_INTERVAL:
+                    self.player.level_ups_since_reward = 0
+                    self.roll_levelup()
 
         # gas pickup collision
         for g in list(self.gas_pickups):
@@ -1312,6 +1548,7 @@ class Game:
                 self.boost_effect_timer = max(self.boost_effect_timer, g.duration)
                 audio.play_sfx(audio.snd_pickup_boost)
                 self.gas_pickups.remove(g)
+                GAS_POOL.release(g)
 
         # evolution pickup collision
         for ev in list(self.evolution_pickups):
@@ -1323,9 +1560,9 @@ class Game:
     def _spawn_death_fx(self, x, y):
         self.death_fx.clear()
         for _ in range(140):
-            ang = random.uniform(0, math.tau)
-            spd = random.uniform(35, 110)
-            life_max = random.uniform(1.6, 2.4)
+            ang = self.rng.fx.uniform(0, math.tau)
+            spd = self.rng.fx.uniform(35, 110)
+            life_max = self.rng.fx.uniform(1.6, 2.4)
             self.death_fx.append({
                 "x": x,
                 "y": y,
@@ -1333,7 +1570,7 @@ class Game:
                 "vy": math.sin(ang) * spd,
                 "life": life_max,
                 "life_max": life_max,
-                "r_base": random.uniform(10, 22),
+                "r_base": self.rng.fx.uniform(10, 22),
             })
 
     def _spawn_evolution_pickup(self, x, y):
@@ -1357,51 +1594,51 @@ class Game:
             size_range = (2.0, 3.4)
             life_range = (0.26, 0.38)
 
-        count = 8
+        count = max(1, int(8 * self.quality.particle_mult))
         for _ in range(count):
-            ang = random.uniform(0, math.tau)
-            r = random.uniform(0, radius * 0.6)
+            ang = self.rng.fx.uniform(0, math.tau)
+            r = self.rng.fx.uniform(0, radius * 0.6)
             base_x = x + math.cos(ang) * r
             base_y = y + math.sin(ang) * r
-            vx = random.uniform(-6, 6)
-            vy = random.uniform(*vy_range)
+            vx = self.rng.fx.uniform(-6, 6)
+            vy = self.rng.fx.uniform(*vy_range)
             self.status_particles.append({
                 "x": base_x,
                 "y": base_y,
                 "vx": vx,
                 "vy": vy,
                 "life": 0.0,
-                "life_max": random.uniform(*life_range),
+                "life_max": self.rng.fx.uniform(*life_range),
                 "color": color,
                 "kind": kind,
-                "size": random.uniform(*size_range),
+                "size": self.rng.fx.uniform(*size_range),
             })
 
     def _emit_status_particle(self, en, kind: str):
-        rad = getattr(en, "radius", 10)
-        ang = random.uniform(0, math.tau)
-        r = random.uniform(0, rad * 0.7)
+        rad = en.radius
+        ang = self.rng.fx.uniform(0, math.tau)
+        r = self.rng.fx.uniform(0, rad * 0.7)
         px = en.x + math.cos(ang) * r
         py = en.y + math.sin(ang) * r
 
         if kind == "fire":
             color = (255, 110, 80)
-            vx = random.uniform(-4, 4)
-            vy = random.uniform(-7, -3)
-            size = random.uniform(1.6, 2.4)
-            life_max = random.uniform(0.18, 0.26)
+            vx = self.rng.fx.uniform(-4, 4)
+            vy = self.rng.fx.uniform(-7, -3)
+            size = self.rng.fx.uniform(1.6, 2.4)
+            life_max = self.rng.fx.uniform(0.18, 0.26)
         elif kind == "ice":
             color = (170, 210, 255)
-            vx = random.uniform(-3, 3)
-            vy = random.uniform(-3, 3)
-            size = random.uniform(1.5, 2.4)
-            life_max = random.uniform(0.18, 0.26)
+            vx = self.rng.fx.uniform(-3, 3)
+            vy = self.rng.fx.uniform(-3, 3)
+            size = self.rng.fx.uniform(1.5, 2.4)
+            life_max = self.rng.fx.uniform(0.18, 0.26)
         else:  # poison
             color = (140, 255, 160)
-            vx = random.uniform(-3, 3)
-            vy = random.uniform(3, 7)
-            size = random.uniform(1.6, 2.4)
-            life_max = random.uniform(0.18, 0.26)
+            vx = self.rng.fx.uniform(-3, 3)
+            vy = self.rng.fx.uniform(3, 7)
+            size = self.rng.fx.uniform(1.6, 2.4)
+            life_max = self.rng.fx.uniform(0.18, 0.26)
 
         self.status_particles.append({
             "x": px,
@@ -1417,13 +1654,13 @@ class Game:
 
     def _spawn_enemy_pop(self, x, y):
         # gentle, tiny pop on enemy death
-        count = 24
+        count = max(1, int(24 * self.quality.particle_mult))
         for _ in range(count):
-            ang = random.uniform(0, math.tau)
-            spd = random.uniform(3, 5)
-            dist = random.uniform(10, 15)
-            size = random.uniform(2.5, 5.0)
-            life_max = random.uniform(0.35, 0.65)
+            ang = self.rng.fx.uniform(0, math.tau)
+            spd = self.rng.fx.uniform(3, 5)
+            dist = self.rng.fx.uniform(10, 15)
+            size = self.rng.fx.uniform(2.5, 5.0)
+            life_max = self.rng.fx.uniform(0.35, 0.65)
             self.status_particles.append({
                 "x": x + math.cos(ang) * dist,
                 "y": y + math.sin(ang) * dist,
@@ -1441,7 +1678,7 @@ class Game:
             self.laser_segment = None
             return
 
-        mx, my = self._mouse_pos()
+        mx, my = self.aim_pos
         # When the world is zoomed, the render surface is scaled to the screen.
         # Convert screen mouse coords to world coords by dividing by the current zoom.
         zoom = clamp(self.view_zoom, 0.7, 1.1)
@@ -1489,7 +1726,7 @@ class Game:
     def _update_minions(self, dt):
         # maintain desired minion count
         while len(self.minions) < self.player.minion_count:
-            self.minions.append({"angle": random.uniform(0, math.tau), "cd": random.uniform(0.2, 0.8)})
+            self.minions.append({"angle": self.rng.combat.uniform(0, math.tau), "cd": self.rng.combat.uniform(0.2, 0.8)})
         if len(self.minions) > self.player.minion_count:
             self.minions = self.minions[: self.player.minion_count]
 
@@ -1507,7 +1744,7 @@ class Game:
             if target and m["cd"] <= 0:
                 dx = target.x - m["x"]
                 dy = target.y - m["y"]
-                b = Bullet(m["x"], m["y"], dx, dy, int(self.player.damage * 0.6 * self.player.minion_damage_mult), self.player.bullet_speed * 0.9, status=self.player.bullet_status.copy())
+                b = BULLET_POOL.acquire(m["x"], m["y"], dx, dy, int(self.player.damage * 0.6 * self.player.minion_damage_mult), self.player.bullet_speed * 0.9, status=self.player.bullet_status)
                 b.piercing = False
                 self.bullets.append(b)
                 m["cd"] = 0.9
@@ -1547,7 +1784,7 @@ class Game:
                     en.flash_timer = 0.1
                     en.aura_iframes = 0.25
                     en.hit_sources[orb.get("uid")] = 0.2
-                    if getattr(en, "kind", "") != "boss":
+                    if en.kind_id != KIND_BOSS:
                         en.knockback_pause = 0.2
                         en.knockback_slow = 0.2
                     # knockback away from the player position
@@ -1555,7 +1792,7 @@ class Game:
                     ky = en.y - self.player.y
                     kl = math.hypot(kx, ky) or 1.0
                     push = self.player.aura_orb_knockback
-                    if getattr(en, "kind", "") == "boss":
+                    if en.kind_id == KIND_BOSS:
                         push *= 0.2
                     en.x += kx / kl * push
                     en.y += ky / kl * push
@@ -1604,7 +1841,7 @@ class Game:
     
     def _update_free_ghosts(self, dt):
         """Update ghost summons - chase and damage enemies on touch."""
-        target_count = getattr(self.player, "ghost_count", 0)
+        target_count = self.player.stats.ghost_count
         
         # Add ghosts with proper tracking data
         while len(self.ghosts) < target_count:
@@ -1614,7 +1851,7 @@ class Game:
                 "vx": 0,
                 "vy": 0,
                 "target": None,
-                "hit_cooldowns": {}  # Per-enemy cooldowns: {enemy_id: cooldown_time}
+                "hit_cooldowns": {}  # Per-enemy cooldowns: {enemy uid: cooldown_time}
             })
         # Remove extra ghosts
         if len(self.ghosts) > target_count:
@@ -1629,14 +1866,14 @@ class Game:
         touch_radius = 20  # Collision radius
         hit_cooldown = 1.0  # 1 second cooldown per enemy
         
-        base_dmg = getattr(self.player, "drone_damage", 0)
+        base_dmg = self.player.stats.drone_damage
         if base_dmg <= 0:
-            base_dmg = getattr(self.player, "ghost_damage", 0)
+            base_dmg = self.player.stats.ghost_damage
         if base_dmg <= 0:
             base_dmg = int(self.player.damage * 0.4)
-        ghost_damage = int(base_dmg * getattr(self.player, "summon_damage_mult", 1.0))
-        ghost_burn = getattr(self.player, "drone_burn", False) or getattr(self.player, "ghost_burn", False)
-        ghost_poison = getattr(self.player, "drone_poison", False)
+        ghost_damage = int(base_dmg * self.player.stats.summon_damage_mult)
+        ghost_burn = self.player.stats.drone_burn or self.player.stats.ghost_burn
+        ghost_poison = self.player.stats.drone_poison
         
         for g in self.ghosts:
             # Update per-enemy cooldowns
@@ -1651,7 +1888,7 @@ class Game:
             available_enemies = [
                 e for e in self.enemies 
                 if math.hypot(e.x - self.player.x, e.y - self.player.y) < vision_range
-                and id(e) not in cooldowns
+                and e.uid not in cooldowns
                 and e.hp > 0
             ]
             
@@ -1689,7 +1926,7 @@ class Game:
                         target.poison_dps = max(target.poison_dps, ghost_damage * 0.15)
                     
                     # Set cooldown for this enemy
-                    g["hit_cooldowns"][id(target)] = hit_cooldown
+                    g["hit_cooldowns"][target.uid] = hit_cooldown
             else:
                 # No target - orbit around player
                 dist_to_player = math.hypot(g["x"] - self.player.x, g["y"] - self.player.y)
@@ -1717,13 +1954,13 @@ class Game:
         if not hasattr(self, "phantoms"):
             self.phantoms = []
         
-        target_count = getattr(self.player, "phantom_count", 0)
+        target_count = self.player.stats.phantom_count
         
         # Add phantoms
         while len(self.phantoms) < target_count:
             self.phantoms.append({
-                "x": self.player.x + random.uniform(-50, 50),
-                "y": self.player.y + random.uniform(-50, 50),
+                "x": self.player.x + self.rng.combat.uniform(-50, 50),
+                "y": self.player.y + self.rng.combat.uniform(-50, 50),
                 "vx": 0,
                 "vy": 0,
                 "cd": 0,
@@ -1736,10 +1973,10 @@ class Game:
         if not self.phantoms:
             return
         
-        phantom_speed = 200 * getattr(self.player, "phantom_speed", 1.0)
-        phantom_damage = getattr(self.player, "phantom_damage", 15) * getattr(self.player, "summon_damage_mult", 1.0)
-        phantom_slow = getattr(self.player, "phantom_slow", False)
-        phantom_lifesteal = getattr(self.player, "phantom_lifesteal", False)
+        phantom_speed = 200 * self.player.stats.phantom_speed
+        phantom_damage = self.player.stats.phantom_damage * self.player.stats.summon_damage_mult
+        phantom_slow = self.player.stats.phantom_slow
+        phantom_lifesteal = self.player.stats.phantom_lifesteal
         vision_range = 400  # How far phantom can see enemies
         
         for p in self.phantoms:
@@ -1820,7 +2057,7 @@ class Game:
 
     def _update_orbit_drones(self, dt):
         """Update orbiting drone summons - circle around player and shoot enemies."""
-        target_count = getattr(self.player, "drone_count", 0)
+        target_count = self.player.stats.drone_count
         
         # Add drones with proper spacing
         while len(self.drones) < target_count:
@@ -1829,7 +2066,7 @@ class Game:
             self.drones.append({
                 "index": index,
                 "angle": base_angle,
-                "cd": random.uniform(0.3, 0.8),
+                "cd": self.rng.combat.uniform(0.3, 0.8),
                 "x": self.player.x,
                 "y": self.player.y
             })
@@ -1852,7 +2089,7 @@ class Game:
                 target = min(visible_enemies, key=lambda en: (en.x - self.player.x) ** 2 + (en.y - self.player.y) ** 2)
         
         orbit_r = 80  # Orbit radius around player
-        drone_damage = int(self.player.damage * 0.3 * getattr(self.player, "summon_damage_mult", 1.0))
+        drone_damage = int(self.player.damage * 0.3 * self.player.stats.summon_damage_mult)
         
         for d in self.drones:
             # Keep even spacing - rotate together
@@ -1871,13 +2108,13 @@ class Game:
                 angle = math.atan2(dy, dx)
                 bdx = math.cos(angle)
                 bdy = math.sin(angle)
-                b = Bullet(d["x"], d["y"], bdx, bdy, drone_damage, self.player.bullet_speed * 0.7)
+                b = BULLET_POOL.acquire(d["x"], d["y"], bdx, bdy, drone_damage, self.player.bullet_speed * 0.7)
                 self.bullets.append(b)
-                d["cd"] = 0.8 / getattr(self.player, "summon_attack_speed_mult", 1.0)
+                d["cd"] = 0.8 / self.player.stats.summon_attack_speed_mult
 
     def _update_dragon(self, dt):
         """Update dragon companion - free movement that follows player and chases enemies."""
-        if not getattr(self.player, "dragon_active", False):
+        if not self.player.stats.dragon_active:
             self.dragon = None
             return
         
@@ -1939,7 +2176,7 @@ class Game:
         
         # Attack if close to enemy
         if d["cd"] <= 0 and target_enemy and dist_to_enemy < 300:
-            dragon_damage = getattr(self.player, "dragon_damage", 20) * getattr(self.player, "summon_damage_mult", 1.0)
+            dragon_damage = self.player.stats.dragon_damage * self.player.stats.summon_damage_mult
             # Dragon breathes fire - apply burn
             target_enemy.hp -= dragon_damage
             target_enemy.burn_timer = max(target_enemy.burn_timer, 3.0)
@@ -1949,7 +2186,7 @@ class Game:
             self._spawn_status_fx(target_enemy.x, target_enemy.y, kind="fire")
             # Store fire breath target for visual
             d["fire_target"] = {"x": target_enemy.x, "y": target_enemy.y, "timer": 0.3}
-            d["cd"] = 1.0 / getattr(self.player, "dragon_attack_speed", 1.0)
+            d["cd"] = 1.0 / self.player.stats.dragon_attack_speed
         
         # Update fire breath visual timer
         if "fire_target" in d:
@@ -1959,7 +2196,7 @@ class Game:
 
     def _update_magic_lenses(self, dt):
         """Update magic lens summons - orbit and multiply bullets passing through."""
-        target_count = getattr(self.player, "lens_count", 0)
+        target_count = self.player.stats.lens_count
         
         # Initialize lenses with proper spacing
         while len(self.magic_lenses) < target_count:
@@ -1993,41 +2230,54 @@ class Game:
             lens["x"] = self.player.x + math.cos(angle) * orbit_r
             lens["y"] = self.player.y + math.sin(angle) * orbit_r
         
-        # Check for bullets passing through lenses
+        # Check for bullets passing through lenses. Lenses sit on a ring around
+        # the player, so only bullets on that ring (a box test, then the
+        # distance from the player) can be inside one; just those get a
+        # distance test per lens. Freshly fired bullets inside the ring skip it.
+        px, py = self.player.x, self.player.y
+        reach = orbit_r + lens_radius
+        x0, x1, y0, y1 = px - reach, px + reach, py - reach, py + reach
+        ring_in2 = (orbit_r - lens_radius) ** 2
+        ring_out2 = reach * reach
+        candidates = [b for b in self.bullets
+                      if x0 < b.x < x1 and y0 < b.y < y1 and not b.passed_through_lens
+                      and ring_in2 <= (b.x - px) ** 2 + (b.y - py) ** 2 <= ring_out2]
+        if not candidates:
+            return
+        lens_pos = [(lens["x"], lens["y"]) for lens in self.magic_lenses]
+        lens_r2 = lens_radius * lens_radius
+        # Enlarge bullet if player has lens_enlarge upgrade (capped for size control)
+        lens_enlarge = min(self.player.stats.lens_enlarge, 1.18)
+        # Above the bullet budget a duplicate is folded into its parent as double damage
+        room = BULLET_BUDGET - len(self.bullets)
         new_bullets = []
-        for b in self.bullets:
-            if getattr(b, "passed_through_lens", False):
-                continue  # Already multiplied
-            
-            for lens in self.magic_lenses:
-                dx = b.x - lens["x"]
-                dy = b.y - lens["y"]
-                dist = math.hypot(dx, dy)
-                
-                if dist < lens_radius:
+        for b in candidates:
+            for lx, ly in lens_pos:
+                dx = b.x - lx
+                dy = b.y - ly
+                if dx * dx + dy * dy < lens_r2:
                     # Bullet passes through lens - always multiply by 2 (one extra bullet)
                     b.passed_through_lens = True
-                    
-                    # Enlarge bullet if player has lens_enlarge upgrade (capped for size control)
-                    lens_enlarge = min(getattr(self.player, "lens_enlarge", 1.0), 1.18)
                     if lens_enlarge > 1.0:
                         b.radius = max(1, int(b.radius * lens_enlarge))
-                    
+                    if len(new_bullets) >= room:
+                        b.damage *= 2
+                        break
+
                     # Create ONE additional bullet with slight spread
                     spread_offset = 0.08
                     bullet_angle = math.atan2(b.vy, b.vx) + spread_offset
                     speed = math.hypot(b.vx, b.vy)
-                    new_b = Bullet(
+                    new_b = BULLET_POOL.acquire(
                         b.x, b.y,
                         math.cos(bullet_angle), math.sin(bullet_angle),
                         b.damage, speed,
-                        status=b.status.copy() if hasattr(b, "status") else {}
+                        status=b.status
                     )
                     new_b.radius = max(1, int(b.radius * lens_enlarge)) if lens_enlarge > 1.0 else b.radius
                     new_b.piercing = b.piercing
                     new_b.passed_through_lens = True
-                    if hasattr(b, "pierce_left"):
-                        new_b.pierce_left = b.pierce_left
+                    new_b.pierce_left = b.pierce_left
                     new_bullets.append(new_b)
                     break
         
@@ -2035,12 +2285,12 @@ class Game:
 
     def _update_magic_shields(self, dt):
         """Update orbiting shield summons."""
-        shield_hp = getattr(self.player, "shield_hp", 0)
+        shield_hp = self.player.shield_hp
         if shield_hp <= 0:
             self.magic_shields = []
             return
         
-        shield_count = getattr(self.player, "shield_segments", 1)
+        shield_count = self.player.stats.shield_segments
         
         # Initialize shields with proper spacing
         while len(self.magic_shields) < shield_count:
@@ -2071,7 +2321,7 @@ class Game:
 
     def _update_magic_scythes(self, dt):
         """Update magic scythe summons - orbiting damage."""
-        target_count = getattr(self.player, "scythe_count", 0)
+        target_count = self.player.stats.scythe_count
         while len(self.magic_scythes) < target_count:
             base_angle = len(self.magic_scythes) * (math.tau / max(1, target_count))
             self.magic_scythes.append({
@@ -2085,7 +2335,7 @@ class Game:
             return
         
         orbit_r = 90
-        scythe_damage = getattr(self.player, "scythe_damage", 40) * getattr(self.player, "summon_damage_mult", 1.0)
+        scythe_damage = self.player.stats.scythe_damage * self.player.stats.summon_damage_mult
         
         for scythe in self.magic_scythes:
             scythe["angle"] += dt * 3.5
@@ -2109,11 +2359,11 @@ class Game:
 
     def _update_magic_spears(self, dt):
         """Update magic spear summons - stabbing attacks."""
-        target_count = getattr(self.player, "spear_count", 0)
+        target_count = self.player.stats.spear_count
         while len(self.magic_spears) < target_count:
             self.magic_spears.append({
-                "angle": random.uniform(0, math.tau),
-                "cd": random.uniform(0.3, 0.6),
+                "angle": self.rng.combat.uniform(0, math.tau),
+                "cd": self.rng.combat.uniform(0.3, 0.6),
                 "state": "orbit",  # orbit or attack
                 "target_x": 0,
                 "target_y": 0
@@ -2125,7 +2375,7 @@ class Game:
             return
         
         orbit_r = 70
-        spear_damage = getattr(self.player, "spear_damage", 20) * getattr(self.player, "summon_damage_mult", 1.0)
+        spear_damage = self.player.stats.spear_damage * self.player.stats.summon_damage_mult
         
         for spear in self.magic_spears:
             spear["cd"] -= dt
@@ -2140,14 +2390,14 @@ class Game:
                     target.hp -= spear_damage
                     target.flash_timer = 0.1
                     self.damage_texts.append({"x": target.x, "y": target.y - 10, "val": int(spear_damage), "life": 0.4, "color": (255, 200, 100)})
-                    spear["cd"] = 0.8 / getattr(self.player, "summon_attack_speed_mult", 1.0)
+                    spear["cd"] = 0.8 / self.player.stats.summon_attack_speed_mult
 
     def _update_gale(self, dt):
         """Update gale AoE damage around player."""
         if self.upgrade_manager.should_gale_fire():
-            gale_damage = getattr(self.player, "gale_damage", 20)
+            gale_damage = self.player.stats.gale_damage
             gale_radius = 150
-            if getattr(self.player, "gale_scales_speed", False):
+            if self.player.stats.gale_scales_speed:
                 gale_damage *= (self.player.speed / 5.0)
             
             for en in self.enemies:
@@ -2156,7 +2406,7 @@ class Game:
                 dist_sq = dx * dx + dy * dy
                 if dist_sq < gale_radius ** 2:
                     # Center bonus damage
-                    if dist_sq < 50 ** 2 and getattr(self.player, "gale_center_damage_mult", 0) > 0:
+                    if dist_sq < 50 ** 2 and self.player.stats.gale_center_damage_mult > 0:
                         dmg = gale_damage * self.player.gale_center_damage_mult
                     else:
                         dmg = gale_damage
@@ -2170,11 +2420,11 @@ class Game:
             return
         
         p = self.player
-        glare_damage = getattr(p, "glare_damage", 20)
-        glare_slow = getattr(p, "glare_slow", 0)
-        glare_stun = getattr(p, "glare_stun", False)
-        glare_stun_duration = getattr(p, "glare_stun_duration", 1.0)
-        glare_execute = getattr(p, "glare_execute", 0)
+        glare_damage = p.stats.glare_damage
+        glare_slow = p.stats.glare_slow
+        glare_stun = p.stats.glare_stun
+        glare_stun_duration = p.stats.glare_stun_duration
+        glare_execute = p.stats.glare_execute
         
         # Flash effect
         self.glare_flash_timer = 0.3
@@ -2248,8 +2498,8 @@ class Game:
                 en.flash_timer = 0.15
                 self.damage_texts.append({"x": en.x, "y": en.y - 10, "val": int(damage), "life": 0.5, "color": (255, 255, 100)})
                 # Electro bug - chain to nearby enemies
-                if getattr(self.player, "electro_bug", False):
-                    chain_targets = getattr(self.player, "electro_bug_targets", 2)
+                if self.player.stats.electro_bug:
+                    chain_targets = self.player.stats.electro_bug_targets
                     chain_count = 0
                     for other in self.enemies:
                         if other is en or chain_count >= chain_targets:
@@ -2301,7 +2551,7 @@ class Game:
             angle = (math.tau / count) * i
             vx = math.cos(angle)
             vy = math.sin(angle)
-            b = Bullet(self.player.x, self.player.y, vx, vy, damage, self.player.bullet_speed * 0.8, status=self.player.bullet_status.copy())
+            b = BULLET_POOL.acquire(self.player.x, self.player.y, vx, vy, damage, self.player.bullet_speed * 0.8, status=self.player.bullet_status)
             self.bullets.append(b)
 
     def _spawn_ice_shards(self, count, freeze):
@@ -2312,7 +2562,7 @@ class Game:
             angle = (math.tau / count) * i
             vx = math.cos(angle)
             vy = math.sin(angle)
-            b = Bullet(self.player.x, self.player.y, vx, vy, damage, self.player.bullet_speed * 0.6, status=status)
+            b = BULLET_POOL.acquire(self.player.x, self.player.y, vx, vy, damage, self.player.bullet_speed * 0.6, status=status)
             self.bullets.append(b)
 
     def _spawn_splinter_bullets(self, x, y):
@@ -2320,10 +2570,10 @@ class Game:
         count = self.player.splinter_count
         damage = int(self.player.damage * self.player.splinter_damage_ratio)
         for i in range(count):
-            angle = random.uniform(0, math.tau)
+            angle = self.rng.combat.uniform(0, math.tau)
             vx = math.cos(angle)
             vy = math.sin(angle)
-            b = Bullet(x, y, vx, vy, damage, self.player.bullet_speed * 0.7, status=self.player.bullet_status.copy())
+            b = BULLET_POOL.acquire(x, y, vx, vy, damage, self.player.bullet_speed * 0.7, status=self.player.bullet_status)
             b.splinter = True  # Mark as splinter so they don't trigger more splinters
             self.bullets.append(b)
 
@@ -2342,99 +2592,28 @@ class Game:
                 self.fireball_fx.remove(fx)
 
     def spawn_enemy(self):
-        half = WORLD_SIZE / 2
-        dmin, dmax = 600, 900
-        ang = random.uniform(0, math.tau)
-        r = random.uniform(dmin, dmax)
-        x = self.player.x + math.cos(ang) * r
-        y = self.player.y + math.sin(ang) * r
-        x = clamp(x, -half, half)
-        y = clamp(y, -half, half)
-
-        # Gradual scaling based on elapsed time
+        self.spawn_many(1)
+
+    def spawn_many(self, n):
+        """Spawn a batch of enemies on the 600-900px ring around the player.
+
+        Kind selection, stat templates and ring placement come from the
+        precomputed GAME_SPAWN_TABLE (see game_spawning.SpawnTable).
+        """
+        table = GAME_SPAWN_TABLE
         t = self.elapsed_time
-        
-        # Very gradual HP scaling: starts at 1.0, reaches 2.0 at 3 min, 3.0 at 6 min
-        hp_scale = 1.0 + (t / 180.0)
-        # Even more gradual speed scaling: starts at 1.0, reaches 1.3 at 3 min
-        speed_scale = 1.0 + (t / 600.0)  # Much slower speed scaling
 
         # Timed boss - test mode: 10s, normal: 60s
         boss_interval = 10 if self.test_mode else 60
-        if int(t // boss_interval) > self.bosses_spawned:
+        if n > 0 and int(t // boss_interval) > self.bosses_spawned:
             self.bosses_spawned += 1
-            kind = "boss"
-            boss_stage = self.bosses_spawned
-        else:
-            # Gradual enemy type unlocking with weighted spawns
-            # Start with mostly normals, slowly introduce others
-            pool = ["normal"]
-            weights = [1.0]
-            
-            # Fast enemies unlock at 45s, low chance initially
-            if t >= 45:
-                pool.append("fast")
-                fast_weight = min(0.25, (t - 45) / 120)  # Ramps up over 2 min
-                weights.append(fast_weight)
-            
-            # Tank enemies unlock at 90s
-            if t >= 90:
-                pool.append("tank")
-                tank_weight = min(0.20, (t - 90) / 120)
-                weights.append(tank_weight)
-            
-            # Sprinter enemies unlock at 150s (2.5 min) - was too early at 90s
-            if t >= 150:
-                pool.append("sprinter")
-                sprinter_weight = min(0.15, (t - 150) / 180)  # Slow ramp
-                weights.append(sprinter_weight)
-            
-            # Bruiser enemies unlock at 180s (3 min)
-            if t >= 180:
-                pool.append("bruiser")
-                bruiser_weight = min(0.15, (t - 180) / 120)
-                weights.append(bruiser_weight)
-            
-            # Shooter enemies unlock at 240s (4 min) - very rare at first
-            if t >= 240:
-                pool.append("shooter")
-                shooter_weight = min(0.10, (t - 240) / 180)
-                weights.append(shooter_weight)
-            
-            kind = random.choices(pool, weights=weights, k=1)[0]
-            boss_stage = 0
-
-        # Enemy stats with gradual scaling
-        if kind == "tank":
-            hp = int(ENEMY_BASE_HP * 2.5 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 0.6 * speed_scale
-        elif kind == "fast":
-            hp = int(ENEMY_BASE_HP * 0.6 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 1.5 * speed_scale
-        elif kind == "sprinter":
-            hp = int(ENEMY_BASE_HP * 0.5 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 1.8 * speed_scale  # Reduced from 2.4
-        elif kind == "bruiser":
-            hp = int(ENEMY_BASE_HP * 3.5 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 0.8 * speed_scale
-        elif kind == "shooter":
-            hp = int(ENEMY_BASE_HP * 1.2 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 0.9 * speed_scale
-        elif kind == "boss":
-            if boss_stage == 1:
-                hp = int(ENEMY_BASE_HP * 12 * hp_scale)
-                speed = ENEMY_BASE_SPEED * 1.0 * speed_scale
-            elif boss_stage == 2:
-                hp = int(ENEMY_BASE_HP * 16 * hp_scale)
-                speed = ENEMY_BASE_SPEED * 1.2 * speed_scale
-            else:
-                hp = int(ENEMY_BASE_HP * 22 * hp_scale)
-                speed = ENEMY_BASE_SPEED * 1.4 * speed_scale
-        else:  # normal
-            hp = int(ENEMY_BASE_HP * 1.0 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 1.0 * speed_scale
+            (x, y), = table.ring_positions(self.player.x, self.player.y, 1, self.rng.spawn)
+            hp, speed = table.stats("boss", t, self.bosses_spawned)
+            self.enemies.append(ENEMY_POOL.acquire(x, y, hp, speed, "boss", boss_stage=self.bosses_spawned))
+            n -= 1
 
-        self.enemies.append(Enemy(x, y, hp, speed, kind, boss_stage=boss_stage))
+        n = self.population.spawn_allowance(n)
+        self.enemies.extend(table.spawn_many(n, t, self.player.x, self.player.y, self.rng.spawn))
 
     def roll_levelup(self):
         """Roll available upgrades for level-up screen using the new upgrade tree system."""
@@ -2450,6 +2629,61 @@ class Game:
         self.state = STATE_LEVEL_UP
         audio.play_sfx(audio.snd_level_up)
     
+    def set_test_mode(self, on: bool):
+        self.test_mode = on
+        if on:
+            # In test mode, provide ALL upgrades from new tree system
+            self.test_power_queue = list(UPGRADES_BY_ID.keys())
+        else:
+            self.test_power_queue.clear()
+
+    def start_run(self, seed=None):
+        """Reset and start playing (test mode opens with a level-up)."""
+        self.finish_loading()
+        self.reset_game(seed)
+        if self.test_mode:
+            self.roll_levelup()
+        else:
+            self.state = STATE_PLAYING
+
+    def choose_levelup(self, index: int):
+        """Take level-up option `index` and resume (or roll the next test power)."""
+        if self.recorder is not None:
+            self.recorder.action(ACTION_LEVELUP, index)
+        self.apply_levelup_choice(self.levelup_options[index])
+        if self.test_mode and self.test_power_queue:
+            self.roll_levelup()
+        else:
+            self.state = STATE_PLAYING
+
+    def skip_levelup(self):
+        if self.recorder is not None:
+            self.recorder.action(ACTION_SKIP_LEVELUP)
+        self.state = STATE_PLAYING
+
+    def choose_evolution(self, index: int):
+        if self.recorder is not None:
+            self.recorder.action(ACTION_EVOLUTION, index)
+        apply_evolution(self.player, self.evolution_options[index])
+        self.state = STATE_PLAYING
+
+    def _save_frame_report(self):
+        """Write this run's frame-time report to runs/<timestamp>.json."""
+        try:
+            self.frame_stats.save(self.frame_report_dir)
+        except OSError:
+            self.frame_stats.written = ""  # read-only install: don't retry every frame
+
+    def _save_replay(self):
+        """Write the current run's replay once it has any recorded ticks."""
+        rec = self.recorder
+        if rec is None or rec.saved or rec.ticks == 0:
+            return
+        try:
+            rec.save(self.replay_path, self)
+        except OSError:
+            rec.saved = True  # read-only install: don't retry every frame
+
     def apply_levelup_choice(self, upgrade_id: str):
         """Apply the selected upgrade from level-up screen."""
         if upgrade_id in UPGRADES_BY_ID:
@@ -2463,7 +2697,7 @@ class Game:
             apply_powerup(self.player, upgrade_id)
 
     def roll_evolution(self):
-        self.evolution_options = random.sample(EVOLUTIONS, k=min(3, len(EVOLUTIONS)))
+        self.evolution_options = self.rng.upgrades.sample(EVOLUTIONS, k=min(3, len(EVOLUTIONS)))
         self.state = STATE_EVOLUTION
         audio.play_sfx(audio.snd_level_up)
 
@@ -2481,7 +2715,7 @@ class Game:
         surface = target if target is not None else self.screen
         w, h = surface.get_size()
         ox, oy = cam
-        for s in self.stars:
+        for s in islice(self.stars, self.quality.star_count):
             x = int(s["x"] - ox)
             y = int(s["y"] - oy)
             if -5 <= x <= w + 5 and -5 <= y <= h + 5:
@@ -2512,16 +2746,25 @@ class Game:
                 surface.blit(flash_surf, (fx - f["r"], fy - f["r"]))
 
     def draw(self):
+        self.draw_frame()
+        self.present_frame()
+
+    def draw_frame(self):
+        """Compose the current state onto the logical screen surface."""
         # If halted, don't clear or redraw — keep the last frame exactly as-is
         if self.state == STATE_HALT:
-            pygame.display.flip()
             return
 
         self.screen.fill(COLOR_BG)
         if self.state == STATE_MENU:
             self.draw_menu()
         elif self.state in (STATE_PLAYING, STATE_LEVEL_UP, STATE_EVOLUTION, STATE_GAME_OVER, STATE_PAUSED, STATE_DEAD_ANIM):
-            self.draw_game_world()
+            if self.state == STATE_PLAYING and self.render_alpha < 1.0:
+                saved = self._apply_interpolation(self.render_alpha)
+                self.draw_game_world()
+                self._restore_interpolation(saved)
+            else:
+                self.draw_game_world()
             self.draw_boost_overlay()
             self.draw_glare_flash_overlay()
             self.draw_vision_overlay()
@@ -2534,10 +2777,16 @@ class Game:
                 self.draw_game_over()
             if self.state == STATE_PAUSED:
                 self.draw_pause_overlay()
+            if self.show_profiler:
+                self.draw_profiler_overlay()
         elif self.state == STATE_SETTINGS:
             self.draw_settings()
 
-        # Present to the actual window (desktop-sized when borderless fullscreen).
+    def present_frame(self):
+        """Present the composed screen to the actual window (desktop-sized when borderless fullscreen).
+
+        Only reads ``self.screen``, so the pipelined loop runs it while the sim thread ticks.
+        """
         if self.screen is self.window:
             pygame.display.flip()
         else:
@@ -2547,15 +2796,25 @@ class Game:
             self.window.blit(frame, (ox, oy))
             pygame.display.flip()
 
+    def _menu_bg_scaled(self):
+        """Menu background at the current size: baked copy, else scaled once and kept."""
+        size = (self.w, self.h)
+        cached = self._menu_bg_cache
+        if cached is None or cached.get_size() != size:
+            cached = baked_assets.image(self._menu_bg_path, size)
+            if cached is None:
+                try:
+                    cached = pygame.transform.smoothscale(self.menu_bg_image_original, size)
+                except Exception:
+                    cached = pygame.transform.scale(self.menu_bg_image_original, size)
+            self._menu_bg_cache = cached
+        return cached
+
     def draw_menu(self):
         cam = (0, 0)
         # If a menu background image exists, draw it scaled to the window.
         if getattr(self, "menu_bg_image_original", None):
-            try:
-                bg = pygame.transform.smoothscale(self.menu_bg_image_original, (self.w, self.h))
-            except Exception:
-                bg = pygame.transform.scale(self.menu_bg_image_original, (self.w, self.h))
-            self.screen.blit(bg, (0, 0))
+            self.screen.blit(self._menu_bg_scaled(), (0, 0))
         else:
             self.draw_background(cam)
         # Render title image if available, centered. Otherwise fallback to wrapped text title.
@@ -2618,9 +2877,11 @@ class Game:
 
         cam = (self.player.x - render_w // 2, self.player.y - render_h // 2)
         self.draw_background(cam, target=render_surf)
+        batch = self.world_batch
+        batch.begin(render_surf, cam)
 
         # particles first so entities draw above
-        for p in self.boost_particles:
+        for p in batch.cull_dicts(self.boost_particles, 40):
             sx = int(p["x"] - cam[0])
             sy = int(p["y"] - cam[1])
             life_max = p.get("life_max", 0.35)
@@ -2637,7 +2898,7 @@ class Game:
                 star_pts.append((cx + math.cos(ang) * r, cy + math.sin(ang) * r))
             pygame.draw.polygon(surf, (*p["color"], alpha), star_pts)
             render_surf.blit(surf, (int(sx - size * 1.3), int(sy - size * 1.3)))
-        for p in self.status_particles:
+        for p in batch.cull_dicts(self.status_particles, 30):
             sx = int(p["x"] - cam[0])
             sy = int(p["y"] - cam[1])
             life_max = p.get("life_max", 0.6)
@@ -2691,13 +2952,12 @@ class Game:
                 pygame.draw.circle(render_surf, outer, (ox, oy), max(1, r + 3), width=2)
                 pygame.draw.circle(render_surf, inner, (ox, oy), r)
 
-        for o in self.orbs:
-            o.draw(render_surf, cam)
-        for g in self.gas_pickups:
-            g.draw(render_surf, cam)
-        for ev in self.evolution_pickups:
-            ev.draw(render_surf, cam)
-        for m in self.minions:
+        batch.draw_round("orb", self.orbs)
+        batch.draw_round("orb", self.orb_field.sleeping_in_rect(
+            cam[0], cam[1], cam[0] + batch.view_w, cam[1] + batch.view_h))
+        batch.draw_round("gas", self.gas_pickups)
+        batch.draw_round("evolution", self.evolution_pickups)
+        for m in batch.cull_dicts(self.minions, 16):
             sx = int(m.get("x", self.player.x) - cam[0])
             sy = int(m.get("y", self.player.y) - cam[1])
             pygame.draw.circle(render_surf, (180, 255, 255), (sx, sy), 10)
@@ -2738,7 +2998,7 @@ class Game:
             end_y = py + int(math.sin(ang) * 20)
             pygame.draw.line(render_surf, (255, 200, 100), (px, py), (end_x, end_y), 4)
         # Draw lightning effects
-        for fx in self.lightning_fx:
+        for fx in batch.cull_dicts(self.lightning_fx, 0, "radius"):
             lx = int(fx["x"] - cam[0])
             ly = int(fx["y"] - cam[1])
             alpha = int(255 * (fx["life"] / 0.3))
@@ -2748,7 +3008,7 @@ class Game:
             pygame.draw.circle(surf, (255, 255, 200, min(255, alpha + 50)), (r, r), r // 2)
             render_surf.blit(surf, (lx - r, ly - r))
         # Draw fireball effects
-        for fx in self.fireball_fx:
+        for fx in batch.cull_dicts(self.fireball_fx, 0, "radius"):
             fx_x = int(fx["x"] - cam[0])
             fx_y = int(fx["y"] - cam[1])
             alpha = int(255 * (fx["life"] / 0.4))
@@ -2757,11 +3017,10 @@ class Game:
             pygame.draw.circle(surf, (255, 100, 50, alpha), (r, r), r)
             pygame.draw.circle(surf, (255, 200, 100, min(255, alpha + 50)), (r, r), r // 2)
             render_surf.blit(surf, (fx_x - r, fx_y - r))
-        for e in self.enemies:
-            e.draw(render_surf, cam)
+        batch.draw_enemies(self.enemies)
         # Draw drones/phantoms/dragon IN FRONT of enemies (higher z-index)
         # Draw ghosts as ghostly spirits (they touch to damage)
-        for g in self.ghosts:
+        for g in batch.cull_dicts(self.ghosts, 30):
             gx = int(g.get("x", self.player.x) - cam[0])
             gy = int(g.get("y", self.player.y) - cam[1])
             # Ghost - spooky translucent look
@@ -2776,7 +3035,7 @@ class Game:
                 pygame.draw.circle(ghost_surf, (150, 200, 150, 80 - i * 20), (tail_x, tail_y), 4 - i)
             render_surf.blit(ghost_surf, (gx - 15, gy - 15))
         # Draw orbiting drones (they orbit and shoot)
-        for d in self.drones:
+        for d in batch.cull_dicts(self.drones, 30):
             dx_d = int(d.get("x", self.player.x) - cam[0])
             dy_d = int(d.get("y", self.player.y) - cam[1])
             # Drone body - metallic look
@@ -2786,7 +3045,7 @@ class Game:
             # Drone wings
             pygame.draw.line(render_surf, (100, 140, 180), (dx_d - 12, dy_d), (dx_d - 20, dy_d - 5), 2)
             pygame.draw.line(render_surf, (100, 140, 180), (dx_d + 12, dy_d), (dx_d + 20, dy_d - 5), 2)
-        for p in getattr(self, "phantoms", []):
+        for p in batch.cull_dicts(self.phantoms, 30):
             px = int(p.get("x", self.player.x) - cam[0])
             py = int(p.get("y", self.player.y) - cam[1])
             # Ghostly translucent appearance
@@ -2828,12 +3087,8 @@ class Game:
             pygame.draw.circle(render_surf, (255, 255, 255), (dx + 5, dy - 4), 4)
             pygame.draw.circle(render_surf, (0, 0, 0), (dx - 5, dy - 4), 2)
             pygame.draw.circle(render_surf, (0, 0, 0), (dx + 5, dy - 4), 2)
-        for b in self.bullets:
-            b.draw(render_surf, cam)
-        for eb in self.enemy_bullets:
-            sx = int(eb["x"] - cam[0])
-            sy = int(eb["y"] - cam[1])
-            pygame.draw.circle(render_surf, COLOR_RED, (sx, sy), eb["r"])
+        batch.draw_round("bullet", self.bullets)
+        batch.draw_enemy_bullets(self.enemy_bullets)
         # laser beam visual
         if self.player.laser_active and self.laser_segment:
             px, py, ex, ey = self.laser_segment
@@ -2848,7 +3103,7 @@ class Game:
             pygame.draw.circle(flash, (255, 255, 240, 230), (burst_r, burst_r), max(8, burst_r // 2))
             render_surf.blit(flash, (start[0] - burst_r, start[1] - burst_r))
         # Glare cone visual
-        if getattr(self.player, "glare_dps", 0) > 0:
+        if self.player.stats.glare_dps > 0:
             mx, my = self._mouse_pos()
             glare_range = 300
             glare_cone = 0.5
@@ -2915,7 +3170,8 @@ class Game:
         self._draw_damage_texts(cam, target=render_surf)
 
         # scale the rendered world back to the screen at the desired zoom
-        scaled = pygame.transform.smoothscale(render_surf, (self.w, self.h))
+        scale = pygame.transform.smoothscale if self.quality.smooth_zoom else pygame.transform.scale
+        scaled = scale(render_surf, (self.w, self.h))
         self.screen.blit(scaled, (0, 0))
 
     def draw_boost_overlay(self):
@@ -2952,7 +3208,7 @@ class Game:
 
     def _draw_death_fx(self, cam, target=None):
         surface = target if target is not None else self.screen
-        for fx in self.death_fx:
+        for fx in self.world_batch.cull_dicts(self.death_fx, 40):
             sx = int(fx["x"] - cam[0])
             sy = int(fx["y"] - cam[1])
             life_ratio = fx.get("life", 0) / max(0.001, fx.get("life_max", 1.0))
@@ -2961,7 +3217,7 @@ class Game:
 
     def _draw_damage_texts(self, cam, target=None):
         surface = target if target is not None else self.screen
-        for txt in self.damage_texts:
+        for txt in self.world_batch.cull_dicts(self.damage_texts, 120):
             sx = int(txt["x"] - cam[0])
             sy = int(txt["y"] - cam[1])
             alpha = int(255 * (txt["life"] / 0.6))
@@ -3014,6 +3270,40 @@ class Game:
             y = start_y + i * line_height
             self.screen.blit(surf, (x, y))
 
+    def draw_profiler_overlay(self):
+        """Debug overlay: frame time, live entity counts and pool hit rates."""
+        lines = [
+            f"FPS {self.clock.get_fps():.0f}  {self.clock.get_time()}ms  SIM {self.sim_steps} x {SIM_DT * 1000:.1f}ms",
+            f"ENEMIES {len(self.enemies)}  BULLETS {len(self.bullets)}",
+            f"ORBS {len(self.orbs)} +{self.orb_field.sleeping} asleep  EBULLETS {len(self.enemy_bullets)}",
+        ]
+        lines.append(f"ORBS merged {self.orb_field.merged}")
+        pop = self.population
+        lines.append(f"POP relocated {pop.relocated} merged {pop.merged} dropped {pop.dropped}")
+        near, mid, far = self.lod.counts
+        lines.append(f"LOD near {near} mid {mid} far {far}")
+        batch = self.world_batch
+        lines.append(f"DRAW batched {batch.drawn} culled {batch.culled}")
+        quality = self.quality
+        lines.append(f"AUDIO merged {audio.merged} stolen {audio.stolen} dropped {audio.dropped}")
+        lines.append(f"QUALITY level {quality.level} avg {quality.average_ms:.1f}ms"
+                     f"{' (sim knobs locked)' if quality.sim_locked else ''}")
+        gcm = self.gc
+        lines.append(f"GC auto {'/'.join(map(str, gcm.auto_collections))} max {gcm.auto_max_ms:.1f}ms"
+                     f" safe {gcm.safe_collections} last {gcm.last_safe_ms:.1f}ms frozen {gcm.frozen}")
+        if self.pipeline is not None:
+            lines.append(f"PIPE sim wait {self.pipeline.wait_ms:.1f}ms")
+        for name, rate, hits, misses, free in pool_stats():
+            lines.append(f"POOL {name} {rate * 100:.0f}% ({hits}/{hits + misses}) free {free}")
+        x, y = 16, self.h // 2 - 60
+        for line in lines:
+            txt = self.font_micro.render(line, True, COLOR_WHITE)
+            bg = pygame.Surface((txt.get_width() + 8, txt.get_height() + 4), pygame.SRCALPHA)
+            bg.fill((0, 0, 0, 150))
+            self.screen.blit(bg, (x - 4, y - 2))
+            self.screen.blit(txt, (x, y))
+            y += txt.get_height() + 4
+
     def draw_hud(self):
         base_y = self.btn_pause.rect.y + 6
         # LVL label on left of HP
@@ -3233,6 +3523,16 @@ class Game:
         self.btn_restart.draw(self.screen)
         self.btn_main_menu.draw(self.screen)
 
+        if self.show_frame_report:
+            lines = self.frame_stats.summary_lines()
+            if self.frame_stats.written:
+                lines.append(os.path.relpath(self.frame_stats.written, os.path.dirname(__file__)))
+            y = self.h - 16 - len(lines) * 18
+            for line in lines:
+                tx = self.font_micro.render(line, True, COLOR_WHITE)
+                self.screen.blit(tx, (16, y))
+                y += 18
+
     def draw_pause_overlay(self):
         overlay = pygame.Surface((self.w, self.h))
         overlay.set_alpha(150)
@@ -3275,11 +3575,7 @@ class Game:
         cam = (0, 0)
         # If a menu background image exists, draw it scaled to the window for settings too.
         if getattr(self, "menu_bg_image_original", None):
-            try:
-                bg = pygame.transform.smoothscale(self.menu_bg_image_original, (self.w, self.h))
-            except Exception:
-                bg = pygame.transform.scale(self.menu_bg_image_original, (self.w, self.h))
-            self.screen.blit(bg, (0, 0))
+            self.screen.blit(self._menu_bg_scaled(), (0, 0))
         else:
             self.draw_background(cam)
         overlay = pygame.Surface((self.w, self.h))
@@ -3339,16 +3635,7 @@ class Game:
         test_rect = self._test_toggle_rect()
         mouse_pos = self._mouse_pos()
         is_hover = test_rect.collidepoint(mouse_pos)
-        img = game_ui._BTN_PRESSED if (is_hover or self.test_mode) and getattr(game_ui, '_BTN_PRESSED', None) is not None else getattr(game_ui, '_BTN_IMG', None)
-        if img is not None:
-            # use ninepatch from game_ui
-            try:
-                game_ui._draw_ninepatch(self.screen, img, test_rect, border=12)
-            except Exception:
-                # fallback to solid rect
-                toggle_col = COLOR_GREEN if self.test_mode else COLOR_DARK_GRAY
-                pygame.draw.rect(self.screen, toggle_col, test_rect, border_radius=6)
-        else:
+        if not game_ui.draw_button_container(self.screen, test_rect, is_hover or self.test_mode, border=12):
             toggle_col = COLOR_GREEN if self.test_mode else COLOR_DARK_GRAY
             pygame.draw.rect(self.screen, toggle_col, test_rect, border_radius=6)
 
@@ -3368,7 +3655,31 @@ class Game:
 
 
 def main():
-    Game().run()
+    parser = argparse.ArgumentParser(description="Space Invaders: Cosmic Ranger")
+    parser.add_argument("--replay", metavar="FILE", help="play back a recorded run and report frame times")
+    parser.add_argument("--headless", action="store_true", help="with --replay: no window or audio, run as fast as possible")
+    parser.add_argument("--fast", action="store_true", help="with --replay: don't pace playback to real time")
+    parser.add_argument("--record", metavar="FILE", help="where to write this session's replay")
+    parser.add_argument("--seed", type=int, help="fixed run seed")
+    parser.add_argument("--pipelined", action="store_true", help="run sim ticks on a worker thread while the last frame is presented")
+    parser.add_argument("--startup-report", action="store_true", help="print a startup timing breakdown once the menu is up")
+    parser.add_argument("--frame-report", action="store_true", help="show the run's frame-time summary on the game-over screen")
+    args = parser.parse_args()
+
+    game = Game()
+    game.startup.enabled = args.startup_report
+    game.show_frame_report = args.frame_report
+    if args.replay:
+        replay = Replay.load(args.replay)
+        stats = run_replay(game, replay, draw=not args.headless, realtime=not (args.headless or args.fast))
+        print_replay_report(args.replay, stats)
+        pygame.quit()
+        sys.exit(1 if stats["desync"] else 0)
+    if args.record:
+        game.replay_path = args.record
+    game.run_seed = args.seed
+    game.pipelined = args.pipelined
+    game.run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,128 @@
+"""
+Game Assets Module - Baked asset lookup with source fallback
+============================================================
+``tools/bake_assets.py`` writes pre-processed copies of the shipped assets
+to Assets/Baked together with a manifest.json:
+
+- SFX decoded once to WAV in the mixer's native format, so startup skips
+  MP3 decoding
+- the menu background pre-scaled to every WINDOW_SIZES entry
+- the button nine-patches pre-rendered at the button sizes the UI uses
+
+Every manifest entry records the sha256 of its source file. A baked file is
+only used while that hash still matches the source (and, for sounds, while
+the mixer runs in the format it was baked for). Otherwise, or when nothing
+was baked, the loaders fall back to the source asset.
+"""
+
+import hashlib
+import json
+import os
+
+import pygame
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(BASE_DIR, "Assets")
+BAKED_DIR = os.path.join(ASSETS_DIR, "Baked")
+MANIFEST_PATH = os.path.join(BAKED_DIR, "manifest.json")
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def asset_key(path: str) -> str:
+    """Manifest key of a source asset: its path relative to Assets/, with '/'."""
+    return os.path.relpath(os.path.abspath(path), ASSETS_DIR).replace(os.sep, "/")
+
+
+def ninepatch_key(source: str, size: tuple, border: int) -> str:
+    return f"{asset_key(source)}@{size[0]}x{size[1]}b{border}"
+
+
+def scaled_key(source: str, size: tuple) -> str:
+    return f"{asset_key(source)}@{size[0]}x{size[1]}"
+
+
+class BakedAssets:
+    """Manifest reader; hashes each source at most once per process."""
+
+    def __init__(self, manifest_path: str = MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self.entries = None
+        self._fresh = {}    # source path -> source hash still matches
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        if self.entries is not None:
+            return
+        self.entries = {}
+        try:
+            with open(self.manifest_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.entries = data.get("entries", {})
+
+    def _source_fresh(self, source: str, sha: str) -> bool:
+        fresh = self._fresh.get(source)
+        if fresh is None:
+            try:
+                fresh = file_sha256(source) == sha
+            except OSError:
+                fresh = False
+            self._fresh[source] = fresh
+        return fresh
+
+    def lookup(self, key: str, source: str):
+        """Baked file path for ``key`` if present and fresh, else None."""
+        self._load()
+        entry = self.entries.get(key)
+        if entry is not None:
+            out = os.path.join(BAKED_DIR, entry["output"])
+            if os.path.isfile(out) and self._source_fresh(source, entry["sha256"]):
+                self.hits += 1
+                return out, entry
+        self.misses += 1
+        return None, None
+
+    # ===== LOADERS =====
+    def sound(self, path: str):
+        """pygame Sound for ``path``, from the baked PCM copy when possible."""
+        if not os.path.isfile(path):
+            return None
+        baked, entry = self.lookup(asset_key(path), path)
+        if baked is not None and tuple(entry.get("mixer", ())) == tuple(pygame.mixer.get_init() or ()):
+            try:
+                return pygame.mixer.Sound(baked)
+            except pygame.error:
+                pass
+        return pygame.mixer.Sound(path)
+
+    def image(self, path: str, size: tuple = None):
+        """Converted image for ``path``; with ``size``, the baked copy pre-scaled to it."""
+        if size is not None:
+            baked, _ = self.lookup(scaled_key(path, size), path)
+            if baked is not None:
+                return pygame.image.load(baked).convert_alpha()
+            return None
+        if not os.path.isfile(path):
+            return None
+        return pygame.image.load(path).convert_alpha()
+
+    def ninepatch(self, path: str, size: tuple, border: int):
+        """Baked nine-patch of ``path`` rendered at ``size``, or None."""
+        baked, _ = self.lookup(ninepatch_key(path, size, border), path)
+        if baked is None:
+            return None
+        return pygame.image.load(baked).convert_alpha()
+
+
+baked_assets = BakedAssets()
@@ -5,14 +5,14 @@ Extracted from game.py to reduce file size and improve organization.
 """
 
 import math
-import random
 from typing import List, Tuple, Optional, TYPE_CHECKING
 
 from game_constants import (
-    FPS, WORLD_SIZE, XP_PER_ORB, COLOR_YELLOW,
+    WORLD_SIZE, XP_PER_ORB, COLOR_YELLOW,
     circle_collision, clamp
 )
-from game_entities import Bullet, XPOrb, GasPickup, EvolutionPickup
+from game_entities import Bullet, EvolutionPickup, BULLET_POOL, ENEMY_POOL, GAS_POOL
+from game_enemy_kinds import KIND_BOSS
 
 if TYPE_CHECKING:
     from game import Game
@@ -27,6 +27,10 @@ class CombatManager:
     @property
     def player(self):
         return self.game.player
+
+    @property
+    def rng(self):
+        return self.game.rng
     
     @property
     def enemies(self):
@@ -42,37 +46,29 @@ class CombatManager:
             b.update(dt)
         
         # Remove offscreen bullets
-        self.game.bullets = [b for b in self.bullets if not b.offscreen(cam)]
+        live_bullets = []
+        for b in self.bullets:
+            if b.offscreen(cam):
+                BULLET_POOL.release(b)
+            else:
+                live_bullets.append(b)
+        self.game.bullets = live_bullets
     
     def update_enemy_bullets(self, dt: float):
         """Update and handle enemy bullet collisions."""
-        for eb in list(self.game.enemy_bullets):
-            eb["x"] += eb["vx"] * dt * FPS
-            eb["y"] += eb["vy"] * dt * FPS
-            
-            # Check collision with player
-            if circle_collision(
-                self.player.x, self.player.y, self.player.radius,
-                eb["x"], eb["y"], eb["r"]
-            ):
-                # Check dodge
-                upgrade_mgr = getattr(self.player, "upgrade_manager", None)
-                if upgrade_mgr and upgrade_mgr.check_dodge():
-                    # Dodged - remove bullet but no damage
-                    pass
-                elif self.player.invuln <= 0:
-                    self.player.take_damage(1)
-                    self.player.hit_flash = 0.2
-                    if upgrade_mgr:
-                        upgrade_mgr.on_hit()
-                
-                if eb in self.game.enemy_bullets:
-                    self.game.enemy_bullets.remove(eb)
-                continue
-            
-            # Remove far bullets
-            if abs(eb["x"] - self.player.x) > 2000 or abs(eb["y"] - self.player.y) > 2000:
-                self.game.enemy_bullets.remove(eb)
+        hits, _ = self.game.enemy_bullets.step(
+            dt, self.player.x, self.player.y, self.player.radius, (), 0, 2000)
+        for _ in range(hits):
+            # Check dodge
+            upgrade_mgr = self.player.upgrade_manager
+            if upgrade_mgr and upgrade_mgr.check_dodge():
+                # Dodged - bullet is gone but no damage
+                pass
+            elif self.player.invuln <= 0:
+                self.player.take_damage(1)
+                self.player.hit_flash = 0.2
+                if upgrade_mgr:
+                    upgrade_mgr.on_hit()
     
     def update_guided_shots(self):
         """Update homing behavior for guided shots."""
@@ -80,28 +76,25 @@ class CombatManager:
             return
         
         for b in self.bullets:
-            if getattr(b, "guidance_disabled", False):
+            if b.guidance_disabled:
                 continue
             
-            if not getattr(b, "target", None) or b.target not in self.enemies:
+            tgt = b.target[0] if b.target else None
+            if not tgt or tgt.uid != b.target[1] or tgt not in self.enemies:
                 if not self.enemies:
                     break
-                b.target = min(
+                tgt = min(
                     self.enemies,
                     key=lambda en: (en.x - b.x) ** 2 + (en.y - b.y) ** 2
                 )
-            
-            tgt = b.target
-            if not tgt or tgt not in self.enemies:
-                b.target = None
-                continue
+                b.target = (tgt, tgt.uid)
             
             dx = tgt.x - b.x
             dy = tgt.y - b.y
             l = math.hypot(dx, dy)
             
             if l < 1.0:
-                ang = random.uniform(0, math.tau)
+                ang = self.rng.combat.uniform(0, math.tau)
                 dx, dy = math.cos(ang), math.sin(ang)
                 l = 1.0
             
@@ -131,7 +124,7 @@ class CombatManager:
         for b in list(self.bullets):
             for en in list(self.enemies):
                 # Skip if recently hit by this bullet
-                if en.hit_sources.get(getattr(b, "uid", None), 0.0) > 0:
+                if en.hit_sources.get(b.uid, 0.0) > 0:
                     continue
                 
                 if not circle_collision(b.x, b.y, b.radius, en.x, en.y, en.radius):
@@ -145,7 +138,7 @@ class CombatManager:
                 b.target = None
                 
                 # Calculate damage
-                upgrade_mgr = getattr(self.player, "upgrade_manager", None)
+                upgrade_mgr = self.player.upgrade_manager
                 damage_mult = upgrade_mgr.get_current_damage_mult() if upgrade_mgr else 1.0
                 base_damage = int(b.damage * damage_mult)
                 
@@ -160,14 +153,14 @@ class CombatManager:
                 dx = en.x - b.x
                 dy = en.y - b.y
                 l = math.hypot(dx, dy) or 1
-                knockback_mult = getattr(self.player, "knockback_mult", 1.0)
+                knockback_mult = self.player.stats.knockback_mult
                 push = 12 * knockback_mult
-                if getattr(en, "kind", "") == "boss":
+                if en.kind_id == KIND_BOSS:
                     push *= 0.25
                 en.x += dx / l * push
                 en.y += dy / l * push
                 
-                if getattr(en, "kind", "") != "boss":
+                if en.kind_id != KIND_BOSS:
                     en.knockback_pause = 0.2
                     en.knockback_slow = 0.2
                 
@@ -176,7 +169,7 @@ class CombatManager:
                 
                 # Check execute
                 if upgrade_mgr:
-                    max_hp = getattr(en, "max_hp", en.hp + base_damage)
+                    max_hp = en.max_hp
                     hp_ratio = en.hp / max(1, max_hp)
                     if upgrade_mgr.check_execute(hp_ratio):
                         en.hp = 0
@@ -184,7 +177,7 @@ class CombatManager:
                 # Damage text
                 total_damage = base_damage + extra_damage
                 self.game.damage_texts.append({
-                    "x": en.x + random.uniform(-6, 6),
+                    "x": en.x + self.rng.fx.uniform(-6, 6),
                     "y": en.y - 10,
                     "val": total_damage,
                     "life": 0.6,
@@ -214,11 +207,11 @@ class CombatManager:
                 status_color = (150, 200, 255)
             
             # Check freeze chance
-            freeze_chance = getattr(p, "freeze_chance", 0)
-            if freeze_chance > 0 and random.random() < freeze_chance:
-                is_boss = getattr(en, "kind", "") == "boss"
-                duration = getattr(p, "freeze_boss_duration", 0.3) if is_boss else getattr(p, "freeze_duration", 1.5)
-                en.frozen_timer = max(getattr(en, "frozen_timer", 0), duration)
+            freeze_chance = p.stats.freeze_chance
+            if freeze_chance > 0 and self.rng.combat.random() < freeze_chance:
+                is_boss = en.kind_id == KIND_BOSS
+                duration = p.stats.freeze_boss_duration if is_boss else p.stats.freeze_duration
+                en.frozen_timer = max(en.frozen_timer, duration)
             
             en.ice_timer = max(en.ice_timer, 2.0)
             en.ice_dps = max(en.ice_dps, p.ice_bonus_damage * 0.8)
@@ -231,7 +224,7 @@ class CombatManager:
                 extra_damage += int(b.damage * p.burn_sear_bonus)
             
             en.burn_timer = max(en.burn_timer, 3.0)
-            base_burn = getattr(p, "base_burn_dps", 0)
+            base_burn = p.stats.base_burn_dps
             burn_dps = max(base_burn, p.damage * 0.26 * p.burn_bonus_mult)
             en.burn_dps = max(en.burn_dps, burn_dps)
             self.game._spawn_status_fx(en.x, en.y, kind="fire")
@@ -247,21 +240,21 @@ class CombatManager:
             self.game._spawn_status_fx(en.x, en.y, kind="poison")
         
         # Curse
-        curse_chance = getattr(p, "curse_chance", 0)
-        if curse_chance > 0 and random.random() < curse_chance:
+        curse_chance = p.stats.curse_chance
+        if curse_chance > 0 and self.rng.combat.random() < curse_chance:
             if not hasattr(en, "curse_timer"):
                 en.curse_timer = 0
                 en.curse_damage = 0
             
-            delay = getattr(p, "curse_delay", 0.75)
-            curse_mult = getattr(p, "curse_damage_mult", 2.0)
-            bonus = getattr(p, "curse_bonus_damage", 0)
+            delay = p.stats.curse_delay
+            curse_mult = p.stats.curse_damage_mult
+            bonus = p.stats.curse_bonus_damage
             
             en.curse_timer = delay
             en.curse_damage = int(b.damage * curse_mult + b.damage * bonus)
             
             # Curse vulnerability
-            if getattr(en, "cursed", False) and getattr(p, "curse_vulnerability", 0) > 0:
+            if en.cursed and p.stats.curse_vulnerability > 0:
                 extra_damage += int(b.damage * p.curse_vulnerability)
             
             en.cursed = True
@@ -277,50 +270,55 @@ class CombatManager:
                     b.pierce_left -= 1
                     if b.pierce_left < 0 and b in self.bullets:
                         self.game.bullets.remove(b)
+                        BULLET_POOL.release(b)
                 else:
                     if b in self.bullets:
                         self.game.bullets.remove(b)
+                        BULLET_POOL.release(b)
             else:
                 if b.pierce_left > 0:
                     b.pierce_left -= 1
                 else:
                     if b in self.bullets:
                         self.game.bullets.remove(b)
+                        BULLET_POOL.release(b)
         else:
             if b in self.bullets:
                 self.game.bullets.remove(b)
+                BULLET_POOL.release(b)
     
     def _handle_enemy_death(self, en, enemy_was_cursed: bool = False, enemy_was_frozen: bool = False):
         """Handle enemy death - drops, effects, etc."""
         from audio import audio
         
-        self.game.kills += 1
-        self.player.kills += 1
+        # Merged elites count as every enemy folded into them
+        self.game.kills += en.reward
+        self.player.kills += en.reward
         
         # Upgrade manager tracking
-        upgrade_mgr = getattr(self.player, "upgrade_manager", None)
+        upgrade_mgr = self.player.upgrade_manager
         if upgrade_mgr:
             upgrade_mgr.on_kill(
                 enemy_was_cursed=enemy_was_cursed,
-                enemy_was_frozen=getattr(en, "frozen_timer", 0) > 0
+                enemy_was_frozen=en.frozen_timer > 0
             )
         
         # Drop XP
-        self.game.orbs.append(XPOrb(en.x, en.y, XP_PER_ORB))
+        self.game.orb_field.drop(en.x, en.y, XP_PER_ORB * en.reward)
         
         # Chance for gas pickup
-        if random.random() < 0.05:
-            self.game.gas_pickups.append(GasPickup(en.x, en.y))
+        if self.rng.loot.random() < 0.05:
+            self.game.gas_pickups.append(GAS_POOL.acquire(en.x, en.y))
         
         # Splinter on kill
-        if getattr(self.player, "splinter_on_kill", False):
+        if self.player.stats.splinter_on_kill:
             self._spawn_splinter_bullets(en)
         
         # Shatter (frozen enemy explosion)
-        if getattr(en, "frozen_timer", 0) > 0:
-            shatter_ratio = getattr(self.player, "shatter_damage_ratio", 0)
+        if en.frozen_timer > 0:
+            shatter_ratio = self.player.stats.shatter_damage_ratio
             if shatter_ratio > 0:
-                max_hp = getattr(en, "max_hp", 100)
+                max_hp = en.max_hp
                 shatter_damage = int(max_hp * shatter_ratio)
                 self._apply_area_damage(en.x, en.y, 80, shatter_damage, exclude=en)
         
@@ -336,7 +334,7 @@ class CombatManager:
                     other.burn_dps = max(other.burn_dps, self.player.damage * 0.2 * self.player.burn_bonus_mult)
         
         # Boss drops
-        if getattr(en, "kind", "") == "boss":
+        if en.kind_id == KIND_BOSS:
             self.game._spawn_evolution_pickup(en.x, en.y)
             audio.play_sfx(audio.snd_boss_explosion)
         
@@ -346,21 +344,22 @@ class CombatManager:
         # Remove from list
         if en in self.enemies:
             self.game.enemies.remove(en)
+            ENEMY_POOL.release(en)
     
     def _spawn_splinter_bullets(self, en):
         """Spawn splinter bullets when enemy dies."""
-        count = getattr(self.player, "splinter_count", 3)
-        damage_ratio = getattr(self.player, "splinter_damage_ratio", 0.10)
+        count = self.player.stats.splinter_count
+        damage_ratio = self.player.stats.splinter_damage_ratio
         damage = int(self.player.damage * damage_ratio)
         
         for i in range(count):
-            ang = math.tau * i / count + random.uniform(-0.2, 0.2)
+            ang = math.tau * i / count + self.rng.combat.uniform(-0.2, 0.2)
             vx = math.cos(ang)
             vy = math.sin(ang)
-            b = Bullet(
+            b = BULLET_POOL.acquire(
                 en.x, en.y, vx, vy, damage,
                 self.player.bullet_speed * 0.8,
-                status=self.player.bullet_status.copy()
+                status=self.player.bullet_status
             )
             b.piercing = False
             self.game.bullets.append(b)
@@ -378,7 +377,7 @@ class CombatManager:
                 en.flash_timer = 0.1
                 
                 self.game.damage_texts.append({
-                    "x": en.x + random.uniform(-4, 4),
+                    "x": en.x + self.rng.fx.uniform(-4, 4),
                     "y": en.y - 8,
                     "val": damage,
                     "life": 0.5,
@@ -398,13 +397,13 @@ class CombatManager:
                 continue
             
             # Check dodge
-            upgrade_mgr = getattr(self.player, "upgrade_manager", None)
+            upgrade_mgr = self.player.upgrade_manager
             if upgrade_mgr and upgrade_mgr.check_dodge():
                 continue
             
             if self.player.invuln <= 0:
                 # Apply body damage to enemy if player has it
-                body_damage = getattr(self.player, "body_damage", 0)
+                body_damage = self.player.stats.body_damage
                 if body_damage > 0:
                     en.hp -= body_damage
                     en.flash_timer = 0.1
@@ -451,7 +450,7 @@ class CombatManager:
                     en.hp -= dmg
                     
                     self.game.damage_texts.append({
-                        "x": en.x + random.uniform(-4, 4),
+                        "x": en.x + self.rng.fx.uniform(-4, 4),
                         "y": en.y - 8,
                         "val": max(1, int(dmg + 0.5)),
                         "life": 0.5,
@@ -460,8 +459,8 @@ class CombatManager:
                     self.game._spawn_status_fx(en.x, en.y, kind="fire")
                     
                     # Soothing Warmth - chance to heal from burn
-                    heal_chance = getattr(self.player, "burn_heal_chance", 0)
-                    if heal_chance > 0 and random.random() < heal_chance:
+                    heal_chance = self.player.stats.burn_heal_chance
+                    if heal_chance > 0 and self.rng.combat.random() < heal_chance:
                         self.player.heal(1)
             
             # Poison
@@ -473,7 +472,7 @@ class CombatManager:
                     en.hp -= dmg
                     
                     self.game.damage_texts.append({
-                        "x": en.x + random.uniform(-4, 4),
+                        "x": en.x + self.rng.fx.uniform(-4, 4),
                         "y": en.y - 8,
                         "val": max(1, int(dmg + 0.5)),
                         "life": 0.5,
@@ -490,7 +489,7 @@ class CombatManager:
                     en.hp -= dmg
                     
                     self.game.damage_texts.append({
-                        "x": en.x + random.uniform(-4, 4),
+                        "x": en.x + self.rng.fx.uniform(-4, 4),
                         "y": en.y - 8,
                         "val": max(1, int(dmg + 0.5)),
                         "life": 0.5,
@@ -502,13 +501,13 @@ class CombatManager:
             if hasattr(en, "curse_timer") and en.curse_timer > 0:
                 en.curse_timer -= dt
                 if en.curse_timer <= 0:
-                    en.hp -= getattr(en, "curse_damage", 0)
+                    en.hp -= en.curse_damage
                     en.flash_timer = 0.15
                     
                     self.game.damage_texts.append({
                         "x": en.x,
                         "y": en.y - 12,
-                        "val": getattr(en, "curse_damage", 0),
+                        "val": en.curse_damage,
                         "life": 0.6,
                         "color": (180, 100, 255)
                     })
@@ -517,7 +516,7 @@ class CombatManager:
         """Handle deaths from DoT effects."""
         for en in list(self.enemies):
             if en.hp <= 0:
-                enemy_was_cursed = getattr(en, "cursed", False)
+                enemy_was_cursed = en.cursed
                 self._handle_enemy_death(en, enemy_was_cursed=enemy_was_cursed)
     
     def update_aura_damage(self, dt: float):
@@ -531,7 +530,7 @@ class CombatManager:
             dy = en.y - self.player.y
             if dx * dx + dy * dy <= rad_sq:
                 en.hp -= self.player.aura_dps * dt
-                if random.random() < 0.15:
+                if self.rng.fx.random() < 0.15:
                     self.game._emit_status_particle(en, "fire")
     
     def fire_lightning(self, damage: int, area_mult: float = 1.0, targets: int = 1):
@@ -573,33 +572,33 @@ class CombatManager:
         steps = 8
         for i in range(steps):
             t = i / max(1, steps - 1)
-            px = x1 + (x2 - x1) * t + random.uniform(-10, 10)
-            py = y1 + (y2 - y1) * t + random.uniform(-10, 10)
+            px = x1 + (x2 - x1) * t + self.rng.fx.uniform(-10, 10)
+            py = y1 + (y2 - y1) * t + self.rng.fx.uniform(-10, 10)
             
             self.game.status_particles.append({
                 "x": px,
                 "y": py,
-                "vx": random.uniform(-5, 5),
-                "vy": random.uniform(-5, 5),
+                "vx": self.rng.fx.uniform(-5, 5),
+                "vy": self.rng.fx.uniform(-5, 5),
                 "life": 0.0,
                 "life_max": 0.15,
                 "color": (255, 255, 150),
                 "kind": "spark",
-                "size": random.uniform(3, 5)
+                "size": self.rng.fx.uniform(3, 5)
             })
     
     def fire_gale(self, direction: Tuple[float, float] = None):
         """Fire a gale attack."""
         p = self.player
-        damage = getattr(p, "gale_damage", 20)
+        damage = p.stats.gale_damage
         
         # Scale with speed if applicable
-        if getattr(p, "gale_scales_speed", False):
+        if p.stats.gale_scales_speed:
             speed_mult = p.speed / 5.0
             damage = int(damage * speed_mult)
         
         # Center damage multiplier
-        center_mult = getattr(p, "gale_center_damage_mult", 1.0)
+        center_mult = p.stats.gale_center_damage_mult
         
         # Apply to nearby enemies
         gale_radius = 150
@@ -673,10 +672,10 @@ class CombatManager:
             vx = math.cos(ang)
             vy = math.sin(ang)
             
-            b = Bullet(
+            b = BULLET_POOL.acquire(
                 self.player.x, self.player.y,
                 vx, vy, damage, self.player.bullet_speed,
-                status=self.player.bullet_status.copy()
+                status=self.player.bullet_status
             )
             b.piercing = self.player.piercing
             if self.player.pierce_mode == "corpse":
@@ -706,7 +705,7 @@ class CombatManager:
             vy = math.sin(ang)
             
             status = {"ice": True, "burn": False, "poison": False}
-            b = Bullet(
+            b = BULLET_POOL.acquire(
                 self.player.x, self.player.y,
                 vx, vy, damage, self.player.bullet_speed * 1.2,
                 status=status
@@ -719,7 +718,7 @@ class CombatManager:
     
     def update_glare_damage(self, dt: float):
         """Apply glare damage to enemies in vision range."""
-        upgrade_mgr = getattr(self.player, "upgrade_manager", None)
+        upgrade_mgr = self.player.upgrade_manager
         if not upgrade_mgr:
             return
         
@@ -727,7 +726,7 @@ class CombatManager:
         if damage <= 0:
             return
         
-        vision_range = getattr(self.player, "vision_range", 400)
+        vision_range = self.player.stats.vision_range
         range_sq = vision_range * vision_range
         
         for en in self.enemies:
@@ -737,7 +736,7 @@ class CombatManager:
                 en.hp -= damage
                 
                 # Apply on-hit effects if glare_on_hit
-                if getattr(self.player, "glare_on_hit", False):
+                if self.player.stats.glare_on_hit:
                     # Apply status from bullet_status
                     if self.player.bullet_status.get("burn"):
                         en.burn_timer = max(en.burn_timer, 1.0)
@@ -4,6 +4,12 @@ import math
 WIDTH, HEIGHT = 1280, 720
 FPS = 60
 
+# Fixed-step simulation: the game always ticks at FPS, the display may run faster
+SIM_DT = 1.0 / FPS
+MAX_SIM_STEPS = 5           # sim ticks per rendered frame before the backlog is dropped
+MAX_FRAME_TIME = 0.25       # longest frame (s) fed into the accumulator
+RENDER_FPS = 144            # display frame cap
+
 COLOR_BG = (5, 5, 20)
 COLOR_WHITE = (240, 240, 240)
 COLOR_GRAY = (120, 120, 150)
@@ -40,7 +46,16 @@ ENEMY_BASE_HP = 30
 ENEMY_BASE_SPEED = 2.0
 ENEMY_SPAWN_RATE = 1.0
 
+# Enemy population limits (see game_population.PopulationManager)
+ENEMY_BUDGET = 220          # live enemies before weak ones get merged into elites
+ENEMY_HARD_CAP = 320        # spawns are dropped above this
+ENEMY_LEASH_DIST = 1600     # enemies further than this are moved back onto the spawn ring
+MINION_CAP = 40             # max live summoner minions
+BULLET_BUDGET = 600         # live player bullets before lens duplicates merge into their parent
+
 XP_PER_ORB = 10
+# (min xp, radius) for merged XP orbs (see game_orbs.OrbField), largest first
+XP_ORB_TIERS = ((1000, XP_RADIUS + 10), (200, XP_RADIUS + 6), (50, XP_RADIUS + 3))
 XP_PER_LEVEL = 40
 XP_LEVEL_GROWTH = 1.35
 
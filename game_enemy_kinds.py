@@ -0,0 +1,89 @@
+"""
+Game Enemy Kinds Module - Integer enemy kinds and per-kind behaviour table
+==========================================================================
+Enemies keep their ``kind`` string (spawn tables and templates are keyed by
+it), but every hot path dispatches on ``Enemy.kind_id``: an ``EnemyKind``
+value with ``ELITE_BIT`` set for elites. ``KIND_TABLE[kind_id]`` holds the
+radius, colour, behaviour flags and push mass of each kind, elite variants
+included, so no per-frame code has to parse ``"elite_"`` prefixes.
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+
+from game_constants import (
+    ENEMY_RADIUS,
+    COLOR_ENEMY,
+    COLOR_ENEMY_TANK,
+    COLOR_ENEMY_FAST,
+)
+
+
+class EnemyKind(IntEnum):
+    NORMAL = 0
+    FAST = 1
+    TANK = 2
+    SHOOTER = 3
+    SPRINTER = 4
+    BRUISER = 5
+    CHARGER = 6
+    SUMMONER = 7
+    MINION = 8
+    BOSS = 9
+
+
+ELITE_BIT = 0x10
+KIND_MASK = ELITE_BIT - 1
+
+# Plain-int aliases for hot loops: EnemyKind attribute access goes through the
+# enum machinery and costs ~10x an int comparison
+KIND_MINION = int(EnemyKind.MINION)
+KIND_BOSS = int(EnemyKind.BOSS)
+
+
+@dataclass(frozen=True, slots=True)
+class KindInfo:
+    """Static per-kind data. ``mass`` sets how hard a kind is to shove apart."""
+    name: str
+    radius: int
+    color: tuple
+    shooter: bool = False
+    summoner: bool = False
+    charger: bool = False
+    boss: bool = False
+    elite: bool = False
+    mass: float = 1.0
+
+
+_BASE_KINDS = {
+    EnemyKind.NORMAL: KindInfo("normal", ENEMY_RADIUS, COLOR_ENEMY),
+    EnemyKind.FAST: KindInfo("fast", ENEMY_RADIUS, COLOR_ENEMY_FAST),
+    EnemyKind.TANK: KindInfo("tank", int(ENEMY_RADIUS * 1.3), COLOR_ENEMY_TANK),
+    EnemyKind.SHOOTER: KindInfo("shooter", ENEMY_RADIUS, (180, 120, 255), shooter=True),
+    EnemyKind.SPRINTER: KindInfo("sprinter", int(ENEMY_RADIUS * 0.9), (255, 160, 160)),
+    EnemyKind.BRUISER: KindInfo("bruiser", int(ENEMY_RADIUS * 1.4), (200, 90, 60)),
+    EnemyKind.CHARGER: KindInfo("charger", int(ENEMY_RADIUS * 1.2), (255, 200, 80), charger=True),
+    EnemyKind.SUMMONER: KindInfo("summoner", int(ENEMY_RADIUS * 1.3), (120, 80, 180), summoner=True),
+    EnemyKind.MINION: KindInfo("minion", ENEMY_RADIUS, (160, 100, 200)),
+    EnemyKind.BOSS: KindInfo("boss", int(ENEMY_RADIUS * 2.2), (255, 90, 180), boss=True, mass=4.0),
+}
+
+# Boss colour for early stages; later stages use the KIND_TABLE colour
+BOSS_STAGE_COLORS = {1: (255, 160, 60), 2: (255, 110, 110)}
+
+# Indexed by kind_id (base kind, optionally | ELITE_BIT)
+KIND_TABLE = [_BASE_KINDS[EnemyKind.NORMAL]] * (ELITE_BIT * 2)
+KIND_IDS = {}
+for _kind, _info in _BASE_KINDS.items():
+    KIND_TABLE[_kind] = _info
+    KIND_TABLE[_kind | ELITE_BIT] = KindInfo(
+        "elite_" + _info.name, _info.radius, _info.color, _info.shooter,
+        _info.summoner, _info.charger, _info.boss, True, _info.mass,
+    )
+    KIND_IDS[_info.name] = int(_kind)
+    KIND_IDS["elite_" + _info.name] = _kind | ELITE_BIT
+
+
+def kind_id_for(kind: str) -> int:
+    """kind string ("tank", "elite_tank", ...) -> kind_id. Unknown kinds are NORMAL."""
+    return KIND_IDS.get(kind, int(EnemyKind.NORMAL))
@@ -7,9 +7,9 @@ from game_constants import (
     FPS,
     WORLD_SIZE,
     PLAYER_RADIUS,
-    ENEMY_RADIUS,
     BULLET_RADIUS,
     XP_RADIUS,
+    XP_ORB_TIERS,
     GAS_RADIUS,
     ENEMY_BASE_HP,
     ENEMY_BASE_SPEED,
@@ -17,18 +17,35 @@ from game_constants import (
     XP_LEVEL_GROWTH,
     COLOR_PLAYER,
     COLOR_WHITE,
+    COLOR_BULLET,
+    COLOR_XP,
+    COLOR_GAS,
     clamp,
 )
+from game_pools import EntityPool
+from game_enemy_kinds import ELITE_BIT, KIND_TABLE, kind_id_for
+from game_sprites import ENEMY_SPRITES
+from game_stats import PlayerStats
 
 
 class Bullet:
+    __slots__ = (
+        "uid", "x", "y", "prev_x", "prev_y", "vx", "vy", "damage", "radius",
+        "piercing", "pierce_left", "pierce_on_kill", "infinite_pierce",
+        "status", "target", "guidance_disabled", "passed_through_lens",
+        "bounces_left", "bounced_enemies", "splinter", "is_ice_shard",
+    )
     _uid = 0
 
     def __init__(self, x, y, vx, vy, damage, speed, status=None):
+        self.status = {}
+        self.reset(x, y, vx, vy, damage, speed, status)
+
+    def reset(self, x, y, vx, vy, damage, speed, status=None):
         Bullet._uid += 1
         self.uid = Bullet._uid
-        self.x = x
-        self.y = y
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
         l = math.hypot(vx, vy) or 1
         self.vx = vx / l * speed
         self.vy = vy / l * speed
@@ -37,8 +54,18 @@ class Bullet:
         self.piercing = False
         self.pierce_left = 0
         self.pierce_on_kill = False
-        self.status = status or {}
-        self.target = None
+        self.infinite_pierce = False
+        # Bullets own their status dict so callers never need to copy it
+        self.status.clear()
+        if status:
+            self.status.update(status)
+        self.target = None  # (enemy, enemy uid) while homing
+        self.guidance_disabled = False
+        self.passed_through_lens = False
+        self.bounces_left = 0
+        self.bounced_enemies = None  # set() once bounce is initialized
+        self.splinter = False
+        self.is_ice_shard = False
 
     def update(self, dt):
         self.x += self.vx * dt * FPS
@@ -47,7 +74,7 @@ class Bullet:
     def draw(self, surf, cam):
         sx = int(self.x - cam[0])
         sy = int(self.y - cam[1])
-        pygame.draw.circle(surf, (255, 240, 120), (sx, sy), self.radius)
+        pygame.draw.circle(surf, COLOR_BULLET, (sx, sy), self.radius)
 
     def offscreen(self, cam):
         sx = self.x - cam[0]
@@ -57,36 +84,49 @@ class Bullet:
 
 
 class Enemy:
+    __slots__ = (
+        "uid", "x", "y", "prev_x", "prev_y", "hp", "max_hp", "speed", "radius", "kind", "kind_id", "boss_stage",
+        "flash_timer", "aura_iframes", "hit_sources", "knockback_pause", "knockback_slow",
+        "charge_timer", "summon_timer", "shoot_cd", "summon_cd",
+        "charge_cd", "charging", "charge_duration",
+        "ice_timer", "burn_timer", "poison_timer",
+        "burn_dps", "poison_dps", "ice_dps",
+        "burn_tick", "poison_tick", "ice_tick",
+        "curse_timer", "curse_damage", "cursed", "frozen_timer",
+        "lod_tier", "lod_dt", "lod_wait", "reward",
+    )
+    _uid = 0
+
     def __init__(self, x, y, hp, speed, kind="normal", boss_stage=0):
-        self.x = x
-        self.y = y
+        self.hit_sources = {}
+        self.reset(x, y, hp, speed, kind, boss_stage)
+
+    def reset(self, x, y, hp, speed, kind="normal", boss_stage=0):
+        # Pooled enemies are reused as the same object: references that outlive
+        # a kill hold (enemy, uid) and treat a uid mismatch as "gone"
+        Enemy._uid += 1
+        self.uid = Enemy._uid
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
         self.hp = hp
         self.max_hp = hp  # Store initial HP for execute checks
         self.speed = speed
-        base_kind = kind.replace("elite_", "")
-        base_r = ENEMY_RADIUS
-        if base_kind == "boss":
-            base_r = int(ENEMY_RADIUS * 2.2)
-        elif base_kind == "bruiser":
-            base_r = int(ENEMY_RADIUS * 1.4)
-        elif base_kind == "sprinter":
-            base_r = int(ENEMY_RADIUS * 0.9)
-        elif base_kind == "charger":
-            base_r = int(ENEMY_RADIUS * 1.2)
-        elif base_kind == "summoner":
-            base_r = int(ENEMY_RADIUS * 1.3)
-        elif base_kind == "tank":
-            base_r = int(ENEMY_RADIUS * 1.3)
-        self.radius = base_r
         self.kind = kind
+        self.kind_id = kind_id_for(kind)
+        self.radius = KIND_TABLE[self.kind_id].radius
         self.boss_stage = boss_stage
         self.flash_timer = 0.0
         self.aura_iframes = 0.0
-        self.hit_sources = {}
+        self.hit_sources.clear()
         self.knockback_pause = 0.0
         self.knockback_slow = 0.0
         self.charge_timer = 0.0  # For charger enemies
         self.summon_timer = 0.0  # For summoner enemies
+        self.shoot_cd = None  # Rolled on first update for shooters
+        self.summon_cd = None  # Rolled on first update for summoners
+        self.charge_cd = None
+        self.charging = False
+        self.charge_duration = 0.0
         self.ice_timer = 0.0
         self.burn_timer = 0.0
         self.poison_timer = 0.0
@@ -96,6 +136,14 @@ class Enemy:
         self.burn_tick = 0.0
         self.poison_tick = 0.0
         self.ice_tick = 0.0
+        self.curse_timer = 0.0
+        self.curse_damage = 0
+        self.cursed = False
+        self.frozen_timer = 0.0
+        self.lod_tier = 0  # game_lod.LOD_NEAR
+        self.lod_dt = 0.0  # dt accumulated while ticking at a reduced rate
+        self.lod_wait = 0  # frames until the next reduced-rate tick
+        self.reward = 1  # kills (and XP drops) this enemy is worth; merged elites carry more
 
     def update(self, dt, player_pos):
         if self.flash_timer > 0:
@@ -141,8 +189,7 @@ class Enemy:
             speed_mult *= 0.55
         
         # Special behavior for charger enemies
-        base_kind = self.kind.replace("elite_", "")
-        if base_kind == "charger":
+        if KIND_TABLE[self.kind_id].charger:
             self.charge_timer -= dt
             if self.charge_timer <= 0:
                 # Charging - move faster toward player
@@ -156,87 +203,56 @@ class Enemy:
         self.x += dx / l * self.speed * speed_mult * dt * FPS
         self.y += dy / l * self.speed * speed_mult * dt * FPS
 
-    def draw(self, surf, cam):
-        from game_constants import (
-            COLOR_ENEMY_TANK,
-            COLOR_ENEMY_FAST,
-            COLOR_ENEMY,
-        )
+    def make_elite(self):
+        """Promote to the elite variant of the current kind."""
+        if not self.kind_id & ELITE_BIT:
+            self.kind = "elite_" + self.kind
+            self.kind_id |= ELITE_BIT
 
-        sx = int(self.x - cam[0])
-        sy = int(self.y - cam[1])
-        base_kind = self.kind.replace("elite_", "")
-        is_elite = self.kind.startswith("elite_")
-        
-        if base_kind == "tank":
-            col = COLOR_ENEMY_TANK
-        elif base_kind == "fast":
-            col = COLOR_ENEMY_FAST
-        elif base_kind == "shooter":
-            col = (180, 120, 255)
-        elif base_kind == "sprinter":
-            col = (255, 160, 160)
-        elif base_kind == "bruiser":
-            col = (200, 90, 60)
-        elif base_kind == "charger":
-            col = (255, 200, 80)
-        elif base_kind == "summoner":
-            col = (120, 80, 180)
-        elif base_kind == "boss":
-            if self.boss_stage == 1:
-                col = (255, 160, 60)
-            elif self.boss_stage == 2:
-                col = (255, 110, 110)
-            else:
-                col = (255, 90, 180)
-        elif base_kind == "minion":
-            col = (160, 100, 200)
-        else:
-            col = COLOR_ENEMY
-        if self.flash_timer > 0:
-            col = COLOR_WHITE
-        pygame.draw.circle(surf, col, (sx, sy), self.radius)
-        # Elite glow
-        if is_elite and self.flash_timer <= 0:
-            pygame.draw.circle(surf, (255, 255, 100), (sx, sy), self.radius + 4, width=2)
+    def draw(self, surf, cam):
+        sprite, half = ENEMY_SPRITES.get(self)
+        surf.blit(sprite, (int(self.x - cam[0]) - half, int(self.y - cam[1]) - half))
 
 
 class XPOrb:
+    __slots__ = ("x", "y", "prev_x", "prev_y", "radius", "xp")
+
     def __init__(self, x, y, xp):
-        self.x = x
-        self.y = y
+        self.reset(x, y, xp)
+
+    def reset(self, x, y, xp):
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
         self.radius = XP_RADIUS
         self.xp = xp
 
-    def update(self, dt, player):
-        px, py = player.x, player.y
-        dx = px - self.x
-        dy = py - self.y
-        d = math.hypot(dx, dy) or 1
-        magnet = getattr(player, "magnet_range", 160)
-        if d < magnet:
-            speed = clamp(8 + (magnet - d) * 0.06, 10, 26)
-            self.x += dx / d * speed * dt * FPS
-            self.y += dy / d * speed * dt * FPS
+    def absorb(self, xp):
+        """Merge another drop into this orb, growing it through XP_ORB_TIERS."""
+        self.xp += xp
+        for min_xp, radius in XP_ORB_TIERS:
+            if self.xp >= min_xp:
+                self.radius = radius
+                break
 
     def draw(self, surf, cam):
-        from game_constants import COLOR_XP
-
         sx = int(self.x - cam[0])
         sy = int(self.y - cam[1])
         pygame.draw.circle(surf, COLOR_XP, (sx, sy), self.radius)
 
 
 class GasPickup:
+    __slots__ = ("x", "y", "radius", "duration")
+
     def __init__(self, x, y, duration=3.0):
+        self.reset(x, y, duration)
+
+    def reset(self, x, y, duration=3.0):
         self.x = x
         self.y = y
         self.radius = GAS_RADIUS
         self.duration = duration
 
     def draw(self, surf, cam):
-        from game_constants import COLOR_GAS
-
         sx = int(self.x - cam[0])
         sy = int(self.y - cam[1])
         pygame.draw.circle(surf, COLOR_GAS, (sx, sy), self.radius, width=2)
@@ -256,10 +272,16 @@ class EvolutionPickup:
         pygame.draw.circle(surf, (255, 120, 50), (sx, sy), max(1, self.radius - 6), width=0)
 
 
+BULLET_POOL = EntityPool(Bullet, "bullet")
+ENEMY_POOL = EntityPool(Enemy, "enemy")
+XP_ORB_POOL = EntityPool(XPOrb, "orb")
+GAS_POOL = EntityPool(GasPickup, "gas")
+
+
 class Player:
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
         self.radius = PLAYER_RADIUS
         self.base_radius = PLAYER_RADIUS  # For size multiplier effects
 
@@ -523,6 +545,17 @@ class Player:
         self.xp_fire_rate_bonus = 0
         self.xp_fire_rate_duration = 1.0
 
+        # Live state that upgrades top up (not part of the stat snapshot)
+        self.shield_hp = 0
+        self.upgrade_manager = None
+
+        # Compiled snapshot read by hot loops; see refresh_stats()
+        self.stats = PlayerStats.capture(self)
+
+    def refresh_stats(self):
+        """Rebuild the stat snapshot after upgrades/evolutions/gas change stats."""
+        self.stats = PlayerStats.capture(self)
+
     @property
     def hp(self):
         return self.hearts
@@ -544,7 +577,7 @@ class Player:
             if self.reload_timer <= 0:
                 self.ammo = self.mag_size
                 # Notify upgrade manager of reload completion
-                if hasattr(self, "upgrade_manager") and self.upgrade_manager:
+                if self.upgrade_manager:
                     self.upgrade_manager.on_reload()
         else:
             was_reloading = False
@@ -555,6 +588,7 @@ class Player:
                 self.speed = self.base_speed
                 self.fire_rate = 5.0
                 self.fire_cd = 1.0 / self.fire_rate
+                self.refresh_stats()
 
         vx = 0
         vy = 0
@@ -620,9 +654,10 @@ class Player:
         base_angle = math.atan2(dy, dx)
         
         # Get cannon configuration for Diep.io style directional shooting
-        cannon_count = max(1, int(getattr(self, "cannon_count", 1)))
-        cannon_pattern = getattr(self, "cannon_pattern", "forward")
-        has_rear = getattr(self, "has_rear_cannon", False)
+        stats = self.stats
+        cannon_count = max(1, int(stats.cannon_count))
+        cannon_pattern = stats.cannon_pattern
+        has_rear = stats.has_rear_cannon
         
         # Calculate firing angles based on cannon configuration
         angles = []
@@ -664,7 +699,7 @@ class Player:
         for a in angles:
             vx = math.cos(a)
             vy = math.sin(a)
-            b = Bullet(self.x, self.y, vx, vy, self.damage, self.bullet_speed, status=status.copy())
+            b = BULLET_POOL.acquire(self.x, self.y, vx, vy, self.damage, self.bullet_speed, status=status)
             # Apply bullet size multiplier
             b.radius = int(BULLET_RADIUS * self.bullet_size_mult)
             b.piercing = self.piercing
@@ -684,7 +719,7 @@ class Player:
                 offset = math.radians(6 * (i - extras // 2)) if extras > 1 else 0
                 vx = math.cos(back_angle + offset)
                 vy = math.sin(back_angle + offset)
-                b = Bullet(self.x, self.y, vx, vy, self.damage, self.bullet_speed, status=status.copy())
+                b = BULLET_POOL.acquire(self.x, self.y, vx, vy, self.damage, self.bullet_speed, status=status)
                 b.radius = int(BULLET_RADIUS * self.bullet_size_mult)
                 b.piercing = self.piercing
                 if self.pierce_mode == "corpse":
@@ -723,7 +758,7 @@ class Player:
             ang = math.atan2(my - py, mx - px)
         
         # Apply shoot shrink effect for impact feel
-        shrink_amt = getattr(self, "shoot_shrink", 0) * 0.15  # Max 15% shrink
+        shrink_amt = self.shoot_shrink * 0.15  # Max 15% shrink
         r = int(self.radius * (1.0 - shrink_amt))
         
         if self.invuln > 0 and int(self.invuln * 15) % 2 == 0:
@@ -731,16 +766,17 @@ class Player:
         color = COLOR_WHITE if self.hit_flash > 0 else COLOR_PLAYER
         
         # Get cannon count from upgrades
-        cannon_count = max(1, int(getattr(self, "cannon_count", 1)))
-        cannon_pattern = getattr(self, "cannon_pattern", "forward")
-        has_rear = getattr(self, "has_rear_cannon", False)
+        stats = self.stats
+        cannon_count = max(1, int(stats.cannon_count))
+        cannon_pattern = stats.cannon_pattern
+        has_rear = stats.has_rear_cannon
         
         # Draw cannons FIRST (behind player body) - Diep.io style rectangles
         self._draw_cannons(surf, px, py, ang, r, cannon_count, cannon_pattern, has_rear)
         
         # Draw exhaust triangle following movement direction (like boost particles)
         # UPSIDE DOWN: tip on body, base pointing outward behind movement
-        vdx, vdy = getattr(self, 'visual_dir', (0, -1))
+        vdx, vdy = self.visual_dir
         exhaust_ang = math.atan2(-vdy, -vdx)  # Opposite of movement direction
         # Tip is deeper inside the body
         tip_x = px + math.cos(exhaust_ang) * r * 0.4
@@ -759,10 +795,10 @@ class Player:
         pygame.draw.circle(surf, color, (px, py), r)  # Main body
         
         # Draw shield if active - C-shaped barrier facing mouse direction
-        shield_segments = getattr(self, "shield_segments", 0)
-        shield_hp = getattr(self, "shield_hp", 0)
+        shield_segments = stats.shield_segments
+        shield_hp = self.shield_hp
         if shield_segments > 0 and shield_hp > 0:
-            shield_radius = getattr(self, "shield_radius", 2.2) * r
+            shield_radius = stats.shield_radius * r
             # Draw a wide C-shaped shield facing the mouse
             # Arc spans about 200 degrees for wide coverage
             arc_span = math.pi * 1.1  # ~200 degrees - much wider
@@ -896,7 +932,7 @@ class Player:
             return
         
         # Shield absorbs damage first
-        shield_hp = getattr(self, "shield_hp", 0)
+        shield_hp = self.shield_hp
         if shield_hp > 0:
             self.shield_hp = shield_hp - 1
             self.invuln = 0.5  # Brief invuln after shield hit
@@ -918,6 +954,7 @@ class Player:
     def add_heart_container(self):
         self.max_hearts += 1
         self.hearts = self.max_hearts
+        self.refresh_stats()
 
     def add_xp(self, amt):
         self.xp += amt
@@ -935,6 +972,7 @@ class Player:
         self.speed = self.base_speed * self.gas_speed_mult
         self.fire_rate = 5.0 * self.gas_fire_mult
         self.fire_cd = 1.0 / self.fire_rate
+        self.refresh_stats()
 
     def rebuild_aura_orbs(self):
         # evenly redistribute aura orb angles when the set changes
@@ -0,0 +1,167 @@
+"""
+Game Frames Module - Per-run frame-time histogram and hitch recorder
+====================================================================
+Game.run feeds FrameStats every gameplay frame with its wall time (frame
+start to frame start, so the frame cap's sleep and vsync count too), and
+the update and draw parts of it. Each series goes into a fixed-bucket
+histogram (1 ms buckets up to 100 ms, then one overflow bucket), so a
+long run costs a few hundred ints. Percentiles are read off the buckets.
+
+A frame slower than HITCH_MS also keeps a snapshot of what was going on:
+entity counts, the quality level and the upgrades owned at that moment.
+
+At game over the game writes the summary to ``runs/<timestamp>.json``.
+With ``--frame-report`` it is also shown on the game-over screen.
+"""
+
+import json
+import os
+import platform
+import time
+from typing import TYPE_CHECKING
+
+import pygame
+
+if TYPE_CHECKING:
+    from game import Game
+
+
+class FrameHistogram:
+    """Fixed 1 ms buckets; the last bucket holds everything slower."""
+
+    BUCKET_MS = 1.0
+    BUCKETS = 100
+
+    def __init__(self):
+        self.counts = [0] * (self.BUCKETS + 1)
+        self.n = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms: float):
+        i = int(ms / self.BUCKET_MS)
+        self.counts[i if i < self.BUCKETS else self.BUCKETS] += 1
+        self.n += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, q: float) -> float:
+        """Upper edge of the bucket holding the ``q`` quantile (the max if it overflowed)."""
+        if not self.n:
+            return 0.0
+        rank = q * self.n
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c:
+                return self.max if i == self.BUCKETS else min(self.max, (i + 1) * self.BUCKET_MS)
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "p50": round(self.percentile(0.50), 2),
+            "p95": round(self.percentile(0.95), 2),
+            "p99": round(self.percentile(0.99), 2),
+            "max": round(self.max, 2),
+            "mean": round(self.total / self.n, 2) if self.n else 0.0,
+        }
+
+
+class FrameStats:
+    """Frame, update and draw histograms plus hitch snapshots for one run."""
+
+    HITCH_MS = 1000.0 / 30     # slower than two 60 Hz frames
+    MAX_HITCHES = 100          # snapshots kept; later hitches are only counted
+
+    def __init__(self, game: 'Game'):
+        self.game = game
+        self.reset()
+
+    def reset(self):
+        self.frame = FrameHistogram()
+        self.update = FrameHistogram()
+        self.draw = FrameHistogram()
+        self.hitches = []
+        self.hitch_count = 0
+        self.written = None     # path of the report once saved
+
+    def record(self, frame_ms: float, update_ms: float, draw_ms: float):
+        self.frame.add(frame_ms)
+        self.update.add(update_ms)
+        self.draw.add(draw_ms)
+        if frame_ms > self.HITCH_MS:
+            self.hitch_count += 1
+            if len(self.hitches) < self.MAX_HITCHES:
+                self.hitches.append(self._snapshot(frame_ms, update_ms, draw_ms))
+
+    def _snapshot(self, frame_ms: float, update_ms: float, draw_ms: float) -> dict:
+        g = self.game
+        return {
+            "t": round(g.elapsed_time, 2),
+            "frame_ms": round(frame_ms, 2),
+            "update_ms": round(update_ms, 2),
+            "draw_ms": round(draw_ms, 2),
+            "sim_steps": g.sim_steps,
+            "enemies": len(g.enemies),
+            "bullets": len(g.bullets),
+            "enemy_bullets": len(g.enemy_bullets),
+            "orbs": len(g.orbs),
+            "sleeping_orbs": g.orb_field.sleeping,
+            "particles": len(g.status_particles) + len(g.boost_particles),
+            "damage_texts": len(g.damage_texts),
+            "quality": g.quality.level,
+            "level": g.player.level,
+            "upgrades": sorted(g.upgrade_manager.owned_upgrades),
+        }
+
+    def report(self) -> dict:
+        g = self.game
+        return {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": g.rng.seed,
+            "survived": round(g.elapsed_time, 2),
+            "kills": g.kills,
+            "level": g.player.level,
+            "upgrades": sorted(g.upgrade_manager.owned_upgrades),
+            "machine": {
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "cpus": os.cpu_count(),
+                "window": [g.w, g.h],
+                "pipelined": g.pipelined,
+            },
+            "frames": self.frame.n,
+            "frame_ms": self.frame.summary(),
+            "update_ms": self.update.summary(),
+            "draw_ms": self.draw.summary(),
+            "histogram": {
+                "bucket_ms": FrameHistogram.BUCKET_MS,
+                "frame": self.frame.counts,
+                "update": self.update.counts,
+                "draw": self.draw.counts,
+            },
+            "hitch_ms": round(self.HITCH_MS, 2),
+            "hitch_count": self.hitch_count,
+            "hitches": self.hitches,
+        }
+
+    def save(self, directory: str) -> str:
+        """Write the report to ``directory/<timestamp>.json``; returns the path."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, time.strftime("%Y%m%d-%H%M%S") + ".json")
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+        self.written = path
+        return path
+
+    def summary_lines(self) -> list:
+        """Short summary for the game-over screen."""
+        f = self.frame.summary()
+        u = self.update.summary()
+        d = self.draw.summary()
+        return [
+            f"FRAMES {self.frame.n}  p50 {f['p50']:.1f}  p95 {f['p95']:.1f}  p99 {f['p99']:.1f}  max {f['max']:.1f} ms",
+            f"UPDATE p95 {u['p95']:.1f} ms  DRAW p95 {d['p95']:.1f} ms  HITCHES {self.hitch_count}",
+        ]
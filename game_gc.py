@@ -0,0 +1,103 @@
+"""
+Game GC Module - Garbage collection scheduled around gameplay
+=============================================================
+Tens of thousands of long-lived containers (the starfield, UPGRADES_BY_ID,
+the upgrade trees, fonts and UI) survive the whole process, and the cyclic
+collector kept rescanning them during play. Together with the per-frame
+churn of particles and damage numbers, that showed up as gen-2 pauses in
+the middle of fights. GCManager:
+
+- freezes everything alive after startup and at every run reset
+  (``gc.freeze``), so the collector never scans that data again
+- raises the collection thresholds while STATE_PLAYING, so collections
+  of the older generations effectively stop
+- runs a full collection at natural pauses instead: entering level-up,
+  evolution, pause or game over
+- times every collection, automatic or explicit, for the profiler
+"""
+
+import gc
+import time
+from collections import deque
+
+from game_constants import (
+    STATE_PLAYING,
+    STATE_LEVEL_UP,
+    STATE_EVOLUTION,
+    STATE_PAUSED,
+    STATE_GAME_OVER,
+)
+
+# States where a collection pause can't be seen: the world is frozen behind an overlay
+SAFE_STATES = (STATE_LEVEL_UP, STATE_EVOLUTION, STATE_PAUSED, STATE_GAME_OVER)
+
+
+class GCManager:
+    """Freezes static data, defers collections during play, times every pass."""
+
+    PLAY_THRESHOLDS = (20000, 50, 1000)
+    HISTORY = 120   # collections kept for the profiler
+
+    def __init__(self):
+        self.default_thresholds = gc.get_threshold()
+        self.state = None
+        self.safe_collections = 0
+        self.last_safe_ms = 0.0
+        self.auto_collections = [0, 0, 0]   # per generation
+        self.auto_ms = deque(maxlen=self.HISTORY)
+        self._t0 = None
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        # Explicit collections are timed by collect(); only count the automatic ones
+        if self._t0 is False:
+            return
+        if phase == "start":
+            self._t0 = time.perf_counter()
+        elif self._t0 is not None:
+            self.auto_collections[info["generation"]] += 1
+            self.auto_ms.append((time.perf_counter() - self._t0) * 1000.0)
+            self._t0 = None
+
+    @property
+    def auto_max_ms(self) -> float:
+        return max(self.auto_ms, default=0.0)
+
+    def collect(self) -> float:
+        """Full collection now; returns (and records) its duration in ms."""
+        self._t0 = False
+        t = time.perf_counter()
+        gc.collect()
+        self.last_safe_ms = (time.perf_counter() - t) * 1000.0
+        self._t0 = None
+        self.safe_collections += 1
+        return self.last_safe_ms
+
+    def freeze(self):
+        """Collect the previous run's garbage, then freeze everything still alive.
+
+        Unfreezing first lets cycles that were frozen last time, and have
+        since died, be collected instead of leaking.
+        """
+        gc.unfreeze()
+        self.collect()
+        gc.freeze()
+        # Profiler counts are per run
+        self.auto_collections = [0, 0, 0]
+        self.auto_ms.clear()
+
+    @property
+    def frozen(self) -> int:
+        return gc.get_freeze_count()
+
+    def tick(self, state: int):
+        """Follow the game state: play thresholds while playing, a collection on pausing."""
+        if state == self.state:
+            return
+        self.state = state
+        if state == STATE_PLAYING:
+            gc.set_threshold(*self.PLAY_THRESHOLDS)
+            return
+        gc.set_threshold(*self.default_thresholds)
+        if state in SAFE_STATES:
+            self.collect()
@@ -0,0 +1,103 @@
+"""
+Game LOD Module - Simulation level of detail for enemies
+========================================================
+Enemies are sorted into tiers against the camera rect every frame:
+
+- NEAR: on screen (plus a margin) and bosses. Full update every frame, take
+  part in separation and emit status particles.
+- MID: off screen. Updated every MID_INTERVAL frames with the accumulated dt,
+  no separation or particles.
+- FAR: well off screen. Advanced along their chase vector once every
+  FAR_INTERVAL frames with the accumulated dt.
+
+An enemy promoted back to NEAR first catches up on its accumulated dt, so
+positions and status timers stay consistent across tier changes.
+"""
+
+from typing import TYPE_CHECKING
+
+from game_enemy_kinds import KIND_BOSS
+
+if TYPE_CHECKING:
+    from game import Game
+
+
+LOD_NEAR = 0
+LOD_MID = 1
+LOD_FAR = 2
+
+
+class EnemyLOD:
+    """Tiered enemy updates driven by the camera rect."""
+
+    MID_INTERVAL = 3
+    FAR_INTERVAL = 8
+    NEAR_MARGIN = 120   # px outside the view still treated as on screen
+    FAR_MARGIN = 700    # px outside the view before an enemy counts as far
+
+    def __init__(self, game: 'Game'):
+        self.game = game
+        self.enabled = True
+        self.reset()
+
+    def reset(self):
+        """Drop per-run state so a seed plays out the same on every run."""
+        self.stagger = 0
+        self.near = []
+        self.counts = [0, 0, 0]
+
+    def update_enemies(self, dt: float, view_half_w: float, view_half_h: float):
+        """Classify enemies against the view and advance them by tier."""
+        enemies = self.game.enemies
+        px, py = self.game.player.x, self.game.player.y
+        player_pos = (px, py)
+
+        if not self.enabled:
+            for e in enemies:
+                e.update(dt, player_pos)
+            self.near = enemies
+            self.counts = [len(enemies), 0, 0]
+            return
+
+        near_w = view_half_w + self.NEAR_MARGIN
+        near_h = view_half_h + self.NEAR_MARGIN
+        far_w = view_half_w + self.FAR_MARGIN
+        far_h = view_half_h + self.FAR_MARGIN
+        near = []
+        counts = [0, 0, 0]
+        for e in enemies:
+            dx = abs(e.x - px)
+            dy = abs(e.y - py)
+            r = e.radius
+            if (dx < near_w + r and dy < near_h + r) or e.kind_id == KIND_BOSS:
+                if e.lod_dt > 0:
+                    # Promoted this frame: catch up on the skipped time
+                    e.update(e.lod_dt + dt, player_pos)
+                    e.lod_dt = 0.0
+                else:
+                    e.update(dt, player_pos)
+                e.lod_tier = LOD_NEAR
+                near.append(e)
+                counts[LOD_NEAR] += 1
+                continue
+
+            if dx < far_w and dy < far_h:
+                tier, interval = LOD_MID, self.MID_INTERVAL
+            else:
+                tier, interval = LOD_FAR, self.FAR_INTERVAL
+            if e.lod_tier == LOD_NEAR:
+                # Just left the screen (or spawned): stagger the first reduced
+                # tick so off-screen updates spread evenly over frames
+                e.lod_wait = 1 + self.stagger % interval
+                self.stagger += 1
+            e.lod_tier = tier
+            e.lod_dt += dt
+            e.lod_wait -= 1
+            if e.lod_wait <= 0:
+                e.update(e.lod_dt, player_pos)
+                e.lod_dt = 0.0
+                e.lod_wait = interval
+            counts[tier] += 1
+
+        self.near = near
+        self.counts = counts
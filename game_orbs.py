@@ -0,0 +1,168 @@
+"""
+Game Orbs Module - XP orb field with sleeping and merging orbs
+==============================================================
+Every kill drops an XP orb and nothing removes the orbs the player never
+reaches, so long runs used to move, interpolate and pickup-test thousands
+of static orbs every frame. Orbs only move inside the player's magnet
+range, so OrbField splits them in two:
+
+- awake: ``game.orbs``, the orbs within the wake range (magnet range plus a
+  margin). Only these are moved, interpolated and pickup-tested.
+- sleeping: everything else, bucketed in a uniform grid and never touched
+  per frame. A grid query around the player wakes orbs as it approaches,
+  and an awake orb left behind goes back to sleep.
+
+A drop or a newly sleeping orb landing next to a sleeping orb merges into
+it (XP is summed). Merged orbs grow through XP_ORB_TIERS so piles stay
+readable on screen.
+"""
+
+import math
+from typing import TYPE_CHECKING
+
+from game_constants import FPS, clamp
+from game_entities import XP_ORB_POOL
+
+if TYPE_CHECKING:
+    from game import Game
+
+
+class OrbField:
+    """Owns the run's XP orbs: awake list, sleeping grid, merging and pickup."""
+
+    CELL_SHIFT = 8      # 256 px grid cells
+    MERGE_RADIUS = 40   # px between orbs that merge
+    WAKE_MARGIN = 64    # wake orbs a little before they enter magnet range
+
+    def __init__(self, game: 'Game'):
+        self.game = game
+        self.cells = {}     # (cell_x, cell_y) -> [sleeping XPOrb]
+        self.sleeping = 0
+        self.merged = 0
+
+    def clear(self):
+        """Hand every sleeping orb back to the pool."""
+        for cell in self.cells.values():
+            XP_ORB_POOL.release_many(cell)
+        self.cells.clear()
+        self.sleeping = 0
+
+    def _cell(self, x: float, y: float) -> tuple:
+        return (int(x) >> self.CELL_SHIFT, int(y) >> self.CELL_SHIFT)
+
+    def _merge_into(self, cell, x: float, y: float, xp: int) -> bool:
+        """Add ``xp`` to a sleeping orb near (x, y) in ``cell``, if there is one."""
+        r2 = self.MERGE_RADIUS * self.MERGE_RADIUS
+        for o in cell:
+            dx = o.x - x
+            dy = o.y - y
+            if dx * dx + dy * dy <= r2:
+                o.absorb(xp)
+                self.merged += 1
+                return True
+        return False
+
+    def drop(self, x: float, y: float, xp: int):
+        """Drop XP at (x, y): merge into a sleeping orb nearby or spawn an awake one."""
+        cell = self.cells.get(self._cell(x, y))
+        if cell and self._merge_into(cell, x, y, xp):
+            return
+        self.game.orbs.append(XP_ORB_POOL.acquire(x, y, xp))
+
+    def _sleep(self, orb):
+        key = self._cell(orb.x, orb.y)
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = self.cells[key] = []
+        elif self._merge_into(cell, orb.x, orb.y, orb.xp):
+            XP_ORB_POOL.release(orb)
+            return
+        # Sleeping orbs don't move: nothing to interpolate
+        orb.prev_x = orb.x
+        orb.prev_y = orb.y
+        cell.append(orb)
+        self.sleeping += 1
+
+    def _wake_near(self, px: float, py: float, wake: float):
+        """Move sleeping orbs within ``wake`` of the player into the awake list."""
+        s = self.CELL_SHIFT
+        wake2 = wake * wake
+        awake = self.game.orbs
+        cells = self.cells
+        for cx in range(int(px - wake) >> s, (int(px + wake) >> s) + 1):
+            for cy in range(int(py - wake) >> s, (int(py + wake) >> s) + 1):
+                cell = cells.get((cx, cy))
+                if not cell:
+                    continue
+                keep = []
+                for o in cell:
+                    dx = px - o.x
+                    dy = py - o.y
+                    if dx * dx + dy * dy <= wake2:
+                        awake.append(o)
+                    else:
+                        keep.append(o)
+                if len(keep) != len(cell):
+                    self.sleeping -= len(cell) - len(keep)
+                    if keep:
+                        cells[(cx, cy)] = keep
+                    else:
+                        del cells[(cx, cy)]
+
+    def update(self, dt: float):
+        """Wake orbs near the player, pull the ones in magnet range, sleep the rest."""
+        p = self.game.player
+        px, py = p.x, p.y
+        magnet = p.stats.magnet_range
+        wake = magnet + self.WAKE_MARGIN
+        self._wake_near(px, py, wake)
+
+        wake2 = wake * wake
+        step = dt * FPS
+        awake = []
+        for o in self.game.orbs:
+            dx = px - o.x
+            dy = py - o.y
+            if dx * dx + dy * dy > wake2:
+                self._sleep(o)
+                continue
+            d = math.hypot(dx, dy) or 1
+            if d < magnet:
+                speed = clamp(8 + (magnet - d) * 0.06, 10, 26)
+                o.x += dx / d * speed * step
+                o.y += dy / d * speed * step
+            awake.append(o)
+        self.game.orbs = awake
+
+    def collect(self) -> tuple:
+        """Remove every awake orb touching the player; returns (xp, orbs picked up)."""
+        p = self.game.player
+        px, py, pr = p.x, p.y, p.radius
+        xp = 0
+        picked = []
+        keep = []
+        for o in self.game.orbs:
+            dx = px - o.x
+            dy = py - o.y
+            rr = pr + o.radius
+            if dx * dx + dy * dy <= rr * rr:
+                xp += o.xp
+                picked.append(o)
+            else:
+                keep.append(o)
+        if picked:
+            self.game.orbs = keep
+            XP_ORB_POOL.release_many(picked)
+        return xp, len(picked)
+
+    def sleeping_in_rect(self, x0: float, y0: float, x1: float, y1: float) -> list:
+        """Sleeping orbs in the grid cells overlapping a world rect (for drawing)."""
+        s = self.CELL_SHIFT
+        cells = self.cells
+        out = []
+        for cx in range(int(x0) >> s, (int(x1) >> s) + 1):
+            for cy in range(int(y0) >> s, (int(y1) >> s) + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    out.extend(cell)
+        return out
@@ -0,0 +1,96 @@
+"""
+Game Pipeline Module - Overlapping simulation with frame presentation
+=====================================================================
+Optional pipelined main loop (``game.py --pipelined``). While the main
+thread presents frame N (smoothscale to the window, ``display.flip`` and
+its vsync wait, all of which release the GIL), a worker thread runs the
+fixed-step ticks for frame N+1. The main thread then composes frame N+1
+once the worker is done.
+
+Ownership rule: between ``start()`` and ``wait()`` the sim thread owns
+every piece of Game state. The main thread may only touch the composed
+frame (``game.screen``) and the window. Anything else, including events,
+input polling and drawing, happens outside that window. Keyboard and mouse
+state is captured on the main thread before ``start()`` and replayed to
+every tick of the frame (SDL only refreshes it when events are pumped, so
+the ticks of one frame always saw the same values anyway).
+"""
+
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from game_constants import SIM_DT
+
+if TYPE_CHECKING:
+    from game import Game
+
+
+class FrozenInput:
+    """Input sampled once on the main thread, returned to every tick of a frame."""
+
+    __slots__ = ("sample",)
+
+    def __init__(self, sample):
+        self.sample = sample
+
+    def poll(self, game):
+        return self.sample
+
+
+class SimPipeline:
+    """Worker thread that runs a frame's sim ticks while the main thread presents."""
+
+    def __init__(self, game: 'Game'):
+        self.game = game
+        self._jobs = queue.SimpleQueue()
+        self._done = threading.Event()
+        self._done.set()
+        self._error = None
+        self._frozen_input = False
+        self.wait_ms = 0.0     # main-thread time spent waiting on the sim last frame
+        self._thread = threading.Thread(target=self._worker, name="sim", daemon=True)
+        self._thread.start()
+
+    def _worker(self):
+        while True:
+            steps = self._jobs.get()
+            if steps is None:
+                return
+            try:
+                update = self.game.update
+                for _ in range(steps):
+                    update(SIM_DT)
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                self._done.set()
+
+    def start(self, steps: int):
+        """Hand the Game to the sim thread for ``steps`` fixed ticks."""
+        if steps <= 0:
+            return
+        game = self.game
+        self._frozen_input = game.input_source is None
+        if self._frozen_input:
+            game.input_source = FrozenInput(game._poll_input())
+        self._done.clear()
+        self._jobs.put(steps)
+
+    def wait(self):
+        """Block until the sim thread hands the Game back; re-raises its errors."""
+        t0 = time.perf_counter()
+        self._done.wait()
+        self.wait_ms = (time.perf_counter() - t0) * 1000.0
+        if self._frozen_input:
+            self.game.input_source = None
+            self._frozen_input = False
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise err
+
+    def close(self):
+        self.wait()
+        self._jobs.put(None)
+        self._thread.join()
@@ -0,0 +1,79 @@
+"""
+Game Pools Module - Free lists for short-lived entities
+=======================================================
+Bullets, enemies, XP orbs and gas pickups are created and destroyed many
+times per second. Each pooled class provides a ``reset(...)`` method taking
+the same arguments as ``__init__``; dead instances are handed back to the
+pool and reinitialized on the next ``acquire``.
+
+Released objects sit in a pending list until ``flush()`` runs at the end of
+the frame, so an entity that dies mid-update is never handed out again while
+other code in the same frame can still see it.
+"""
+
+
+class EntityPool:
+    """Per-type free list with hit/miss counters for the profiler overlay."""
+
+    def __init__(self, cls, name: str, max_free: int = 4096):
+        self.cls = cls
+        self.name = name
+        self.max_free = max_free
+        self.free = []
+        self.pending = []
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        POOLS.append(self)
+
+    def acquire(self, *args, **kwargs):
+        """Return a recycled instance reset with the given args, or a new one."""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+            return obj
+        self.misses += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        """Hand a dead instance back; it becomes reusable after ``flush()``."""
+        self.pending.append(obj)
+        self.released += 1
+
+    def release_many(self, objs):
+        self.pending.extend(objs)
+        self.released += len(objs)
+
+    def flush(self):
+        """Move this frame's released instances onto the free list."""
+        if self.pending:
+            room = self.max_free - len(self.free)
+            if room > 0:
+                self.free.extend(self.pending[:room])
+            self.pending.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+
+
+# All pools, in creation order (used by flush_pools/pool_stats)
+POOLS = []
+
+
+def flush_pools():
+    """Flush every registered pool. Call once per frame after the update."""
+    for pool in POOLS:
+        pool.flush()
+
+
+def pool_stats() -> list:
+    """Return (name, hit_rate, hits, misses, free) for every pool."""
+    return [(p.name, p.hit_rate, p.hits, p.misses, len(p.free)) for p in POOLS]
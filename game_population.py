@@ -0,0 +1,167 @@
+"""
+Game Population Module - Keeps the live enemy count bounded
+===========================================================
+Enemies chase the player forever, so slow kinds left behind while boosting
+keep costing update, separation and DoT time every frame. PopulationManager
+runs a few times per second and:
+
+- moves enemies beyond the leash distance back onto the spawn ring, ahead of
+  the player's direction of travel,
+- merges the weakest off-screen enemies into elites while the live count is
+  over budget (HP and kill rewards are summed, so total threat and XP
+  income are kept),
+- caps summoner minions and drops spawns above a hard cap.
+"""
+
+import math
+from typing import TYPE_CHECKING
+
+from game_constants import (
+    WORLD_SIZE, ENEMY_BUDGET, ENEMY_HARD_CAP, ENEMY_LEASH_DIST, MINION_CAP,
+    clamp
+)
+from game_entities import ENEMY_POOL
+from game_enemy_kinds import ELITE_BIT, KIND_MASK, KIND_MINION, KIND_BOSS
+from game_spawning import GAME_SPAWN_TABLE
+
+if TYPE_CHECKING:
+    from game import Game
+
+
+class PopulationManager:
+    """Enforces the live-enemy budget, leash distance and minion cap."""
+
+    CHECK_INTERVAL = 0.25   # seconds between population passes
+    MERGE_GROUP = 4         # weak enemies folded into one elite
+    MERGE_MARGIN = 80       # only merge enemies this far outside the view
+    ELITE_SPEED_MULT = 1.15
+
+    def __init__(self, game: 'Game', budget: int = ENEMY_BUDGET, hard_cap: int = ENEMY_HARD_CAP,
+                 leash: float = ENEMY_LEASH_DIST, minion_cap: int = MINION_CAP):
+        self.game = game
+        self.budget = budget
+        self.hard_cap = max(hard_cap, budget)
+        self.leash = leash
+        self.minion_cap = minion_cap
+        self.check_timer = 0.0
+        self.minion_count = 0
+
+        # Direction the player has been travelling, for ring placement
+        self.last_pos = None
+        self.heading = None
+
+        # Counters shown in the profiler overlay
+        self.relocated = 0
+        self.merged = 0
+        self.dropped = 0
+
+    @property
+    def player(self):
+        return self.game.player
+
+    @property
+    def enemies(self):
+        return self.game.enemies
+
+    def update(self, dt: float):
+        """Run a population pass every CHECK_INTERVAL seconds."""
+        self.check_timer -= dt
+        if self.check_timer > 0:
+            return
+        self.check_timer = self.CHECK_INTERVAL
+        self._update_heading()
+
+        px, py = self.player.x, self.player.y
+        leash_sq = self.leash * self.leash
+        minions = 0
+        for en in self.enemies:
+            if en.kind_id & KIND_MASK == KIND_MINION:
+                minions += 1
+            dx = en.x - px
+            dy = en.y - py
+            if dx * dx + dy * dy > leash_sq:
+                self._relocate(en)
+        self.minion_count = minions
+
+        if len(self.enemies) > self.budget:
+            self._merge_excess()
+
+    def _update_heading(self):
+        px, py = self.player.x, self.player.y
+        if self.last_pos is not None:
+            dx = px - self.last_pos[0]
+            dy = py - self.last_pos[1]
+            l = math.hypot(dx, dy)
+            self.heading = (dx / l, dy / l) if l > 1.0 else None
+        self.last_pos = (px, py)
+
+    def _relocate(self, en):
+        """Move a leashed enemy back onto the spawn ring."""
+        half = WORLD_SIZE / 2
+        rng = self.game.rng.spawn
+        dmin, dmax = GAME_SPAWN_TABLE.ring
+        if self.heading is not None:
+            # Put it roughly in front of the player so it re-engages
+            ang = math.atan2(self.heading[1], self.heading[0]) + rng.uniform(-0.9, 0.9)
+        else:
+            ang = rng.uniform(0, math.tau)
+        r = rng.uniform(dmin, dmax)
+        en.x = clamp(self.player.x + math.cos(ang) * r, -half, half)
+        en.y = clamp(self.player.y + math.sin(ang) * r, -half, half)
+        # Teleport, not movement: don't interpolate across the jump
+        en.prev_x, en.prev_y = en.x, en.y
+        self.relocated += 1
+
+    def _merge_excess(self):
+        """Fold groups of the weakest off-screen enemies into single elites."""
+        excess = len(self.enemies) - self.budget
+        groups_needed = math.ceil(excess / (self.MERGE_GROUP - 1))
+
+        # Visible half-extents around the player at the current zoom
+        zoom = max(0.1, getattr(self.game, "view_zoom", 1.0))
+        half_w = self.game.w / zoom * 0.5 + self.MERGE_MARGIN
+        half_h = self.game.h / zoom * 0.5 + self.MERGE_MARGIN
+        px, py = self.player.x, self.player.y
+        by_kind = {}
+        for en in self.enemies:
+            if en.kind_id == KIND_BOSS or en.kind_id & ELITE_BIT:
+                continue
+            if abs(en.x - px) < half_w + en.radius and abs(en.y - py) < half_h + en.radius:
+                continue
+            by_kind.setdefault(en.kind_id, []).append(en)
+
+        groups = []
+        for members in by_kind.values():
+            members.sort(key=lambda e: e.max_hp)
+            for i in range(0, len(members) - self.MERGE_GROUP + 1, self.MERGE_GROUP):
+                groups.append(members[i:i + self.MERGE_GROUP])
+        if not groups:
+            return
+        groups.sort(key=lambda g: sum(e.max_hp for e in g))
+
+        absorbed = set()
+        for group in groups[:groups_needed]:
+            host = group[0]
+            for other in group[1:]:
+                host.hp += other.hp
+                host.max_hp += other.max_hp
+                host.reward += other.reward
+                absorbed.add(id(other))
+                ENEMY_POOL.release(other)
+            host.make_elite()
+            host.speed *= self.ELITE_SPEED_MULT
+            self.merged += len(group) - 1
+        self.game.enemies = [e for e in self.enemies if id(e) not in absorbed]
+
+    def spawn_allowance(self, n: int) -> int:
+        """Clamp a spawn batch so the live count never passes the hard cap."""
+        allowed = max(0, min(n, self.hard_cap - len(self.enemies)))
+        self.dropped += n - allowed
+        return allowed
+
+    def allow_minion(self) -> bool:
+        """Reserve a minion slot; False once the minion cap is reached."""
+        if self.minion_count >= self.minion_cap:
+            return False
+        self.minion_count += 1
+        return True
@@ -268,6 +268,7 @@ def apply_powerup(player, pid: str):
     
     # Fall back to legacy application
     _legacy_apply_powerup(player, pid)
+    player.refresh_stats()
 
 
 def _legacy_apply_powerup(player, pid: str):
@@ -432,6 +433,7 @@ def apply_evolution(player, eid: str):
     
     # Fall back to legacy evolutions
     _legacy_apply_evolution(player, eid)
+    player.refresh_stats()
 
 
 def _legacy_apply_evolution(player, eid: str):
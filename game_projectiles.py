@@ -0,0 +1,128 @@
+"""
+Game Projectiles Module - Enemy bullets as parallel arrays
+==========================================================
+Enemy bullets used to be one dict each, integrated, shield-tested,
+player-tested and range-checked one by one, with ``list.remove`` on every
+hit. EnemyProjectilePool keeps them as a struct of arrays (x, y, vx, vy,
+r plus the previous-tick positions for interpolation):
+
+- integration is one comprehension per axis
+- one box test sorts out the few bullets close enough to the player to
+  touch a shield or the player, and the ones beyond the cull range
+- only those bullets are tested individually, and the arrays are
+  compacted once per tick when anything was removed
+"""
+
+from game_constants import FPS
+
+
+class EnemyProjectilePool:
+    """Struct-of-arrays store for enemy bullets."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.x = []
+        self.y = []
+        self.vx = []
+        self.vy = []
+        self.r = []
+        self.prev_x = []
+        self.prev_y = []
+
+    def __len__(self):
+        return len(self.x)
+
+    def spawn(self, x: float, y: float, vx: float, vy: float, r: int):
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.r.append(r)
+        self.prev_x.append(x)
+        self.prev_y.append(y)
+
+    # ===== INTERPOLATION =====
+    def store_prev(self):
+        self.prev_x = self.x[:]
+        self.prev_y = self.y[:]
+
+    def interpolate(self, back: float):
+        """Move bullets ``back`` of the way to their previous positions; returns the sim positions."""
+        saved = (self.x, self.y)
+        self.x = [x + (px - x) * back for x, px in zip(self.x, self.prev_x)]
+        self.y = [y + (py - y) * back for y, py in zip(self.y, self.prev_y)]
+        return saved
+
+    def restore(self, saved):
+        self.x, self.y = saved
+
+    # ===== SIMULATION =====
+    def step(self, dt: float, px: float, py: float, pr: float, shields, shield_r: float,
+             cull: float, reflect: bool = False):
+        """Advance every bullet and resolve shields, the player and range culling.
+
+        ``shields`` is a list of shield centres. Bullets that touch a shield
+        are removed; with ``reflect`` their velocity is reversed and scaled
+        by 1.5 and they are returned so the caller can send them back at
+        the enemies. Returns ``(player_hits, reflected)``. ``reflected`` is a
+        list of ``(x, y, vx, vy)``.
+        """
+        xs = [x + vx * dt * FPS for x, vx in zip(self.x, self.vx)]
+        ys = [y + vy * dt * FPS for y, vy in zip(self.y, self.vy)]
+        self.x = xs
+        self.y = ys
+        if not xs:
+            return 0, ()
+
+        # Anything inside the reach box may touch the player or a shield;
+        # anything outside the cull box is dropped. Everything else just flies.
+        reach = pr + max(self.r)
+        for sx, sy in shields:
+            reach = max(reach, abs(sx - px) + shield_r, abs(sy - py) + shield_r)
+        rx0, rx1, ry0, ry1 = px - reach, px + reach, py - reach, py + reach
+        cx0, cx1, cy0, cy1 = px - cull, px + cull, py - cull, py + cull
+        special = [
+            i for i, (x, y) in enumerate(zip(xs, ys))
+            if (rx0 <= x <= rx1 and ry0 <= y <= ry1)
+            or not (cx0 <= x <= cx1 and cy0 <= y <= cy1)
+        ]
+        if not special:
+            return 0, ()
+
+        rs = self.r
+        shield_r2 = shield_r * shield_r
+        hits = 0
+        reflected = []
+        removed = set()
+        for i in special:
+            x = xs[i]
+            y = ys[i]
+            blocked = False
+            for sx, sy in shields:
+                dx = x - sx
+                dy = y - sy
+                if dx * dx + dy * dy < shield_r2:
+                    blocked = True
+                    break
+            if blocked:
+                removed.add(i)
+                if reflect:
+                    reflected.append((x, y, -self.vx[i] * 1.5, -self.vy[i] * 1.5))
+                continue
+            dx = px - x
+            dy = py - y
+            rr = pr + rs[i]
+            if dx * dx + dy * dy <= rr * rr:
+                removed.add(i)
+                hits += 1
+            elif not (cx0 <= x <= cx1 and cy0 <= y <= cy1):
+                removed.add(i)
+
+        if removed:
+            keep = [i for i in range(len(xs)) if i not in removed]
+            for name in ("x", "y", "vx", "vy", "r", "prev_x", "prev_y"):
+                arr = getattr(self, name)
+                setattr(self, name, [arr[i] for i in keep])
+        return hits, reflected
@@ -0,0 +1,109 @@
+"""
+Game Quality Module - Adaptive visual quality governor
+======================================================
+When frames run over budget we would rather drop cosmetic detail than frame
+rate. QualityGovernor keeps a rolling average of the work time per frame
+(``clock.get_rawtime()``, i.e. without the frame-cap sleep) and steps a
+quality level up or down with hysteresis. Each level sets a group of knobs:
+
+- particle_mult: scales enemy pops, status FX and the boost trail
+- damage_text_budget: live floating damage numbers kept
+- star_count: stars updated and drawn (a prefix of the shuffled starfield)
+- separation_passes: enemy separation relaxation passes (affects the sim)
+- smooth_zoom: smoothscale (True) or scale for the zoomed world present
+
+Knobs tagged ``affects_sim`` change gameplay outcomes. They stay at full
+quality while ``sim_locked`` is set, which the game does whenever the run
+is recorded or replayed, so a replay always plays back the same way.
+Cosmetic knobs only draw from the ``fx`` random stream, which never
+feeds back into the simulation.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+
+from game_constants import STAR_COUNT
+
+
+@dataclass(frozen=True)
+class Knob:
+    """One quality setting: its value at each level (0 = full quality)."""
+    name: str
+    levels: tuple
+    affects_sim: bool = False
+
+
+KNOBS = (
+    Knob("particle_mult", (1.0, 0.6, 0.35, 0.15)),
+    Knob("damage_text_budget", (400, 160, 80, 30)),
+    Knob("star_count", (STAR_COUNT, STAR_COUNT * 2 // 3, STAR_COUNT // 3, STAR_COUNT // 6)),
+    Knob("separation_passes", (2, 2, 1, 1), affects_sim=True),
+    Knob("smooth_zoom", (True, True, False, False)),
+)
+MAX_LEVEL = len(KNOBS[0].levels) - 1
+
+
+class QualityGovernor:
+    """Steps the quality level to hold a frame-time target."""
+
+    TARGET_MS = 1000.0 / 60
+    WINDOW = 60             # frames in the rolling average
+    DEGRADE_RATIO = 1.1     # average above target * this drops a level
+    RESTORE_RATIO = 0.7     # average below target * this raises a level
+    COOLDOWN = 90           # frames to wait after a change before judging again
+
+    def __init__(self, target_ms: float = TARGET_MS):
+        self.target_ms = target_ms
+        self.enabled = True
+        self.sim_locked = True
+        self.samples = deque(maxlen=self.WINDOW)
+        self.total = 0.0
+        self.cooldown = 0
+        self.level = 0
+        self._apply()
+
+    @property
+    def average_ms(self) -> float:
+        return self.total / len(self.samples) if self.samples else 0.0
+
+    def reset(self):
+        """Back to full quality with an empty history."""
+        self.samples.clear()
+        self.total = 0.0
+        self.cooldown = 0
+        self.set_level(0)
+
+    def set_level(self, level: int):
+        self.level = max(0, min(MAX_LEVEL, level))
+        self._apply()
+
+    def lock_sim(self, locked: bool):
+        """Pin (or release) the sim-affecting knobs at full quality."""
+        self.sim_locked = locked
+        self._apply()
+
+    def _apply(self):
+        for knob in KNOBS:
+            level = 0 if knob.affects_sim and self.sim_locked else self.level
+            setattr(self, knob.name, knob.levels[level])
+
+    def record(self, frame_ms: float):
+        """Feed one frame's work time; may move the quality level."""
+        if len(self.samples) == self.WINDOW:
+            self.total -= self.samples[0]
+        self.samples.append(frame_ms)
+        self.total += frame_ms
+        if not self.enabled:
+            return
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return
+        if len(self.samples) < self.WINDOW:
+            return
+        avg = self.total / len(self.samples)
+        if avg > self.target_ms * self.DEGRADE_RATIO and self.level < MAX_LEVEL:
+            self.set_level(self.level + 1)
+            self.cooldown = self.COOLDOWN
+        elif avg < self.target_ms * self.RESTORE_RATIO and self.level > 0:
+            self.set_level(self.level - 1)
+            self.cooldown = self.COOLDOWN
@@ -0,0 +1,358 @@
+"""
+Game Replay Module - Compact input recording and playback
+=========================================================
+A replay stores the run seed plus the player's input for every simulation
+tick. Since the simulation runs at a fixed step and all gameplay randomness
+comes from the seeded streams in game_random, feeding the same inputs back
+through ``update_playing`` reproduces the run exactly. Replays are used to
+re-run a reported stutter and to benchmark the same late-game horde after
+each optimization.
+
+File layout (all integers are LEB128 varints, signed ones zigzag-encoded):
+
+    b"AVZREP" version
+    seed sim_hz test_mode width height
+    tick_count
+    tick records...
+    footer: kills level zz(player_x) zz(player_y)
+
+Each tick record starts with ``(button_xor << 2) | (aim_changed << 1) |
+has_actions``. ``button_xor`` is XOR-ed against the previous tick's button
+mask, and the aim is the mouse target as a world offset from the player,
+stored as a delta from the previous tick. An idle tick therefore takes a
+single byte. Actions are things that happen between ticks (reload key,
+level-up and evolution picks) and are applied before the tick runs.
+"""
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+import pygame
+
+from audio import audio
+
+if TYPE_CHECKING:
+    from game import Game
+
+
+REPLAY_MAGIC = b"AVZREP"
+REPLAY_VERSION = 3     # 2: XP orbs merge and sleep (game_orbs), 3: reflective shield returns shots
+
+# Button mask bits
+BTN_UP = 1
+BTN_LEFT = 2
+BTN_DOWN = 4
+BTN_RIGHT = 8
+BTN_LASER = 16
+BTN_BOOST = 32
+BTN_FIRE = 64
+
+_BUTTON_KEYS = (
+    (BTN_UP, (pygame.K_w,)),
+    (BTN_LEFT, (pygame.K_a,)),
+    (BTN_DOWN, (pygame.K_s,)),
+    (BTN_RIGHT, (pygame.K_d,)),
+    (BTN_LASER, (pygame.K_SPACE,)),
+    (BTN_BOOST, (pygame.K_LSHIFT, pygame.K_RSHIFT)),
+)
+
+# Actions applied between ticks
+ACTION_RELOAD = 1
+ACTION_LEVELUP = 2      # arg: option index
+ACTION_SKIP_LEVELUP = 3
+ACTION_EVOLUTION = 4    # arg: option index
+
+
+# ===== ENCODING =====
+def _write_varint(out: bytearray, n: int):
+    while True:
+        b = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(b | 0x80)
+        else:
+            out.append(b)
+            return
+
+
+def _zigzag(n: int) -> int:
+    return (n << 1) if n >= 0 else ((-n << 1) - 1)
+
+
+def _unzigzag(n: int) -> int:
+    return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+
+
+class _Reader:
+    def __init__(self, data: bytes, pos: int = 0):
+        self.data = data
+        self.pos = pos
+
+    def varint(self) -> int:
+        shift = 0
+        n = 0
+        data = self.data
+        while True:
+            if self.pos >= len(data):
+                raise ValueError("truncated replay")
+            b = data[self.pos]
+            self.pos += 1
+            n |= (b & 0x7F) << shift
+            if not b & 0x80:
+                return n
+            shift += 7
+
+    def svarint(self) -> int:
+        return _unzigzag(self.varint())
+
+
+class ReplayKeys:
+    """``keys[pygame.K_*]`` lookups backed by a replay button mask."""
+
+    def __init__(self, mask: int):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        for bit, keys in _BUTTON_KEYS:
+            if key in keys:
+                return bool(self.mask & bit)
+        return False
+
+
+def _aim_offset(game: 'Game', aim_pos) -> tuple:
+    """Screen aim position -> integer world offset from the player."""
+    zoom = max(0.0001, game.view_zoom)
+    return (int(round((aim_pos[0] - game.w / 2) / zoom)),
+            int(round((aim_pos[1] - game.h / 2) / zoom)))
+
+
+def _aim_pos(game: 'Game', offset) -> tuple:
+    """Integer world offset from the player -> screen aim position."""
+    zoom = game.view_zoom
+    return (game.w / 2 + offset[0] * zoom, game.h / 2 + offset[1] * zoom)
+
+
+# ===== RECORDING =====
+class ReplayRecorder:
+    """Accumulates the encoded input stream of the current run."""
+
+    def __init__(self, seed: int, sim_hz: int, test_mode: bool, width: int, height: int):
+        self.header = (seed, sim_hz, int(test_mode), width, height)
+        self.body = bytearray()
+        self.ticks = 0
+        self.prev_mask = 0
+        self.prev_aim = (0, 0)
+        self.pending = []
+        self.saved = False
+
+    def action(self, code: int, arg: int = 0):
+        """Record an input that happened between ticks."""
+        self.pending.append((code, arg))
+
+    def record_tick(self, game: 'Game', keys, fire: bool, aim_pos) -> tuple:
+        """Record this tick's input and return the aim position to simulate with.
+
+        The aim is quantized to whole world units; the game uses the
+        quantized value too so that playback matches bit for bit.
+        """
+        mask = BTN_FIRE if fire else 0
+        for bit, key_ids in _BUTTON_KEYS:
+            if any(keys[k] for k in key_ids):
+                mask |= bit
+        aim = _aim_offset(game, aim_pos)
+
+        head = (mask ^ self.prev_mask) << 2
+        if aim != self.prev_aim:
+            head |= 2
+        if self.pending:
+            head |= 1
+        out = self.body
+        _write_varint(out, head)
+        if aim != self.prev_aim:
+            _write_varint(out, _zigzag(aim[0] - self.prev_aim[0]))
+            _write_varint(out, _zigzag(aim[1] - self.prev_aim[1]))
+        if self.pending:
+            _write_varint(out, len(self.pending))
+            for code, arg in self.pending:
+                _write_varint(out, code)
+                _write_varint(out, arg)
+            self.pending.clear()
+        self.prev_mask = mask
+        self.prev_aim = aim
+        self.ticks += 1
+        return _aim_pos(game, aim)
+
+    def to_bytes(self, game: 'Game') -> bytes:
+        out = bytearray(REPLAY_MAGIC)
+        out.append(REPLAY_VERSION)
+        for v in self.header:
+            _write_varint(out, v)
+        _write_varint(out, self.ticks)
+        out += self.body
+        # Footer: end-of-run state used to detect desyncs on playback
+        _write_varint(out, game.kills)
+        _write_varint(out, game.player.level)
+        _write_varint(out, _zigzag(int(game.player.x)))
+        _write_varint(out, _zigzag(int(game.player.y)))
+        return bytes(out)
+
+    def save(self, path: str, game: 'Game'):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.to_bytes(game))
+        self.saved = True
+
+
+# ===== PLAYBACK =====
+class Replay:
+    """A decoded replay file: header, per-tick inputs and the end-of-run footer."""
+
+    def __init__(self, seed, sim_hz, test_mode, width, height, ticks, footer):
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.test_mode = bool(test_mode)
+        self.width = width
+        self.height = height
+        self.ticks = ticks      # list of (mask, aim_offset, actions)
+        self.footer = footer    # (kills, level, x, y)
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(REPLAY_MAGIC):
+            raise ValueError(f"{path} is not a replay file")
+        version = data[len(REPLAY_MAGIC)]
+        if version != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        r = _Reader(data, len(REPLAY_MAGIC) + 1)
+        seed, sim_hz, test_mode, width, height = (r.varint() for _ in range(5))
+        count = r.varint()
+        ticks = []
+        mask = 0
+        ax = ay = 0
+        for _ in range(count):
+            head = r.varint()
+            mask ^= head >> 2
+            if head & 2:
+                ax += r.svarint()
+                ay += r.svarint()
+            actions = ()
+            if head & 1:
+                actions = tuple((r.varint(), r.varint()) for _ in range(r.varint()))
+            ticks.append((mask, (ax, ay), actions))
+        footer = (r.varint(), r.varint(), r.svarint(), r.svarint())
+        return cls(seed, sim_hz, test_mode, width, height, ticks, footer)
+
+
+class ReplayInput:
+    """Input source that feeds one recorded tick per ``poll``."""
+
+    def __init__(self):
+        self.mask = 0
+        self.aim = (0, 0)
+
+    def poll(self, game: 'Game'):
+        return ReplayKeys(self.mask), bool(self.mask & BTN_FIRE), _aim_pos(game, self.aim)
+
+
+def apply_action(game: 'Game', code: int, arg: int):
+    """Apply a recorded between-tick action to the game."""
+    if code == ACTION_RELOAD:
+        game.player.start_reload()
+    elif code == ACTION_LEVELUP:
+        game.choose_levelup(arg)
+    elif code == ACTION_SKIP_LEVELUP:
+        game.skip_levelup()
+    elif code == ACTION_EVOLUTION:
+        game.choose_evolution(arg)
+
+
+def _percentile(sorted_ms, q):
+    if not sorted_ms:
+        return 0.0
+    return sorted_ms[min(len(sorted_ms) - 1, int(len(sorted_ms) * q))]
+
+
+def run_replay(game: 'Game', replay: Replay, draw: bool = True, realtime: bool = True) -> dict:
+    """Drive the game from a replay and return frame-time statistics.
+
+    With ``draw`` every tick is rendered; ``realtime`` paces playback at the
+    recorded tick rate, otherwise it runs as fast as possible.
+    """
+    from game_constants import FPS, SIM_DT, STATE_PLAYING
+
+    if replay.sim_hz != FPS:
+        print(f"warning: replay recorded at {replay.sim_hz} Hz, game ticks at {FPS} Hz")
+
+    # Same view size as the recording: LOD tiers and culling depend on it
+    if (game.w, game.h) != (replay.width, replay.height):
+        game.w, game.h = replay.width, replay.height
+        game._apply_display_mode()
+
+    game.record_replays = False
+    game.set_test_mode(replay.test_mode)
+    game.start_run(seed=replay.seed)
+    game.quality.reset()
+    game.quality.lock_sim(True)
+    source = ReplayInput()
+    game.input_source = source
+    game.render_alpha = 1.0
+
+    tick_ms = []
+    desync = None
+    for i, (mask, aim, actions) in enumerate(replay.ticks):
+        if draw:
+            for e in pygame.event.get():
+                if e.type == pygame.QUIT or (e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE):
+                    desync = "stopped"
+                    break
+            if desync:
+                break
+        for code, arg in actions:
+            apply_action(game, code, arg)
+        if game.state != STATE_PLAYING:
+            desync = f"tick {i}: game is in state {game.state}, expected {STATE_PLAYING}"
+            break
+        source.mask = mask
+        source.aim = aim
+        t0 = time.perf_counter()
+        game.update(SIM_DT)
+        if draw:
+            game.draw()
+            audio.flush()
+        tick_ms.append((time.perf_counter() - t0) * 1000.0)
+        if realtime:
+            game.clock.tick(FPS)
+
+    game.input_source = None
+    end = (game.kills, game.player.level, int(game.player.x), int(game.player.y))
+    if desync is None and end != replay.footer:
+        desync = f"end state {end} != recorded {replay.footer}"
+
+    ordered = sorted(tick_ms)
+    worst = sorted(range(len(tick_ms)), key=tick_ms.__getitem__, reverse=True)[:5]
+    return {
+        "ticks": len(tick_ms),
+        "recorded_ticks": len(replay.ticks),
+        "sim_seconds": len(tick_ms) / FPS,
+        "mean_ms": sum(tick_ms) / max(1, len(tick_ms)),
+        "p50_ms": _percentile(ordered, 0.50),
+        "p95_ms": _percentile(ordered, 0.95),
+        "p99_ms": _percentile(ordered, 0.99),
+        "max_ms": ordered[-1] if ordered else 0.0,
+        "worst_ticks": [(t, round(tick_ms[t], 2)) for t in worst],
+        "desync": desync,
+    }
+
+
+def print_replay_report(path: str, stats: dict):
+    print(f"replay {path}: {stats['ticks']}/{stats['recorded_ticks']} ticks ({stats['sim_seconds']:.1f}s sim)")
+    print(f"  tick ms  mean {stats['mean_ms']:.2f}  p50 {stats['p50_ms']:.2f}  p95 {stats['p95_ms']:.2f}  "
+          f"p99 {stats['p99_ms']:.2f}  max {stats['max_ms']:.2f}")
+    worst = ", ".join(f"#{t} {ms}ms" for t, ms in stats["worst_ticks"])
+    print(f"  worst ticks: {worst}")
+    print(f"  {'DESYNC: ' + stats['desync'] if stats['desync'] else 'in sync with recording'}")
@@ -12,12 +12,193 @@ from game_constants import (
     WORLD_SIZE, ENEMY_BASE_HP, ENEMY_BASE_SPEED, ENEMY_SPAWN_RATE,
     clamp
 )
-from game_entities import Enemy
+from game_entities import ENEMY_POOL
+from game_enemy_kinds import KIND_BOSS, KIND_TABLE
 
 if TYPE_CHECKING:
     from game import Game
 
 
+# ===== SPAWN TABLES =====
+
+class SpawnTable:
+    """Precomputed enemy-kind sampling and stat templates for ring spawns.
+
+    Kind weights ramp with elapsed time, so the table is cut into fixed-size
+    time buckets and each bucket gets a Vose alias table. Picking a kind is
+    then two random numbers and one list lookup instead of rebuilding the
+    pool/weight lists and calling ``random.choices`` for every enemy.
+
+    ``ramps`` is a list of ``(kind, unlock_time, cap, ramp_seconds)``; the
+    weight is ``min(cap, (t - unlock_time) / ramp_seconds)`` once unlocked, or
+    a flat ``cap`` when ``ramp_seconds`` is None. ``templates`` maps kind to
+    ``(hp_mult, speed_mult)``; ``boss_templates`` maps boss stage to the same
+    (the highest stage is reused for later bosses).
+    """
+
+    def __init__(self, ramps, templates, boss_templates, hp_period, speed_period,
+                 ring=(600, 900), bucket=1.0):
+        self.ring = ring
+        self.bucket = bucket
+        self.hp_period = hp_period
+        self.speed_period = speed_period
+        self.templates = {
+            kind: (ENEMY_BASE_HP * hp_m, ENEMY_BASE_SPEED * sp_m)
+            for kind, (hp_m, sp_m) in templates.items()
+        }
+        self.boss_templates = {
+            stage: (ENEMY_BASE_HP * hp_m, ENEMY_BASE_SPEED * sp_m)
+            for stage, (hp_m, sp_m) in boss_templates.items()
+        }
+        self.max_boss_stage = max(self.boss_templates)
+
+        # Past the horizon every ramp has hit its cap, so one table covers it
+        horizon = 0.0
+        for _, unlock, cap, ramp in ramps:
+            horizon = max(horizon, unlock + (cap * ramp if ramp else 0.0))
+        self.tables = []
+        for i in range(int(math.ceil(horizon / bucket)) + 1):
+            self.tables.append(self._build_bucket(ramps, i * bucket))
+
+    @staticmethod
+    def _build_bucket(ramps, t):
+        """Build (kinds, prob, alias) for the weights at time ``t``."""
+        kinds, weights = [], []
+        for kind, unlock, cap, ramp in ramps:
+            if t < unlock:
+                continue
+            w = cap if not ramp else min(cap, (t - unlock) / ramp)
+            if w > 0:
+                kinds.append(kind)
+                weights.append(w)
+
+        n = len(kinds)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        return kinds, prob, alias
+
+    def table_at(self, t: float):
+        """Return the alias table for elapsed time ``t``."""
+        i = int(t / self.bucket) if t > 0 else 0
+        tables = self.tables
+        return tables[i] if i < len(tables) else tables[-1]
+
+    def sample_kinds(self, t: float, n: int, rng=random) -> list:
+        """Draw ``n`` enemy kinds for elapsed time ``t``."""
+        kinds, prob, alias = self.table_at(t)
+        k = len(kinds)
+        rand = rng.random
+        out = []
+        for _ in range(n):
+            i = int(rand() * k)
+            out.append(kinds[i] if rand() < prob[i] else kinds[alias[i]])
+        return out
+
+    def ring_positions(self, cx: float, cy: float, n: int, rng=random) -> list:
+        """Sample ``n`` points on the spawn ring around (cx, cy), clamped to the world."""
+        half = WORLD_SIZE / 2
+        dmin, dmax = self.ring
+        span = dmax - dmin
+        rand = rng.random
+        tau = math.tau
+        angs = [rand() * tau for _ in range(n)]
+        dists = [dmin + rand() * span for _ in range(n)]
+        cos, sin = math.cos, math.sin
+        return [
+            (clamp(cx + cos(a) * r, -half, half), clamp(cy + sin(a) * r, -half, half))
+            for a, r in zip(angs, dists)
+        ]
+
+    def stats(self, kind: str, t: float, boss_stage: int = 0) -> tuple:
+        """Return (hp, speed) for ``kind`` at elapsed time ``t``."""
+        hp_scale = 1.0 + (t / self.hp_period)
+        speed_scale = 1.0 + (t / self.speed_period)
+        if kind == "boss":
+            hp_base, sp_base = self.boss_templates[min(max(boss_stage, 1), self.max_boss_stage)]
+        else:
+            hp_base, sp_base = self.templates.get(kind, self.templates["normal"])
+        return int(hp_base * hp_scale), sp_base * speed_scale
+
+    def spawn_many(self, n: int, t: float, cx: float, cy: float, rng=random) -> list:
+        """Build ``n`` regular (non-boss) enemies on the ring around (cx, cy)."""
+        if n <= 0:
+            return []
+        hp_scale = 1.0 + (t / self.hp_period)
+        speed_scale = 1.0 + (t / self.speed_period)
+        templates = self.templates
+        enemies = []
+        for (x, y), kind in zip(self.ring_positions(cx, cy, n, rng), self.sample_kinds(t, n, rng)):
+            hp_base, sp_base = templates[kind]
+            enemies.append(ENEMY_POOL.acquire(x, y, int(hp_base * hp_scale), sp_base * speed_scale, kind))
+        return enemies
+
+
+# Progression used by Game.spawn_enemy: mostly normals, other kinds unlock
+# and ramp in gradually.
+GAME_SPAWN_TABLE = SpawnTable(
+    ramps=[
+        ("normal", 0, 1.0, None),
+        ("fast", 45, 0.25, 120),       # ramps up over 2 min
+        ("tank", 90, 0.20, 120),
+        ("sprinter", 150, 0.15, 180),  # slow ramp
+        ("bruiser", 180, 0.15, 120),
+        ("shooter", 240, 0.10, 180),   # very rare at first
+    ],
+    templates={
+        "normal": (1.0, 1.0),
+        "tank": (2.5, 0.6),
+        "fast": (0.6, 1.5),
+        "sprinter": (0.5, 1.8),
+        "bruiser": (3.5, 0.8),
+        "shooter": (1.2, 0.9),
+    },
+    boss_templates={1: (12, 1.0), 2: (16, 1.2), 3: (22, 1.4)},
+    hp_period=180.0,    # 2.0x HP at 3 min
+    speed_period=600.0,
+)
+
+# Progression used by SpawnManager: flat weights with timed unlocks.
+MANAGER_SPAWN_TABLE = SpawnTable(
+    ramps=[
+        ("normal", 0, 0.45, None),
+        ("fast", 0, 0.25, None),
+        ("tank", 0, 0.2, None),
+        ("shooter", 180, 0.15, None),   # 3 minutes
+        ("sprinter", 90, 0.15, None),   # 1.5 minutes
+        ("bruiser", 120, 0.2, None),    # 2 minutes
+        ("charger", 300, 0.1, None),    # 5 minutes
+        ("summoner", 420, 0.08, None),  # 7 minutes
+    ],
+    templates={
+        "normal": (1.0, 1.0),
+        "tank": (3.0, 0.7),
+        "fast": (0.7, 1.8),
+        "sprinter": (0.8, 2.4),
+        "bruiser": (4.0, 0.9),
+        "shooter": (1.4, 1.0),
+        "charger": (2.0, 1.5),
+        "summoner": (2.5, 0.6),
+    },
+    boss_templates={1: (14, 1.2), 2: (18, 1.45), 3: (24, 1.6)},
+    hp_period=90.0,
+    speed_period=180.0,
+)
+
+
 class SpawnManager:
     """Manages enemy spawning and difficulty progression."""
     
@@ -46,6 +227,10 @@ class SpawnManager:
     @property
     def elapsed_time(self):
         return self.game.elapsed_time
+
+    @property
+    def rng(self):
+        return self.game.rng
     
     def update(self, dt: float):
         """Update spawning logic."""
@@ -58,124 +243,71 @@ class SpawnManager:
         self.elite_spawn_chance = min(0.15, self.elapsed_time / 600)  # Max 15% at 10 min
         
         interval = 1.0 / self.enemy_spawn_rate
+        count = 0
         while self.spawn_timer >= interval:
             self.spawn_timer -= interval
-            self.spawn_enemy()
+            count += 1
+        if count:
+            self.spawn_many(count)
     
     def spawn_enemy(self):
         """Spawn a single enemy."""
-        half = WORLD_SIZE / 2
-        dmin, dmax = 600, 900
-        ang = random.uniform(0, math.tau)
-        r = random.uniform(dmin, dmax)
-        x = self.player.x + math.cos(ang) * r
-        y = self.player.y + math.sin(ang) * r
-        x = clamp(x, -half, half)
-        y = clamp(y, -half, half)
-        
-        # Choose enemy type based on elapsed time
+        self.spawn_many(1)
+    
+    def spawn_many(self, n: int):
+        """Spawn a batch of enemies on the ring around the player."""
+        table = MANAGER_SPAWN_TABLE
         t = self.elapsed_time
-        hp_scale = 1.0 + (t / 90.0)
-        speed_scale = 1.0 + (t / 180.0)
         
         # Timed boss every minute
-        if int(t // 60) > self.bosses_spawned:
+        if n > 0 and int(t // 60) > self.bosses_spawned:
             self.bosses_spawned += 1
-            kind = "boss"
-            boss_stage = self.bosses_spawned
-        else:
-            kind, boss_stage = self._choose_enemy_type(t)
-        
-        # Check for elite variant
-        is_elite = random.random() < self.elite_spawn_chance and kind not in ("boss",)
-        
-        hp, speed = self._get_enemy_stats(kind, boss_stage, hp_scale, speed_scale)
-        
-        if is_elite:
-            hp = int(hp * 2.5)
-            speed *= 1.15
-            kind = f"elite_{kind}"
+            (x, y), = table.ring_positions(self.player.x, self.player.y, 1, self.rng.spawn)
+            hp, speed = table.stats("boss", t, self.bosses_spawned)
+            enemy = ENEMY_POOL.acquire(x, y, hp, speed, "boss", boss_stage=self.bosses_spawned)
+            enemy.max_hp = hp
+            self.game.enemies.append(enemy)
+            n -= 1
         
-        enemy = Enemy(x, y, hp, speed, kind, boss_stage=boss_stage)
-        enemy.max_hp = hp  # Track max HP for percentage calculations
-        self.game.enemies.append(enemy)
+        population = getattr(self.game, "population", None)
+        if population is not None:
+            n = population.spawn_allowance(n)
+        batch = table.spawn_many(n, t, self.player.x, self.player.y, self.rng.spawn)
+        for enemy in batch:
+            # Check for elite variant
+            if self.rng.spawn.random() < self.elite_spawn_chance:
+                enemy.hp = int(enemy.hp * 2.5)
+                enemy.speed *= 1.15
+                enemy.make_elite()
+            enemy.max_hp = enemy.hp  # Track max HP for percentage calculations
+        self.game.enemies.extend(batch)
     
     def _choose_enemy_type(self, t: float) -> tuple:
         """Choose enemy type based on elapsed time."""
-        pool = ["normal", "fast", "tank"]
-        weights = [0.45, 0.25, 0.2]
-        
-        if t >= 180:  # 3 minutes
-            pool.append("shooter")
-            weights.append(0.15)
-        
-        if t > 90:  # 1.5 minutes
-            pool.append("sprinter")
-            weights.append(0.15)
-        
-        if t > 120:  # 2 minutes
-            pool.append("bruiser")
-            weights.append(0.2)
-        
-        if t > 300:  # 5 minutes
-            pool.append("charger")
-            weights.append(0.1)
-        
-        if t > 420:  # 7 minutes
-            pool.append("summoner")
-            weights.append(0.08)
-        
-        kind = random.choices(pool, weights=weights, k=1)[0]
-        return kind, 0
+        return MANAGER_SPAWN_TABLE.sample_kinds(t, 1, self.rng.spawn)[0], 0
     
     def _get_enemy_stats(self, kind: str, boss_stage: int, hp_scale: float, speed_scale: float) -> tuple:
         """Get HP and speed for an enemy type."""
         # Remove elite prefix for stat lookup
         base_kind = kind.replace("elite_", "")
         
-        if base_kind == "tank":
-            hp = int(ENEMY_BASE_HP * 3 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 0.7 * speed_scale
-        elif base_kind == "fast":
-            hp = int(ENEMY_BASE_HP * 0.7 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 1.8 * speed_scale
-        elif base_kind == "sprinter":
-            hp = int(ENEMY_BASE_HP * 0.8 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 2.4 * speed_scale
-        elif base_kind == "bruiser":
-            hp = int(ENEMY_BASE_HP * 4.0 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 0.9 * speed_scale
-        elif base_kind == "shooter":
-            hp = int(ENEMY_BASE_HP * 1.4 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 1.0 * speed_scale
-        elif base_kind == "charger":
-            hp = int(ENEMY_BASE_HP * 2.0 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 1.5 * speed_scale
-        elif base_kind == "summoner":
-            hp = int(ENEMY_BASE_HP * 2.5 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 0.6 * speed_scale
-        elif base_kind == "boss":
-            if boss_stage == 1:
-                hp = int(ENEMY_BASE_HP * 14 * hp_scale)
-                speed = ENEMY_BASE_SPEED * 1.2 * speed_scale
-            elif boss_stage == 2:
-                hp = int(ENEMY_BASE_HP * 18 * hp_scale)
-                speed = ENEMY_BASE_SPEED * 1.45 * speed_scale
-            else:
-                hp = int(ENEMY_BASE_HP * 24 * hp_scale)
-                speed = ENEMY_BASE_SPEED * 1.6 * speed_scale
-        else:  # normal
-            hp = int(ENEMY_BASE_HP * 1.0 * hp_scale)
-            speed = ENEMY_BASE_SPEED * 1.0 * speed_scale
-        
-        return hp, speed
+        if base_kind == "boss":
+            templates = MANAGER_SPAWN_TABLE.boss_templates
+            hp_base, sp_base = templates[min(max(boss_stage, 1), MANAGER_SPAWN_TABLE.max_boss_stage)]
+        else:
+            templates = MANAGER_SPAWN_TABLE.templates
+            hp_base, sp_base = templates.get(base_kind, templates["normal"])
+        return int(hp_base * hp_scale), sp_base * speed_scale
     
     def spawn_minion(self, x: float, y: float, parent_kind: str = "summoner"):
         """Spawn a minion enemy (from summoner enemies)."""
+        population = getattr(self.game, "population", None)
+        if population is not None and not population.allow_minion():
+            return
         hp = int(ENEMY_BASE_HP * 0.3)
         speed = ENEMY_BASE_SPEED * 1.2
         
-        enemy = Enemy(x, y, hp, speed, "minion", boss_stage=0)
+        enemy = ENEMY_POOL.acquire(x, y, hp, speed, "minion", boss_stage=0)
         enemy.max_hp = hp
         self.game.enemies.append(enemy)
     
@@ -187,8 +319,8 @@ class SpawnManager:
         
         for _ in range(enemy_count):
             # Spawn in a ring around player
-            ang = random.uniform(0, math.tau)
-            r = random.uniform(700, 1000)
+            ang = self.rng.spawn.uniform(0, math.tau)
+            r = self.rng.spawn.uniform(700, 1000)
             x = self.player.x + math.cos(ang) * r
             y = self.player.y + math.sin(ang) * r
             
@@ -202,7 +334,7 @@ class SpawnManager:
             speed_scale = 1.0 + (t / 180.0)
             
             hp, speed = self._get_enemy_stats(kind, 0, hp_scale, speed_scale)
-            enemy = Enemy(x, y, hp, speed, kind)
+            enemy = ENEMY_POOL.acquire(x, y, hp, speed, kind)
             enemy.max_hp = hp
             self.game.enemies.append(enemy)
     
@@ -222,20 +354,19 @@ class SpawnManager:
                     min_dist = ei.radius + ej.radius
                     
                     if dist < 1e-4:
-                        dx = random.uniform(-0.01, 0.01)
-                        dy = random.uniform(-0.01, 0.01)
+                        dx = self.rng.combat.uniform(-0.01, 0.01)
+                        dy = self.rng.combat.uniform(-0.01, 0.01)
                         dist = math.hypot(dx, dy) or 1.0
                     
                     if dist < min_dist:
                         overlap = (min_dist - dist)
                         nx, ny = dx / dist, dy / dist
                         
-                        # Bosses resist being pushed
-                        wi, wj = 0.5, 0.5
-                        if getattr(ei, "kind", "") == "boss" and getattr(ej, "kind", "") != "boss":
-                            wi, wj = 0.2, 0.8
-                        elif getattr(ej, "kind", "") == "boss" and getattr(ei, "kind", "") != "boss":
-                            wi, wj = 0.8, 0.2
+                        # Heavier kinds (bosses) resist being pushed
+                        mi = KIND_TABLE[ei.kind_id].mass
+                        mj = KIND_TABLE[ej.kind_id].mass
+                        wi = mj / (mi + mj)
+                        wj = mi / (mi + mj)
                         
                         push = overlap * 0.5
                         ei.x -= nx * push * wi
@@ -250,53 +381,42 @@ class SpawnManager:
         
         # Handle special enemy behaviors
         for en in self.enemies:
+            info = KIND_TABLE[en.kind_id]
             # Shooter enemies
-            can_shoot = (
-                getattr(en, "kind", "") in ("shooter", "elite_shooter") or
-                (getattr(en, "kind", "") == "boss" and getattr(en, "boss_stage", 0) >= 3)
-            )
-            
-            if can_shoot:
+            if info.shooter or (info.boss and en.boss_stage >= 3):
                 self._update_shooter(en, dt)
             
             # Charger behavior
-            if "charger" in getattr(en, "kind", ""):
+            if info.charger:
                 self._update_charger(en, dt)
             
             # Summoner behavior
-            if "summoner" in getattr(en, "kind", ""):
+            if info.summoner:
                 self._update_summoner(en, dt)
     
     def _update_shooter(self, en, dt: float):
         """Update shooter enemy behavior."""
         from game_constants import FPS
         
-        if not hasattr(en, "shoot_cd"):
-            en.shoot_cd = random.uniform(1.0, 2.4)
+        if en.shoot_cd is None:
+            en.shoot_cd = self.rng.combat.uniform(1.0, 2.4)
         
         en.shoot_cd -= dt
         if en.shoot_cd <= 0:
-            is_boss = en.kind == "boss"
-            en.shoot_cd = random.uniform(0.6, 1.2) if is_boss else random.uniform(1.0, 2.0)
+            is_boss = en.kind_id == KIND_BOSS
+            en.shoot_cd = self.rng.combat.uniform(0.6, 1.2) if is_boss else self.rng.combat.uniform(1.0, 2.0)
             
             dx = self.player.x - en.x
             dy = self.player.y - en.y
             l = math.hypot(dx, dy) or 1
             speed = 12.0 if is_boss else 5.0
             
-            self.game.enemy_bullets.append({
-                "x": en.x,
-                "y": en.y,
-                "vx": dx / l * speed,
-                "vy": dy / l * speed,
-                "r": 6 if is_boss else 4,
-                "dmg": 1
-            })
+            self.game.enemy_bullets.spawn(en.x, en.y, dx / l * speed, dy / l * speed, 6 if is_boss else 4)
     
     def _update_charger(self, en, dt: float):
         """Update charger enemy behavior (charges at player)."""
-        if not hasattr(en, "charge_cd"):
-            en.charge_cd = random.uniform(3.0, 5.0)
+        if en.charge_cd is None:
+            en.charge_cd = self.rng.combat.uniform(3.0, 5.0)
             en.charging = False
             en.charge_duration = 0.0
         
@@ -312,22 +432,22 @@ class SpawnManager:
                 en.charging = True
                 en.charge_duration = 0.8
                 en.speed = ENEMY_BASE_SPEED * 4.0
-                en.charge_cd = random.uniform(3.0, 5.0)
+                en.charge_cd = self.rng.combat.uniform(3.0, 5.0)
     
     def _update_summoner(self, en, dt: float):
         """Update summoner enemy behavior (spawns minions)."""
-        if not hasattr(en, "summon_cd"):
-            en.summon_cd = random.uniform(4.0, 6.0)
+        if en.summon_cd is None:
+            en.summon_cd = self.rng.combat.uniform(4.0, 6.0)
         
         en.summon_cd -= dt
         if en.summon_cd <= 0:
-            en.summon_cd = random.uniform(4.0, 6.0)
+            en.summon_cd = self.rng.combat.uniform(4.0, 6.0)
             
             # Spawn 2-3 minions around the summoner
-            count = random.randint(2, 3)
+            count = self.rng.spawn.randint(2, 3)
             for _ in range(count):
-                ang = random.uniform(0, math.tau)
-                r = random.uniform(30, 50)
+                ang = self.rng.spawn.uniform(0, math.tau)
+                r = self.rng.spawn.uniform(30, 50)
                 x = en.x + math.cos(ang) * r
                 y = en.y + math.sin(ang) * r
                 self.spawn_minion(x, y)
@@ -0,0 +1,215 @@
+"""
+Game Sprites Module - Pre-rendered sprites and batched world drawing
+====================================================================
+Enemies, bullets, XP orbs, pickups and enemy bullets are flat circles whose
+look depends only on a handful of values (kind, radius, flash state...).
+Each combination is rendered once, on first use, into a colour-keyed
+surface, and a whole layer is then drawn with one ``Surface.blits`` call
+(``fblits`` on pygame-ce) instead of one or two ``pygame.draw.circle``
+calls per entity.
+
+- EnemySpriteCache: enemy sprites keyed by kind, boss stage, radius, flash
+- WorldBatchRenderer: per-frame layer drawing with render-rect culling
+"""
+
+import pygame
+
+from game_constants import COLOR_WHITE, COLOR_XP, COLOR_GAS, COLOR_BULLET, COLOR_RED
+from game_enemy_kinds import KIND_TABLE, BOSS_STAGE_COLORS
+
+COLORKEY = (0, 0, 0)     # no enemy colour is pure black
+ELITE_RING = (255, 255, 100)
+
+
+class EnemySpriteCache:
+    """Lazily built enemy sprites keyed by (kind_id, boss_stage, radius, flashing)."""
+
+    def __init__(self):
+        self.sprites = {}
+
+    def clear(self):
+        self.sprites.clear()
+
+    def _build(self, key):
+        kind_id, boss_stage, radius, flashing = key
+        info = KIND_TABLE[kind_id]
+        col = BOSS_STAGE_COLORS.get(boss_stage, info.color) if info.boss else info.color
+        if flashing:
+            col = COLOR_WHITE
+        # Half-size leaves room for the elite ring (radius + 4, 2px wide)
+        half = radius + 5
+        surf = pygame.Surface((half * 2, half * 2))
+        surf.fill(COLORKEY)
+        pygame.draw.circle(surf, col, (half, half), radius)
+        if info.elite and not flashing:
+            pygame.draw.circle(surf, ELITE_RING, (half, half), radius + 4, width=2)
+        surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        sprite = (surf, half)
+        self.sprites[key] = sprite
+        return sprite
+
+    def get(self, en):
+        """(surface, half_size) for an enemy's current look."""
+        # boss_stage is 0 for everything but bosses, so it is keyed as-is
+        key = (en.kind_id, en.boss_stage, en.radius, en.flash_timer > 0)
+        return self.sprites.get(key) or self._build(key)
+
+
+def blit_batch(target: pygame.Surface, seq):
+    """One batched blit of ``(surface, (x, y))`` pairs."""
+    if not seq:
+        return
+    fblits = getattr(target, "fblits", None)
+    if fblits is not None:
+        fblits(seq)
+    else:
+        target.blits(seq, doreturn=False)
+
+
+def _circle_sprite(circles):
+    """Colour-keyed surface for ``((color, radius, width), ...)`` drawn in order."""
+    half = int(max(c[1] for c in circles)) + 2
+    surf = pygame.Surface((half * 2, half * 2))
+    surf.fill(COLORKEY)
+    for color, radius, width in circles:
+        pygame.draw.circle(surf, color, (half, half), radius, width=width)
+    surf.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return surf, half
+
+
+# Sprite recipes per layer, by radius. They match the entities' own draw()
+_LAYER_CIRCLES = {
+    "bullet": lambda r: ((COLOR_BULLET, r, 0),),
+    "orb": lambda r: ((COLOR_XP, r, 0),),
+    "gas": lambda r: ((COLOR_GAS, r, 2), (COLOR_GAS, r // 2, 0)),
+    "evolution": lambda r: (((255, 200, 90), r, 3), ((255, 120, 50), max(1, r - 6), 0)),
+    "enemy_bullet": lambda r: ((COLOR_RED, r, 0),),
+}
+
+
+class WorldBatchRenderer:
+    """Draws the world's many small entities one batched layer at a time.
+
+    ``begin()`` is called once per frame with the render surface and camera;
+    each ``draw_*`` call then gathers screen positions for one layer, drops
+    anything outside the render rect and submits the rest in one blit. The
+    caller keeps the layer order. Layers still drawn one by one (particles,
+    summons, FX, damage text) go through ``cull``/``cull_dicts`` first, so
+    draw cost follows what is on screen rather than what exists.
+    """
+
+    def __init__(self, enemy_sprites: EnemySpriteCache):
+        self.enemy_sprites = enemy_sprites
+        self.sprites = {}   # (layer, radius) -> (surface, half_size)
+        self.target = None
+        self.cam = (0.0, 0.0)
+        self.view_w = 0
+        self.view_h = 0
+        self.drawn = 0
+        self.culled = 0
+
+    def begin(self, target: pygame.Surface, cam):
+        self.target = target
+        self.cam = cam
+        self.view_w, self.view_h = target.get_size()
+        self.drawn = 0
+        self.culled = 0
+
+    def cull(self, items, margin: float):
+        """Entities (``x``/``y`` attributes) within ``margin`` px of the render rect."""
+        cx, cy = self.cam
+        x0 = cx - margin
+        y0 = cy - margin
+        x1 = cx + self.view_w + margin
+        y1 = cy + self.view_h + margin
+        out = [it for it in items if x0 <= it.x <= x1 and y0 <= it.y <= y1]
+        self.culled += len(items) - len(out)
+        return out
+
+    def cull_dicts(self, items, margin: float, radius_key: str = None):
+        """Dict entities within ``margin`` (plus ``item[radius_key]``) px of the render rect.
+
+        Items without a position are kept (summons default to the player).
+        """
+        if not items:
+            return items
+        cx, cy = self.cam
+        w, h = self.view_w, self.view_h
+        mx = cx + w * 0.5
+        my = cy + h * 0.5
+        out = []
+        for it in items:
+            m = margin + it[radius_key] if radius_key else margin
+            dx = it.get("x", mx) - mx
+            dy = it.get("y", my) - my
+            if -w * 0.5 - m <= dx <= w * 0.5 + m and -h * 0.5 - m <= dy <= h * 0.5 + m:
+                out.append(it)
+        self.culled += len(items) - len(out)
+        return out
+
+    def _sprite(self, layer: str, radius):
+        key = (layer, radius)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.sprites[key] = _circle_sprite(_LAYER_CIRCLES[layer](radius))
+        return sprite
+
+    def _submit(self, seq, total: int):
+        self.drawn += len(seq)
+        self.culled += total - len(seq)
+        blit_batch(self.target, seq)
+
+    def draw_round(self, layer: str, items):
+        """Draw entities with ``x``, ``y`` and ``radius`` attributes."""
+        cx, cy = self.cam
+        w, h = self.view_w, self.view_h
+        sprites = self.sprites
+        seq = []
+        append = seq.append
+        for it in items:
+            r = it.radius
+            sx = int(it.x - cx)
+            sy = int(it.y - cy)
+            if sx < -r or sy < -r or sx > w + r or sy > h + r:
+                continue
+            surf, half = sprites.get((layer, r)) or self._sprite(layer, r)
+            append((surf, (sx - half, sy - half)))
+        self._submit(seq, len(items))
+
+    def draw_enemy_bullets(self, bullets):
+        """Draw an EnemyProjectilePool (parallel ``x``, ``y``, ``r`` arrays)."""
+        cx, cy = self.cam
+        w, h = self.view_w, self.view_h
+        sprites = self.sprites
+        seq = []
+        append = seq.append
+        for x, y, r in zip(bullets.x, bullets.y, bullets.r):
+            sx = int(x - cx)
+            sy = int(y - cy)
+            if sx < -r or sy < -r or sx > w + r or sy > h + r:
+                continue
+            surf, half = sprites.get(("enemy_bullet", r)) or self._sprite("enemy_bullet", r)
+            append((surf, (sx - half, sy - half)))
+        self._submit(seq, len(bullets))
+
+    def draw_enemies(self, enemies):
+        """Draw enemies from the enemy sprite cache."""
+        cx, cy = self.cam
+        w, h = self.view_w, self.view_h
+        sprites = self.enemy_sprites.sprites
+        build = self.enemy_sprites._build
+        seq = []
+        append = seq.append
+        for en in enemies:
+            r = en.radius + 4   # elite ring
+            sx = int(en.x - cx)
+            sy = int(en.y - cy)
+            if sx < -r or sy < -r or sx > w + r or sy > h + r:
+                continue
+            key = (en.kind_id, en.boss_stage, en.radius, en.flash_timer > 0)
+            surf, half = sprites.get(key) or build(key)
+            append((surf, (sx - half, sy - half)))
+        self._submit(seq, len(enemies))
+
+
+ENEMY_SPRITES = EnemySpriteCache()
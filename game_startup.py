@@ -0,0 +1,99 @@
+"""
+Game Startup Module - Startup timing and background asset loading
+=================================================================
+The menu only needs the window, the fonts and the menu images. Everything
+gameplay-only (SFX decoding, the 30,000-star starfield) is handed to a
+BackgroundLoader thread so the first frame shows without waiting for it.
+The game installs the results on the main thread once the loader is done,
+or blocks on it the first time gameplay needs them.
+
+StartupReport times each startup phase (``game.py --startup-report``) and
+prints the breakdown once the first frame is up and the loader has finished.
+"""
+
+import threading
+import time
+
+
+class StartupReport:
+    """Named phase timings, measured from ``t0``."""
+
+    def __init__(self, t0: float = None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self._lap = time.perf_counter()
+        self.phases = []        # (name, ms), in order
+        self.background = []    # (name, ms, ready at ms since t0)
+        self.first_frame_ms = None
+        self.enabled = False
+        self.printed = False
+
+    def add(self, name: str, ms: float):
+        self.phases.append((name, ms))
+
+    def lap(self, name: str):
+        """Record the time since the previous lap (or construction) as phase ``name``."""
+        now = time.perf_counter()
+        self.add(name, (now - self._lap) * 1000.0)
+        self._lap = now
+
+    def since_start_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000.0
+
+    def first_frame(self):
+        if self.first_frame_ms is None:
+            self.first_frame_ms = self.since_start_ms()
+
+    def print_report(self):
+        self.printed = True
+        print("startup:")
+        for name, ms in self.phases:
+            print(f"  {name:<10} {ms:8.1f} ms")
+        print(f"  {'total':<10} {sum(ms for _, ms in self.phases):8.1f} ms")
+        if self.first_frame_ms is not None:
+            print(f"  first frame at {self.first_frame_ms:.1f} ms")
+        for name, ms, ready in self.background:
+            print(f"  background {name:<8} {ms:8.1f} ms (ready at {ready:.1f} ms)")
+
+
+class BackgroundLoader:
+    """Runs named load jobs in order on one daemon thread."""
+
+    def __init__(self, report: StartupReport = None):
+        self.report = report
+        self.jobs = []
+        self.results = {}
+        self._error = None
+        self._done = threading.Event()
+        self._thread = None
+
+    def add(self, name: str, fn):
+        self.jobs.append((name, fn))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._worker, name="assets", daemon=True)
+        self._thread.start()
+
+    def _worker(self):
+        try:
+            for name, fn in self.jobs:
+                t = time.perf_counter()
+                self.results[name] = fn()
+                if self.report is not None:
+                    ready = self.report.since_start_ms()
+                    self.report.background.append((name, (time.perf_counter() - t) * 1000.0, ready))
+        except BaseException as exc:
+            self._error = exc
+        finally:
+            self._done.set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self) -> dict:
+        """Block until every job has run; re-raises a job's error."""
+        self._done.wait()
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise err
+        return self.results
@@ -0,0 +1,351 @@
+"""
+Game Stats Module - Compiled player stat snapshot
+=================================================
+Upgrades add and change player attributes at runtime, so hot loops used to
+call ``getattr(player, "name", default)`` for every enemy, bullet and summon
+each frame. PlayerStats declares every upgrade-driven stat with its default
+in one slotted dataclass. ``Player.refresh_stats()`` rebuilds the snapshot
+whenever an upgrade, evolution, legacy powerup or gas pickup is applied, and
+hot loops read ``player.stats.<name>`` as a plain slot attribute.
+
+EFFECT_STATS maps every effect key used in upgrade_trees to the stat it
+changes; tools/check_player_stats.py verifies that mapping.
+"""
+
+from dataclasses import dataclass, fields
+
+
+@dataclass(slots=True)
+class PlayerStats:
+    """Upgrade-driven player stats. Defaults match a fresh Player."""
+
+    # ===== CANNONS / BULLETS =====
+    cannon_count: int = 1
+    cannon_spread: float = 0.0
+    cannon_pattern: str = "forward"
+    has_rear_cannon: bool = False
+    damage: int = 10
+    bullet_speed: float = 11.0
+    fire_rate: float = 5.0
+    bullet_count: int = 1
+    bullet_size_mult: float = 1.0
+    spread_angle_deg: float = 8.0
+    spray_mode: bool = False
+    piercing: bool = False
+    pierce_count: int = 0
+    hitscan_range: float = 0
+    explosive_bullets: bool = False
+    explosion_radius: float = 0
+    explosion_damage: float = 0
+    guided_shots: bool = False
+    homing_strength: float = 0
+    knockback_mult: float = 1.0
+    ammo_save_chance: float = 0
+    siege_mode: bool = False
+
+    # ===== BOUNCING / SPLINTERS =====
+    bounce_count: int = 0
+    bounce_damage_bonus: float = 0
+    bounce_homing: bool = False
+    splinter_on_kill: bool = False
+    splinter_count: int = 3
+    splinter_damage_ratio: float = 0.10
+
+    # ===== MOVEMENT / AMMO =====
+    base_speed: float = 5.0
+    boost_recharge: float = 30.0
+    boost_invuln: bool = False
+    mag_size: int = 12
+    reload_time: float = 1.2
+    magnet_range: float = 160
+    vision_range: float = 400
+    dash_ability: bool = False
+    dash_cooldown: float = 0
+    dash_trail: bool = False
+    dodge_chance: float = 0.0
+
+    # ===== FIRE =====
+    burn_chance: float = 0
+    base_burn_dps: float = 0
+    burn_duration: float = 0
+    burn_bonus_mult: float = 1.0
+    burn_spread: bool = False
+    burn_explosion: bool = False
+    burn_chain_explosions: int = 0
+    burn_heal_chance: float = 0
+
+    # ===== ICE =====
+    freeze_chance: float = 0
+    freeze_duration: float = 0
+    freeze_boss_duration: float = 0.3
+    slow_amount: float = 0
+    frozen_damage_bonus: float = 0
+    shatter_on_death: bool = False
+    shatter_damage: float = 0
+    shatter_damage_ratio: float = 0
+    deep_freeze: bool = False
+    shatter_chain: int = 0
+
+    # ===== POISON =====
+    poison_chance: float = 0
+    base_poison_dps: float = 0
+    poison_duration: float = 0
+    poison_spread: bool = False
+    spread_radius: float = 0
+    poison_weaken: float = 0
+    poison_infinite_spread: bool = False
+    poison_death_explosion: bool = False
+
+    # ===== CURSE =====
+    curse_chance: float = 0
+    curse_delay: float = 0
+    curse_damage_mult: float = 1.0
+    curse_bonus_damage: float = 0
+    curse_vulnerability: float = 0
+
+    # ===== ORBS =====
+    aura_orb_count: int = 0
+    aura_orb_damage: float = 18
+    aura_orb_radius: float = 260
+    aura_orb_speed: float = 1.6
+    aura_orb_elements: tuple = ()
+    orb_burn_dps: float = 0
+    orb_slow: float = 0
+    orb_poison_dps: float = 0
+    orb_trail: bool = False
+    orb_trail_damage: float = 0
+    orb_pulse: bool = False
+
+    # ===== SHIELD / HEALTH =====
+    shield_active: bool = False
+    shield_segments: int = 0
+    shield_radius: float = 2.2
+    shield_reflect: bool = False
+    shield_regen: bool = False
+    shield_regen_time: float = 120.0
+    max_hearts: int = 4
+    hp_regen: bool = False
+    regen_interval: float = 0
+    revive_full_hp: bool = False
+    body_damage: float = 0
+
+    # ===== GLARE =====
+    glare_active: bool = False
+    glare_interval: float = 5.0
+    glare_damage: float = 20
+    glare_slow: float = 0
+    glare_stun: bool = False
+    glare_stun_duration: float = 1.0
+    glare_execute: float = 0
+    glare_dps: float = 0
+    glare_on_hit: bool = False
+
+    # ===== SUMMONS =====
+    summon_damage_mult: float = 1.0
+    summon_attack_speed_mult: float = 1.0
+    drone_count: int = 0
+    drone_damage: float = 0
+    drone_pierce: bool = False
+    drone_burn: bool = False
+    drone_poison: bool = False
+    drone_rapid_fire: bool = False
+    drone_all_elements: bool = False
+    ghost_count: int = 0
+    ghost_damage: float = 0
+    ghost_piercing: bool = False
+    ghost_burn: bool = False
+    ghost_poison: bool = False
+    ghost_rapid_fire: bool = False
+    ghost_all_elements: bool = False
+    phantom_count: int = 0
+    phantom_damage: float = 15
+    phantom_speed: float = 1.0
+    phantom_slow: bool = False
+    phantom_lifesteal: bool = False
+    has_dragon_egg: bool = False
+    dragon_hatch_time: float = 180.0
+    dragon_active: bool = False
+    dragon_damage: float = 20
+    dragon_attack_speed: float = 1.0
+    dragon_fire_breath: bool = False
+    dragon_burn_dps: float = 0
+    dragon_growth: bool = False
+    dragon_damage_growth: float = 5
+    elder_dragon: bool = False
+    dragon_size: float = 1.0
+    lens_count: int = 0
+    lens_multiply: float = 1
+    lens_bullet_mult: int = 1
+    lens_damage_bonus: float = 0
+    lens_split: int = 1
+    lens_enlarge: float = 1.0
+    scythe_count: int = 0
+    scythe_damage: float = 40
+    spear_count: int = 0
+    spear_damage: float = 20
+
+    # ===== EVOLUTIONS =====
+    lightning_active: bool = False
+    lightning_interval: float = 2.0
+    lightning_damage: float = 22
+    lightning_chain: int = 0
+    electro_bug: bool = False
+    electro_bug_targets: int = 2
+    gale_damage: float = 20
+    gale_scales_speed: bool = False
+    gale_center_damage_mult: float = 1.0
+
+    @classmethod
+    def capture(cls, player) -> 'PlayerStats':
+        """Snapshot the player's current stats (missing ones use the defaults)."""
+        stats = cls()
+        for name in STAT_NAMES:
+            value = getattr(player, name, None)
+            if value is not None:
+                if isinstance(value, list):
+                    value = tuple(value)
+                setattr(stats, name, value)
+        return stats
+
+
+STAT_NAMES = tuple(f.name for f in fields(PlayerStats))
+
+
+# Effect key (upgrade_trees) -> PlayerStats field it changes
+EFFECT_STATS = {
+    "cannon_count": "cannon_count",
+    "cannon_spread": "cannon_spread",
+    "cannon_pattern": "cannon_pattern",
+    "has_rear_cannon": "has_rear_cannon",
+    "damage_mult": "damage",
+    "bullet_speed_mult": "bullet_speed",
+    "fire_rate_mult": "fire_rate",
+    "bullet_size_mult": "bullet_size_mult",
+    "pierce_count": "pierce_count",
+    "bullet_count": "bullet_count",
+    "hitscan_range": "hitscan_range",
+    "explosive_bullets": "explosive_bullets",
+    "explosion_radius": "explosion_radius",
+    "explosion_damage": "explosion_damage",
+    "spray_mode": "spray_mode",
+    "spread_angle": "spread_angle_deg",
+    "homing_bullets": "guided_shots",
+    "homing_strength": "homing_strength",
+    "ammo_save_chance": "ammo_save_chance",
+    "bounce_count": "bounce_count",
+    "bounce_damage_bonus": "bounce_damage_bonus",
+    "bounce_homing": "bounce_homing",
+    "move_speed_mult": "base_speed",
+    "boost_recharge_mult": "boost_recharge",
+    "boost_invuln": "boost_invuln",
+    "mag_size_bonus": "mag_size",
+    "reload_speed_mult": "reload_time",
+    "dash_ability": "dash_ability",
+    "dash_cooldown": "dash_cooldown",
+    "dash_trail": "dash_trail",
+    "dodge_chance": "dodge_chance",
+    "burn_chance": "burn_chance",
+    "burn_dps": "base_burn_dps",
+    "burn_duration": "burn_duration",
+    "burn_dps_mult": "burn_bonus_mult",
+    "burn_spread": "burn_spread",
+    "burn_explosion": "burn_explosion",
+    "burn_chain_explosions": "burn_chain_explosions",
+    "freeze_chance": "freeze_chance",
+    "slow_amount": "slow_amount",
+    "freeze_duration": "freeze_duration",
+    "frozen_damage_bonus": "frozen_damage_bonus",
+    "shatter_on_death": "shatter_on_death",
+    "shatter_damage": "shatter_damage",
+    "deep_freeze": "deep_freeze",
+    "shatter_chain": "shatter_chain",
+    "poison_chance": "poison_chance",
+    "poison_dps": "base_poison_dps",
+    "poison_duration": "poison_duration",
+    "poison_spread": "poison_spread",
+    "spread_radius": "spread_radius",
+    "poison_weaken": "poison_weaken",
+    "poison_infinite_spread": "poison_infinite_spread",
+    "poison_death_explosion": "poison_death_explosion",
+    "orb_count": "aura_orb_count",
+    "orb_damage": "aura_orb_damage",
+    "orb_damage_mult": "aura_orb_damage",
+    "orb_radius": "aura_orb_radius",
+    "orb_speed_mult": "aura_orb_speed",
+    "orb_burn": "aura_orb_elements",
+    "orb_freeze": "aura_orb_elements",
+    "orb_poison": "aura_orb_elements",
+    "orb_all_elements": "aura_orb_elements",
+    "orb_burn_dps": "orb_burn_dps",
+    "orb_slow": "orb_slow",
+    "orb_poison_dps": "orb_poison_dps",
+    "orb_trail": "orb_trail",
+    "orb_trail_damage": "orb_trail_damage",
+    "orb_pulse": "orb_pulse",
+    "shield_active": "shield_active",
+    "shield_segments": "shield_segments",
+    "shield_radius": "shield_radius",
+    "shield_reflect": "shield_reflect",
+    "shield_regen": "shield_regen",
+    "shield_regen_time": "shield_regen_time",
+    "max_hp": "max_hearts",
+    "hp_regen": "hp_regen",
+    "regen_interval": "regen_interval",
+    "revive_full_hp": "revive_full_hp",
+    "glare_active": "glare_active",
+    "glare_interval": "glare_interval",
+    "glare_damage": "glare_damage",
+    "glare_damage_mult": "glare_damage",
+    "glare_slow": "glare_slow",
+    "glare_stun": "glare_stun",
+    "glare_stun_duration": "glare_stun_duration",
+    "glare_execute": "glare_execute",
+    "drone_count": "drone_count",
+    "drone_damage": "drone_damage",
+    "drone_pierce": "drone_pierce",
+    "drone_burn": "drone_burn",
+    "drone_poison": "drone_poison",
+    "drone_rapid_fire": "drone_rapid_fire",
+    "drone_all_elements": "drone_all_elements",
+    "ghost_count": "ghost_count",
+    "ghost_damage": "ghost_damage",
+    "ghost_pierce": "ghost_piercing",
+    "ghost_burn": "ghost_burn",
+    "ghost_poison": "ghost_poison",
+    "ghost_rapid_fire": "ghost_rapid_fire",
+    "ghost_all_elements": "ghost_all_elements",
+    "phantom_count": "phantom_count",
+    "phantom_damage": "phantom_damage",
+    "phantom_slow": "phantom_slow",
+    "phantom_lifesteal": "phantom_lifesteal",
+    "phantom_speed": "phantom_speed",
+    "dragon_egg": "has_dragon_egg",
+    "dragon_hatch_time": "dragon_hatch_time",
+    "dragon_active": "dragon_active",
+    "dragon_damage": "dragon_damage",
+    "dragon_fire_breath": "dragon_fire_breath",
+    "dragon_burn_dps": "dragon_burn_dps",
+    "dragon_growth": "dragon_growth",
+    "dragon_damage_growth": "dragon_damage_growth",
+    "elder_dragon": "elder_dragon",
+    "dragon_size": "dragon_size",
+    "lens_count": "lens_count",
+    "lens_multiply": "lens_multiply",
+    "lens_bullet_mult": "lens_bullet_mult",
+    "lens_damage_bonus": "lens_damage_bonus",
+    "lens_split": "lens_split",
+    "lens_enlarge": "lens_enlarge",
+    "lightning_active": "lightning_active",
+    "lightning_interval": "lightning_interval",
+    "lightning_damage": "lightning_damage",
+    "lightning_chain": "lightning_chain",
+    "summon_count_mult": "ghost_count",
+    "summon_damage_mult": "summon_damage_mult",
+}
+
+# Effect keys that top up live player state rather than a stat. They are
+# read straight from the Player (they change every hit or death).
+EFFECT_LIVE_STATE = {
+    "shield_hp": "shield_hp",
+    "revive": "revives",
+}
@@ -1,6 +1,7 @@
 import os
 import pygame
 from game_constants import COLOR_WHITE
+from game_assets import baked_assets
 
 
 # --- input coordinate transform (window -> game logical coords) ---
@@ -81,18 +82,30 @@ def get_mouse_pos():
     return map_point(pygame.mouse.get_pos())
 
 
-# Try loading button container assets once at module import
+# Button container assets, loaded on first use (or by Game at startup) so that
+# importing the module stays cheap and the images can be converted for the display
 _ASSET_DIR = os.path.join(os.path.dirname(__file__), "Assets", "Images")
 _BTN_IMG_PATH = os.path.join(_ASSET_DIR, "button_container.png")
 _BTN_PRESSED_PATH = os.path.join(_ASSET_DIR, "button_container_pressed.png")
-try:
-    _BTN_IMG = pygame.image.load(_BTN_IMG_PATH) if os.path.isfile(_BTN_IMG_PATH) else None
-except Exception:
-    _BTN_IMG = None
-try:
-    _BTN_PRESSED = pygame.image.load(_BTN_PRESSED_PATH) if os.path.isfile(_BTN_PRESSED_PATH) else None
-except Exception:
-    _BTN_PRESSED = None
+_BTN_IMG = None
+_BTN_PRESSED = None
+_BTN_LOADED = False
+
+
+def load_button_images():
+    """Load the button container images once; missing files leave them None."""
+    global _BTN_IMG, _BTN_PRESSED, _BTN_LOADED
+    if _BTN_LOADED:
+        return
+    _BTN_LOADED = True
+    try:
+        _BTN_IMG = baked_assets.image(_BTN_IMG_PATH)
+    except Exception:
+        _BTN_IMG = None
+    try:
+        _BTN_PRESSED = baked_assets.image(_BTN_PRESSED_PATH)
+    except Exception:
+        _BTN_PRESSED = None
 
 
 def _draw_ninepatch(target_surf, img, rect, border=12):
@@ -156,6 +169,37 @@ def _draw_ninepatch(target_surf, img, rect, border=12):
         blit_region(left, top, center_w, center_h, x + dest_left, y + dest_top, dest_center_w, dest_center_h)
 
 
+# Nine-patches rendered at a given size, reused every frame: (path, size, border) -> Surface.
+# Filled from Assets/Baked when tools/bake_assets.py has pre-rendered the size.
+_NINEPATCH_CACHE = {}
+
+
+def ninepatch_surface(img, path, size, border=12):
+    """`img` nine-patched to `size`, rendered once per (path, size, border)."""
+    key = (path, tuple(size), border)
+    surf = _NINEPATCH_CACHE.get(key)
+    if surf is None:
+        surf = baked_assets.ninepatch(path, key[1], border)
+        if surf is None:
+            surf = pygame.Surface(key[1], pygame.SRCALPHA)
+            _draw_ninepatch(surf, img, surf.get_rect(), border)
+        _NINEPATCH_CACHE[key] = surf
+    return surf
+
+
+def draw_button_container(target_surf, rect, pressed, border=12):
+    """Blit the (pressed) button container into `rect`; False when the assets are missing."""
+    load_button_images()
+    if pressed and _BTN_PRESSED is not None:
+        img, path = _BTN_PRESSED, _BTN_PRESSED_PATH
+    elif _BTN_IMG is not None:
+        img, path = _BTN_IMG, _BTN_IMG_PATH
+    else:
+        return False
+    target_surf.blit(ninepatch_surface(img, path, (rect.w, rect.h), border), rect.topleft)
+    return True
+
+
 class Button:
     def __init__(self, rect, text, font, base_color, hover_color, active_color=None):
         self.rect = pygame.Rect(rect)
@@ -171,10 +215,7 @@ class Button:
         is_pressed = is_hover and pygame.mouse.get_pressed()[0]
 
         # Use pressed asset for hover *and* pressed states (hover effect)
-        img = _BTN_PRESSED if (is_pressed or is_hover) and _BTN_PRESSED is not None else _BTN_IMG
-        if img is not None:
-            _draw_ninepatch(surf, img, self.rect, border=8)
-        else:
+        if not draw_button_container(surf, self.rect, is_pressed or is_hover, border=8):
             color = self.active_color if is_pressed else (self.hover_color if is_hover else self.base_color)
             pygame.draw.rect(surf, color, self.rect, border_radius=8)
 
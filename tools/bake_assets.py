@@ -0,0 +1,149 @@
+"""
+Bake game assets for faster startup and menus.
+Writes pre-processed copies of the shipped assets to Assets/Baked:
+- every SFX in Assets/Sounds (music excluded, it streams) decoded to WAV in
+  the mixer's native format, so the game never decodes MP3 at startup
+- Assets/Images/menu-bg.png pre-scaled to every WINDOW_SIZES entry
+- the button nine-patches pre-rendered at every button size the UI uses
+plus Assets/Baked/manifest.json with the sha256 of each source file. The
+game (game_assets.py) only uses a baked file while its source hash matches,
+so stale bakes are ignored rather than shown. Re-run after changing assets.
+Run: python tools/bake_assets.py [--clean]
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import wave
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import pygame  # noqa: E402
+from game_assets import (  # noqa: E402
+    ASSETS_DIR,
+    BAKED_DIR,
+    MANIFEST_PATH,
+    MANIFEST_VERSION,
+    asset_key,
+    file_sha256,
+    ninepatch_key,
+    scaled_key,
+)
+from game_constants import WINDOW_SIZES  # noqa: E402
+
+SOUNDS_DIR = os.path.join(ASSETS_DIR, "Sounds")
+IMAGES_DIR = os.path.join(ASSETS_DIR, "Images")
+# Streamed with pygame.mixer.music, never loaded as Sound
+MUSIC_FILES = ("menu-bg.mp3", "ingame-bg.mp3", "defeat-bg.wav")
+MENU_BG = os.path.join(IMAGES_DIR, "menu-bg.png")
+# Saved uncompressed: loading skips PNG inflate
+IMAGE_EXT = ".bmp"
+
+
+def _out_name(key: str, ext: str) -> str:
+    return key.replace("/", "_").replace("@", "_") + ext
+
+
+# ===== SOUNDS =====
+
+def bake_sound(path: str, out_path: str, mixer: tuple):
+    """Decode ``path`` with the mixer and write the raw samples as a WAV file."""
+    freq, fmt, channels = mixer
+    raw = pygame.mixer.Sound(path).get_raw()
+    with wave.open(out_path, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(freq)
+        w.writeframes(raw)
+
+
+def bake_sounds(entries: dict):
+    mixer = pygame.mixer.get_init()
+    if mixer[1] != -16:
+        # wave only writes signed 16-bit PCM; the game keeps decoding the sources
+        print(f"mixer format {mixer[1]} is not signed 16-bit, sounds not baked")
+        return
+    for name in sorted(os.listdir(SOUNDS_DIR)):
+        path = os.path.join(SOUNDS_DIR, name)
+        if name in MUSIC_FILES or not name.lower().endswith((".mp3", ".wav", ".ogg")):
+            continue
+        key = asset_key(path)
+        out = _out_name(key, ".wav")
+        bake_sound(path, os.path.join(BAKED_DIR, out), mixer)
+        entries[key] = {"output": out, "sha256": file_sha256(path), "mixer": list(mixer)}
+        print(f"sound  {key} -> {out}")
+
+
+# ===== IMAGES =====
+
+def _save(surf, key: str, source: str, entries: dict):
+    out = _out_name(key, IMAGE_EXT)
+    pygame.image.save(surf, os.path.join(BAKED_DIR, out))
+    entries[key] = {"output": out, "sha256": file_sha256(source)}
+    print(f"image  {key} -> {out}")
+
+
+def bake_menu_backgrounds(entries: dict):
+    if not os.path.isfile(MENU_BG):
+        return
+    img = pygame.image.load(MENU_BG).convert_alpha()
+    for size in WINDOW_SIZES:
+        _save(pygame.transform.smoothscale(img, size), scaled_key(MENU_BG, size), MENU_BG, entries)
+
+
+def button_sizes(game) -> set:
+    """(w, h, border) of every button the UI draws, read off a live Game."""
+    from game_ui import Button
+    sizes = {(b.rect.w, b.rect.h, 8) for b in vars(game).values() if isinstance(b, Button)}
+    toggle = game._test_toggle_rect()
+    sizes.add((toggle.w, toggle.h, 12))
+    return sizes
+
+
+def bake_buttons(entries: dict):
+    import game_ui
+    from game import Game
+    game = Game()
+    game.record_replays = False
+    for img, path in ((game_ui._BTN_IMG, game_ui._BTN_IMG_PATH),
+                      (game_ui._BTN_PRESSED, game_ui._BTN_PRESSED_PATH)):
+        if img is None:
+            continue
+        for w, h, border in sorted(button_sizes(game)):
+            # Same renderer as the runtime fallback, so baked and unbaked buttons match
+            surf = pygame.Surface((w, h), pygame.SRCALPHA)
+            game_ui._draw_ninepatch(surf, img, surf.get_rect(), border)
+            _save(surf, ninepatch_key(path, (w, h), border), path, entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clean", action="store_true", help="delete Assets/Baked before baking")
+    args = parser.parse_args()
+
+    if args.clean and os.path.isdir(BAKED_DIR):
+        shutil.rmtree(BAKED_DIR)
+    os.makedirs(BAKED_DIR, exist_ok=True)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    import audio  # noqa: F401  (initialises the mixer exactly like the game)
+
+    entries = {}
+    bake_sounds(entries)
+    bake_menu_backgrounds(entries)
+    bake_buttons(entries)
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "entries": entries}, f, indent=2, sort_keys=True)
+    print(f"wrote {len(entries)} baked assets to {BAKED_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
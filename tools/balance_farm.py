@@ -0,0 +1,335 @@
+"""
+Headless balance farm.
+Fans seeded bot runs out over a process pool (one Game per worker) to tune
+the difficulty curve and the upgrade trees without playing by hand. Every
+run plays the kiting bot from headless_bench and picks level-up options by a
+named strategy. Results stream back as runs finish. They are written to
+<out>/runs.csv (one row per run), <out>/upgrades.csv (per-upgrade win-rate
+table) and <out>/summary.json (per-strategy means and DPS timelines).
+A run is "won" when the player is still alive after --seconds.
+Run: python tools/balance_farm.py --runs 2000 --seconds 180 --strategies first,random,offense,defense
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(TOOLS_DIR)
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, TOOLS_DIR)
+
+from headless_bench import BotInput  # noqa: E402
+from game_constants import (  # noqa: E402
+    FPS,
+    STATE_PLAYING,
+    STATE_LEVEL_UP,
+    STATE_EVOLUTION,
+    STATE_DEAD_ANIM,
+    STATE_GAME_OVER,
+)
+from game_entities import ENEMY_POOL, Enemy  # noqa: E402
+from game_powerups import apply_evolution  # noqa: E402
+from upgrade_trees import UPGRADES_BY_ID  # noqa: E402
+
+DPS_BUCKET = 10.0   # seconds per DPS timeline sample
+
+OFFENSE_CATEGORIES = ("BULLETS", "CANNONS", "ELEMENTS", "ORBS", "EVOLUTION")
+DEFENSE_CATEGORIES = ("DEFENSE", "PLAYER", "SUMMONS", "VISION")
+
+
+# ===== UPGRADE STRATEGIES =====
+# strategy(options, rng) -> index into the level-up options (upgrade ids)
+
+def _pick_first(options, rng):
+    return 0
+
+
+def _pick_random(options, rng):
+    return rng.randrange(len(options))
+
+
+def _prefer(categories):
+    def pick(options, rng):
+        for i, uid in enumerate(options):
+            upgrade = UPGRADES_BY_ID.get(uid)
+            if upgrade is not None and upgrade.category in categories:
+                return i
+        return 0
+    return pick
+
+
+def _pick_tier(options, rng):
+    # Highest tier first: rush ultimates
+    tiers = [getattr(UPGRADES_BY_ID.get(uid), "tier", 0) for uid in options]
+    return tiers.index(max(tiers))
+
+
+STRATEGIES = {
+    "first": _pick_first,
+    "random": _pick_random,
+    "offense": _prefer(OFFENSE_CATEGORIES),
+    "defense": _prefer(DEFENSE_CATEGORIES),
+    "tier": _pick_tier,
+}
+
+
+# ===== DAMAGE COUNTING =====
+
+class CountingEnemy(Enemy):
+    """Enemy whose ``hp`` setter adds every HP decrease (down to 0) to ``damage``.
+
+    Installed as ENEMY_POOL's class in the workers only, so every hit, DoT,
+    aura and execute path is counted without instrumenting the game. Merges
+    and elite scaling raise HP, and reset() bypasses the setter, so neither
+    counts.
+    """
+
+    __slots__ = ("_hp",)
+    damage = 0.0
+
+    def reset(self, *args, **kwargs):
+        self._hp = 0
+        super().reset(*args, **kwargs)
+
+    @property
+    def hp(self):
+        return self._hp
+
+    @hp.setter
+    def hp(self, value):
+        old = self._hp
+        if value < old and old > 0:
+            CountingEnemy.damage += old - (value if value > 0 else 0)
+        self._hp = value
+
+
+# ===== WORKER =====
+
+_GAME = None
+
+
+def _init_worker():
+    """Build one Game per worker process; runs reuse it via reset_game."""
+    global _GAME
+    from game import Game
+    _GAME = Game()
+    # Workers would race on (and clobber) the player's replays/last_run.avzr
+    _GAME.record_replays = False
+    _GAME.finish_loading()
+    # Every enemy from here on counts its damage taken
+    ENEMY_POOL.cls = CountingEnemy
+    ENEMY_POOL.free.clear()
+    ENEMY_POOL.pending.clear()
+
+
+def play_run(seed, strategy, seconds, immortal=False):
+    """Play one bot run and return its outcome, picks, DPS timeline and frame cost."""
+    game = _GAME
+    pick = STRATEGIES[strategy]
+    rng = random.Random(seed)
+    game.reset_game(seed=seed)
+    game.state = STATE_PLAYING
+    game.input_source = BotInput()
+
+    dt = 1.0 / FPS
+    hits = 0
+    picks = []
+    frame_ms = []
+    bucket_frames = int(DPS_BUCKET * FPS)
+    dps = []
+    # CountingEnemy.damage counts HP lost to every damage source
+    bucket_start = CountingEnemy.damage
+    won = True
+    for frame in range(int(seconds * FPS)):
+        if game.state == STATE_LEVEL_UP:
+            if game.levelup_options:
+                uid = game.levelup_options[pick(game.levelup_options, rng)]
+                game.apply_levelup_choice(uid)
+                picks.append(uid)
+            game.state = STATE_PLAYING
+        elif game.state == STATE_EVOLUTION:
+            if game.evolution_options:
+                apply_evolution(game.player, game.evolution_options[0])
+            game.state = STATE_PLAYING
+        elif game.state in (STATE_DEAD_ANIM, STATE_GAME_OVER):
+            won = False
+            break
+
+        hearts = game.player.hearts
+        t0 = time.perf_counter()
+        game.update(dt)
+        frame_ms.append((time.perf_counter() - t0) * 1000.0)
+        if game.player.hearts < hearts:
+            hits += hearts - game.player.hearts
+            if immortal:
+                game.player.hearts = game.player.max_hearts
+                if game.state == STATE_DEAD_ANIM:
+                    game.state = STATE_PLAYING
+
+        if (frame + 1) % bucket_frames == 0:
+            dps.append(round((CountingEnemy.damage - bucket_start) / DPS_BUCKET, 1))
+            bucket_start = CountingEnemy.damage
+
+    frame_ms.sort()
+    n = len(frame_ms) or 1
+    return {
+        "seed": seed,
+        "strategy": strategy,
+        "survived": round(game.elapsed_time, 2),
+        "won": won and game.state not in (STATE_DEAD_ANIM, STATE_GAME_OVER),
+        "kills": game.kills,
+        "level": game.player.level,
+        "hits": hits,
+        "frames": len(frame_ms),
+        "p50_ms": round(frame_ms[n // 2], 3) if frame_ms else 0.0,
+        "p95_ms": round(frame_ms[min(n - 1, int(n * 0.95))], 3) if frame_ms else 0.0,
+        "upgrades": picks,
+        "dps": dps,
+    }
+
+
+# ===== AGGREGATION =====
+
+RUN_FIELDS = ("seed", "strategy", "survived", "won", "kills", "level", "hits",
+              "frames", "p50_ms", "p95_ms", "upgrades", "dps")
+
+
+def _mean(values):
+    values = list(values)
+    return sum(values) / len(values) if values else 0.0
+
+
+def upgrade_table(rows):
+    """Per-upgrade win rate and survival, with and without the upgrade."""
+    total = len(rows)
+    total_wins = sum(1 for r in rows if r["won"])
+    by_upgrade = {}
+    for r in rows:
+        for uid in set(r["upgrades"]):
+            by_upgrade.setdefault(uid, []).append(r)
+    table = []
+    for uid, picked in by_upgrade.items():
+        wins = sum(1 for r in picked if r["won"])
+        rest = total - len(picked)
+        table.append({
+            "upgrade": uid,
+            "runs": len(picked),
+            "win_rate": round(wins / len(picked), 4),
+            "win_rate_without": round((total_wins - wins) / rest, 4) if rest else None,
+            "mean_survived": round(_mean(r["survived"] for r in picked), 2),
+            "mean_kills": round(_mean(r["kills"] for r in picked), 1),
+        })
+    table.sort(key=lambda t: (-t["win_rate"], -t["runs"]))
+    return table
+
+
+def strategy_summary(rows):
+    """Means per strategy, with the DPS timeline averaged bucket by bucket."""
+    out = {}
+    for name in sorted({r["strategy"] for r in rows}):
+        group = [r for r in rows if r["strategy"] == name]
+        width = max(len(r["dps"]) for r in group)
+        timeline = []
+        for i in range(width):
+            samples = [r["dps"][i] for r in group if len(r["dps"]) > i]
+            timeline.append(round(_mean(samples), 1))
+        out[name] = {
+            "runs": len(group),
+            "win_rate": round(_mean(1.0 if r["won"] else 0.0 for r in group), 4),
+            "mean_survived": round(_mean(r["survived"] for r in group), 2),
+            "mean_kills": round(_mean(r["kills"] for r in group), 1),
+            "mean_level": round(_mean(r["level"] for r in group), 2),
+            "mean_p95_ms": round(_mean(r["p95_ms"] for r in group), 3),
+            "dps_timeline": timeline,
+        }
+    return out
+
+
+def _csv_row(r):
+    row = dict(r)
+    row["upgrades"] = "|".join(r["upgrades"])
+    row["dps"] = " ".join(str(v) for v in r["dps"])
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200, help="runs per strategy")
+    parser.add_argument("--seconds", type=float, default=180.0, help="simulated seconds per run")
+    parser.add_argument("--seed", type=int, default=1, help="first seed")
+    parser.add_argument("--strategies", default="first,random,offense,defense",
+                        help=f"comma-separated upgrade strategies ({', '.join(STRATEGIES)})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--immortal", action="store_true", help="refill hearts so every run lasts --seconds")
+    parser.add_argument("--out", default=os.path.join(BASE_DIR, "runs", "balance"), help="output directory")
+    args = parser.parse_args()
+
+    strategies = [s.strip() for s in args.strategies.split(",") if s.strip()]
+    unknown = [s for s in strategies if s not in STRATEGIES]
+    if unknown:
+        parser.error(f"unknown strategies: {', '.join(unknown)}")
+
+    # Every strategy plays the same seeds so they are compared like for like
+    tasks = [(args.seed + i, s, args.seconds, args.immortal)
+             for i in range(args.runs) for s in strategies]
+    os.makedirs(args.out, exist_ok=True)
+    rows = []
+    t0 = time.perf_counter()
+    with open(os.path.join(args.out, "runs.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RUN_FIELDS)
+        writer.writeheader()
+
+        def collect(row):
+            rows.append(row)
+            writer.writerow(_csv_row(row))
+            done = len(rows)
+            if done % 50 == 0 or done == len(tasks):
+                rate = done / max(1e-9, time.perf_counter() - t0)
+                print(f"{done}/{len(tasks)} runs  {rate:.1f} runs/s")
+
+        if args.workers <= 1:
+            _init_worker()
+            for task in tasks:
+                collect(play_run(*task))
+        else:
+            with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+                futures = [pool.submit(play_run, *task) for task in tasks]
+                for fut in as_completed(futures):
+                    collect(fut.result())
+
+    table = upgrade_table(rows)
+    with open(os.path.join(args.out, "upgrades.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=("upgrade", "runs", "win_rate", "win_rate_without",
+                                               "mean_survived", "mean_kills"))
+        writer.writeheader()
+        writer.writerows(table)
+
+    summary = {
+        "runs": len(rows),
+        "seconds": args.seconds,
+        "immortal": args.immortal,
+        "workers": args.workers,
+        "wall_s": round(time.perf_counter() - t0, 1),
+        "strategies": strategy_summary(rows),
+        "upgrades": table,
+    }
+    with open(os.path.join(args.out, "summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+
+    for name, s in summary["strategies"].items():
+        print(f"{name:>8}: win {s['win_rate'] * 100:5.1f}%  survived {s['mean_survived']:7.1f}s  "
+              f"kills {s['mean_kills']:7.1f}  level {s['mean_level']:5.2f}  p95 {s['mean_p95_ms']:.2f}ms")
+    print(f"wrote {args.out} ({summary['wall_s']}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
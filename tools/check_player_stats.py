@@ -0,0 +1,55 @@
+"""
+Check that every upgrade effect key is compiled into PlayerStats.
+Effects applied to the player but missing from game_stats.EFFECT_STATS would
+be set on the Player and silently ignored by the hot loops, which read
+player.stats. Exits non-zero and lists the offending keys.
+Run: python tools/check_player_stats.py
+"""
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from game_stats import EFFECT_LIVE_STATE, EFFECT_STATS, STAT_NAMES, PlayerStats  # noqa: E402
+from upgrade_trees import ALL_TREES, EVOLUTIONS  # noqa: E402
+
+
+def collect_effect_keys():
+    """Map each effect key to the upgrades/evolutions that use it."""
+    keys = {}
+    for tree in ALL_TREES:
+        for upgrade in tree["upgrades"]:
+            for key in upgrade.effects:
+                keys.setdefault(key, []).append(upgrade.id)
+    for evo_id, evo in EVOLUTIONS.items():
+        for key in evo.get("effects", {}):
+            keys.setdefault(key, []).append(evo_id)
+    return keys
+
+
+def main():
+    failures = []
+    for key, users in sorted(collect_effect_keys().items()):
+        if key in EFFECT_LIVE_STATE:
+            continue
+        stat = EFFECT_STATS.get(key)
+        if stat is None:
+            failures.append(f"{key}: not in EFFECT_STATS (used by {', '.join(users)})")
+        elif stat not in STAT_NAMES:
+            failures.append(f"{key}: maps to unknown stat {stat!r}")
+
+    # A fresh snapshot must build from defaults alone
+    PlayerStats()
+
+    if failures:
+        print("PlayerStats coverage check failed:")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    print(f"ok: {len(EFFECT_STATS)} effect keys compiled into {len(STAT_NAMES)} stats")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
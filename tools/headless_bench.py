@@ -0,0 +1,195 @@
+"""
+Headless gameplay benchmark.
+Runs the simulation without a window or audio using a scripted bot and
+reports frame-time stats and gameplay outcomes (survival time, kills, level,
+hits taken). With --compare-lod every seed is played with enemy LOD on and
+off, and the run fails if the outcomes drift further apart than --tolerance.
+--immortal refills the player's hearts every frame (hits are still counted)
+so runs last the full duration instead of ending on a chaotic early death.
+Run: python tools/headless_bench.py --seconds 240 --seeds 3 --immortal --compare-lod
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+import pygame  # noqa: E402
+from game import Game  # noqa: E402
+from game_constants import (  # noqa: E402
+    FPS,
+    STATE_PLAYING,
+    STATE_LEVEL_UP,
+    STATE_EVOLUTION,
+    STATE_DEAD_ANIM,
+    STATE_GAME_OVER,
+)
+from game_powerups import apply_evolution  # noqa: E402
+
+
+class BotKeys:
+    """Minimal stand-in for pygame's pressed-keys sequence."""
+
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class BotInput:
+    """Fires at the nearest enemy and backs away from anything too close."""
+
+    DANGER_RADIUS = 420
+
+    def poll(self, game):
+        p = game.player
+        center = (game.w / 2, game.h / 2)
+        if not game.enemies:
+            return BotKeys((pygame.K_d,)), False, center
+
+        nearest = min(game.enemies, key=lambda e: (e.x - p.x) ** 2 + (e.y - p.y) ** 2)
+        zoom = game.view_zoom
+        aim = (center[0] + (nearest.x - p.x) * zoom, center[1] + (nearest.y - p.y) * zoom)
+
+        # Flee from the centroid of nearby enemies, otherwise drift in a slow circle
+        ax = ay = 0.0
+        danger_sq = self.DANGER_RADIUS * self.DANGER_RADIUS
+        for e in game.enemies:
+            dx = p.x - e.x
+            dy = p.y - e.y
+            d2 = dx * dx + dy * dy
+            if d2 < danger_sq:
+                w = 1.0 / max(1.0, math.sqrt(d2))
+                ax += dx * w
+                ay += dy * w
+        if abs(ax) < 1e-6 and abs(ay) < 1e-6:
+            ang = game.elapsed_time * 0.4
+            ax, ay = math.cos(ang), math.sin(ang)
+
+        pressed = []
+        if ax > 0.3 * abs(ay):
+            pressed.append(pygame.K_d)
+        elif ax < -0.3 * abs(ay):
+            pressed.append(pygame.K_a)
+        if ay > 0.3 * abs(ax):
+            pressed.append(pygame.K_s)
+        elif ay < -0.3 * abs(ax):
+            pressed.append(pygame.K_w)
+        return BotKeys(pressed), True, aim
+
+
+def run_once(game, seed, seconds, lod=True, draw=False, immortal=False):
+    """Play one bot run and return its outcome/timing summary."""
+    # Bot picks and immortal refills bypass the recorder: the replay wouldn't play back
+    game.record_replays = False
+    game.reset_game(seed=seed)
+    game.state = STATE_PLAYING
+    game.lod.enabled = lod
+    game.input_source = BotInput()
+
+    dt = 1.0 / FPS
+    hits = 0
+    frame_ms = []
+    frames = int(seconds * FPS)
+    for _ in range(frames):
+        if game.state == STATE_LEVEL_UP:
+            if game.levelup_options:
+                game.apply_levelup_choice(game.levelup_options[0])
+            game.state = STATE_PLAYING
+        elif game.state == STATE_EVOLUTION:
+            if game.evolution_options:
+                apply_evolution(game.player, game.evolution_options[0])
+            game.state = STATE_PLAYING
+        elif game.state in (STATE_DEAD_ANIM, STATE_GAME_OVER):
+            break
+
+        hearts = game.player.hearts
+        t0 = time.perf_counter()
+        game.update(dt)
+        if draw:
+            game.draw()
+        frame_ms.append((time.perf_counter() - t0) * 1000.0)
+        if game.player.hearts < hearts:
+            hits += hearts - game.player.hearts
+            if immortal:
+                game.player.hearts = game.player.max_hearts
+                if game.state == STATE_DEAD_ANIM:
+                    game.state = STATE_PLAYING
+
+    frame_ms.sort()
+    n = len(frame_ms) or 1
+    return {
+        "seed": seed,
+        "lod": lod,
+        "survived": round(game.elapsed_time, 2),
+        "kills": game.kills,
+        "level": game.player.level,
+        "hits": hits,
+        "frames": len(frame_ms),
+        "p50_ms": frame_ms[n // 2] if frame_ms else 0.0,
+        "p95_ms": frame_ms[min(n - 1, int(n * 0.95))] if frame_ms else 0.0,
+        "max_ms": frame_ms[-1] if frame_ms else 0.0,
+    }
+
+
+def _mean(rows, key):
+    return sum(r[key] for r in rows) / max(1, len(rows))
+
+
+def _print_row(r):
+    print(
+        f"seed {r['seed']:>4} lod {'on ' if r['lod'] else 'off'} | "
+        f"survived {r['survived']:7.1f}s kills {r['kills']:5d} level {r['level']:3d} hits {r['hits']:3d} | "
+        f"p50 {r['p50_ms']:6.2f}ms p95 {r['p95_ms']:6.2f}ms max {r['max_ms']:7.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=180.0, help="simulated seconds per run")
+    parser.add_argument("--seeds", type=int, default=3, help="number of seeded runs")
+    parser.add_argument("--seed", type=int, default=1, help="first seed")
+    parser.add_argument("--draw", action="store_true", help="include rendering in frame times")
+    parser.add_argument("--immortal", action="store_true", help="refill hearts so every run lasts --seconds")
+    parser.add_argument("--no-lod", action="store_true", help="disable enemy LOD")
+    parser.add_argument("--compare-lod", action="store_true", help="run with LOD on and off and compare outcomes")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative drift for --compare-lod")
+    args = parser.parse_args()
+
+    game = Game()
+    game.finish_loading()
+    seeds = [args.seed + i for i in range(args.seeds)]
+    modes = [True, False] if args.compare_lod else [not args.no_lod]
+    results = {mode: [] for mode in modes}
+    for seed in seeds:
+        for mode in modes:
+            row = run_once(game, seed, args.seconds, lod=mode, draw=args.draw, immortal=args.immortal)
+            results[mode].append(row)
+            _print_row(row)
+
+    if not args.compare_lod:
+        return 0
+
+    on, off = results[True], results[False]
+    print(f"mean p95: lod on {_mean(on, 'p95_ms'):.2f}ms, lod off {_mean(off, 'p95_ms'):.2f}ms")
+    ok = True
+    for key in ("survived", "kills", "level"):
+        a, b = _mean(on, key), _mean(off, key)
+        drift = abs(a - b) / max(1e-9, abs(b))
+        status = "ok" if drift <= args.tolerance else "OUT OF TOLERANCE"
+        ok = ok and drift <= args.tolerance
+        print(f"{key:>8}: lod on {a:9.2f}  lod off {b:9.2f}  drift {drift * 100:5.1f}%  {status}")
+    # Hit counts are too small per run for a relative check; report only
+    print(f"    hits: lod on {_mean(on, 'hits'):9.2f}  lod off {_mean(off, 'hits'):9.2f}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,21 +5,359 @@ Handles upgrade application and effect management.
 """
 
 import math
-import random
 from typing import List, Dict, Set
 from upgrade_trees import (
     Upgrade, UPGRADES_BY_ID, TREES_BY_ID, ALL_TREES,
     EVOLUTIONS, get_tier3_upgrades, get_all_effects_for_tier3,
-    get_available_evolutions, CATEGORIES
+    get_available_evolutions, CATEGORIES,
+    UPGRADE_ORDER, UPGRADE_BITS, UPGRADE_DEPENDENTS, INITIAL_AVAILABLE_MASK,
+    is_upgrade_available, iter_mask,
 )
+from game_random import RandomStreams
+
+
+# ===== EFFECT HANDLERS =====
+# Every effect key maps to a handler(manager, player, value). Most effects
+# are one of a few shapes, built by the factories below; the rest are small
+# functions. The table is built once at import and checked against every
+# effect key in upgrade_trees, so applying an upgrade is one dict lookup per
+# key and a typo in a tree fails at startup instead of being ignored.
+
+def _set(attr):
+    def handler(mgr, p, value):
+        setattr(p, attr, value)
+    return handler
+
+
+def _flag(attr):
+    def handler(mgr, p, value):
+        setattr(p, attr, True)
+    return handler
+
+
+def _add(attr, default=0, cast=None):
+    def handler(mgr, p, value):
+        setattr(p, attr, getattr(p, attr, default) + (cast(value) if cast else value))
+    return handler
+
+
+def _mul(attr, default=1.0):
+    def handler(mgr, p, value):
+        setattr(p, attr, getattr(p, attr, default) * value)
+    return handler
+
+
+def _max(attr, default=0, cast=None):
+    def handler(mgr, p, value):
+        setattr(p, attr, max(getattr(p, attr, default), cast(value) if cast else value))
+    return handler
+
+
+def _orb_element(element):
+    def handler(mgr, p, value):
+        if element not in p.aura_orb_elements:
+            p.aura_orb_elements.append(element)
+    return handler
+
+
+def _status_chance(attr, status):
+    def handler(mgr, p, value):
+        setattr(p, attr, value)
+        p.bullet_status[status] = True
+    return handler
+
+
+def _cannon_count(mgr, p, value):
+    p.cannon_count = max(getattr(p, "cannon_count", 1), int(value))
+    p.bullet_count = p.cannon_count  # Sync shooting with visual cannons
+
+
+def _damage_mult(mgr, p, value):
+    p.damage = int(p.damage * value)
+
+
+def _fire_rate_mult(mgr, p, value):
+    p.fire_rate *= value
+    p.fire_cd = 1.0 / p.fire_rate
+
+
+def _pierce_count(mgr, p, value):
+    p.pierce_count = getattr(p, "pierce_count", 0) + int(value)
+    p.piercing = True
+
+
+def _bullet_count(mgr, p, value):
+    p.bullet_count += int(value)
+
+
+def _move_speed_mult(mgr, p, value):
+    p.speed *= value
+    p.base_speed *= value
+
+
+def _mag_size_bonus(mgr, p, value):
+    p.mag_size += int(value)
+    p.ammo = min(p.ammo + int(value), p.mag_size)
+
+
+def _reload_speed_mult(mgr, p, value):
+    p.reload_time /= value  # Faster reload = lower time
+
+
+def _ammo_save_chance(mgr, p, value):
+    p.ammo_save_chance = getattr(p, "ammo_save_chance", 0) + value
+    p.homing_strength = value
+
+
+def _orb_count(mgr, p, value):
+    p.aura_unlocked = True  # Enable aura orb system
+    p.aura_orb_count = max(getattr(p, "aura_orb_count", 0), int(value))
+    p.rebuild_aura_orbs()
+
+
+def _orb_damage_mult(mgr, p, value):
+    p.aura_orb_damage = int(p.aura_orb_damage * value)
+
+
+def _orb_all_elements(mgr, p, value):
+    p.aura_orb_elements = ["fire", "ice", "poison"]
+
+
+def _shield_active(mgr, p, value):
+    p.shield_active = True
+    # Initialize shield HP to match segments if not set
+    if getattr(p, "shield_hp", 0) == 0:
+        p.shield_hp = getattr(p, "shield_segments", 1)
+
+
+def _shield_segments(mgr, p, value):
+    p.shield_segments = max(getattr(p, "shield_segments", 0), int(value))
+    # Update HP to match segments
+    if getattr(p, "shield_hp", 0) < int(value):
+        p.shield_hp = int(value)
+
+
+def _shield_hp(mgr, p, value):
+    p.shield_hp = getattr(p, "shield_hp", 1) + int(value)
+
+
+def _max_hp(mgr, p, value):
+    p.max_hearts += int(value)
+    p.hearts = p.max_hearts
+
+
+def _glare_damage_mult(mgr, p, value):
+    p.glare_damage = int(getattr(p, "glare_damage", 20) * value)
+
+
+def _drone_all_elements(mgr, p, value):
+    p.drone_all_elements = True
+    p.drone_burn = True
+    p.drone_poison = True
+
+
+def _dragon_active(mgr, p, value):
+    p.dragon_active = True
+    mgr.dragon_hatched = True  # Also mark as hatched
+
+
+def _summon_count_mult(mgr, p, value):
+    p.ghost_count = int(p.ghost_count * value)
+
+
+EFFECT_HANDLERS = {
+    # ===== CANNONS =====
+    "cannon_count": _cannon_count,
+    "cannon_spread": _set("cannon_spread"),
+    "has_rear_cannon": _flag("has_rear_cannon"),
+    "cannon_pattern": _set("cannon_pattern"),
+
+    # ===== BULLET PROPERTIES =====
+    "damage_mult": _damage_mult,
+    "bullet_speed_mult": _mul("bullet_speed"),
+    "fire_rate_mult": _fire_rate_mult,
+    "bullet_size_mult": _mul("bullet_size_mult"),
+    "pierce_count": _pierce_count,
+    "bullet_count": _bullet_count,
+    "hitscan_range": _set("hitscan_range"),
+    "explosive_bullets": _flag("explosive_bullets"),
+    "explosion_radius": _set("explosion_radius"),
+    "spray_mode": _flag("spray_mode"),
+    "spread_angle": _set("spread_angle_deg"),
+    "homing_bullets": _flag("guided_shots"),
+    "homing_strength": _set("homing_strength"),
+
+    # ===== BOUNCING =====
+    "bounce_count": _max("bounce_count", 0, int),
+    "bounce_damage_bonus": _add("bounce_damage_bonus"),
+    "bounce_homing": _flag("bounce_homing"),
+
+    # ===== PLAYER STATS =====
+    "move_speed_mult": _move_speed_mult,
+    "boost_recharge_mult": _mul("boost_recharge"),
+    "boost_invuln": _flag("boost_invuln"),
+    "mag_size_bonus": _mag_size_bonus,
+    "reload_speed_mult": _reload_speed_mult,
+    "ammo_save_chance": _ammo_save_chance,
+
+    # ===== ELEMENTS =====
+    "burn_chance": _status_chance("burn_chance", "burn"),
+    "burn_dps": _max("base_burn_dps"),
+    "burn_duration": _set("burn_duration"),
+    "burn_dps_mult": _mul("burn_bonus_mult"),
+    "burn_spread": _flag("burn_spread"),
+    "burn_explosion": _flag("burn_explosion"),
+    "explosion_damage": _set("explosion_damage"),
+    "burn_chain_explosions": _set("burn_chain_explosions"),
+
+    "freeze_chance": _status_chance("freeze_chance", "ice"),
+    "slow_amount": _set("slow_amount"),
+    "freeze_duration": _set("freeze_duration"),
+    "frozen_damage_bonus": _add("frozen_damage_bonus"),
+    "shatter_on_death": _flag("shatter_on_death"),
+    "shatter_damage": _set("shatter_damage"),
+    "deep_freeze": _flag("deep_freeze"),
+    "shatter_chain": _set("shatter_chain"),
+
+    "poison_chance": _status_chance("poison_chance", "poison"),
+    "poison_dps": _max("base_poison_dps"),
+    "poison_duration": _set("poison_duration"),
+    "poison_spread": _flag("poison_spread"),
+    "spread_radius": _set("spread_radius"),
+    "poison_weaken": _set("poison_weaken"),
+    "poison_infinite_spread": _flag("poison_infinite_spread"),
+    "poison_death_explosion": _flag("poison_death_explosion"),
+
+    # ===== ORBS =====
+    "orb_count": _orb_count,
+    "orb_damage": _set("aura_orb_damage"),
+    "orb_radius": _set("aura_orb_radius"),
+    "orb_speed_mult": _mul("aura_orb_speed"),
+    "orb_damage_mult": _orb_damage_mult,
+    "orb_burn": _orb_element("fire"),
+    "orb_burn_dps": _set("orb_burn_dps"),
+    "orb_freeze": _orb_element("ice"),
+    "orb_slow": _set("orb_slow"),
+    "orb_poison": _orb_element("poison"),
+    "orb_poison_dps": _set("orb_poison_dps"),
+    "orb_all_elements": _orb_all_elements,
+    "orb_trail": _flag("orb_trail"),
+    "orb_trail_damage": _set("orb_trail_damage"),
+    "orb_pulse": _flag("orb_pulse"),
+
+    # ===== DEFENSE - SHIELD =====
+    "shield_active": _shield_active,
+    "shield_segments": _shield_segments,
+    "shield_radius": _set("shield_radius"),
+    "shield_hp": _shield_hp,
+    "shield_reflect": _flag("shield_reflect"),
+    "shield_regen": _flag("shield_regen"),
+    "shield_regen_time": _set("shield_regen_time"),
+
+    # ===== DEFENSE - HEALTH =====
+    "max_hp": _max_hp,
+    "hp_regen": _flag("hp_regen"),
+    "regen_interval": _set("regen_interval"),
+    "revive": _max("revives", 0, int),
+    "revive_full_hp": _flag("revive_full_hp"),
+
+    # ===== DEFENSE - SPEED =====
+    "dash_ability": _flag("dash_ability"),
+    "dash_cooldown": _set("dash_cooldown"),
+    "dodge_chance": _add("dodge_chance"),
+    "dash_trail": _flag("dash_trail"),
+
+    # ===== VISION - GLARE =====
+    "glare_active": _flag("glare_active"),
+    "glare_interval": _set("glare_interval"),
+    "glare_damage": _set("glare_damage"),
+    "glare_damage_mult": _glare_damage_mult,
+    "glare_slow": _set("glare_slow"),
+    "glare_stun": _flag("glare_stun"),
+    "glare_stun_duration": _set("glare_stun_duration"),
+    "glare_execute": _set("glare_execute"),
+
+    # ===== SUMMONS - DRONES (was Ghost) =====
+    "drone_count": _add("drone_count", 0, int),
+    "drone_damage": _max("drone_damage"),
+    "drone_pierce": _flag("drone_pierce"),
+    "drone_burn": _flag("drone_burn"),
+    "drone_poison": _flag("drone_poison"),
+    "drone_rapid_fire": _flag("drone_rapid_fire"),
+    "drone_all_elements": _drone_all_elements,
+    # Legacy ghost support
+    "ghost_count": _add("ghost_count", 0, int),
+    "ghost_damage": _max("ghost_damage"),
+    "ghost_pierce": _flag("ghost_piercing"),
+    "ghost_burn": _flag("ghost_burn"),
+    "ghost_poison": _flag("ghost_poison"),
+    "ghost_rapid_fire": _flag("ghost_rapid_fire"),
+    "ghost_all_elements": _flag("ghost_all_elements"),
+
+    # ===== SUMMONS - PHANTOMS (new ghost type) =====
+    "phantom_count": _add("phantom_count", 0, int),
+    "phantom_damage": _add("phantom_damage"),
+    "phantom_slow": _flag("phantom_slow"),
+    "phantom_lifesteal": _flag("phantom_lifesteal"),
+    "phantom_speed": _set("phantom_speed"),
+
+    # ===== SUMMONS - DRAGON =====
+    "dragon_egg": _flag("has_dragon_egg"),
+    "dragon_hatch_time": _set("dragon_hatch_time"),
+    "dragon_active": _dragon_active,
+    "dragon_damage": _max("dragon_damage"),
+    "dragon_fire_breath": _flag("dragon_fire_breath"),
+    "dragon_burn_dps": _set("dragon_burn_dps"),
+    "dragon_growth": _flag("dragon_growth"),
+    "dragon_damage_growth": _set("dragon_damage_growth"),
+    "elder_dragon": _flag("elder_dragon"),
+    "dragon_size": _set("dragon_size"),
+
+    # ===== SUMMONS - LENS =====
+    "lens_count": _max("lens_count", 0, int),
+    "lens_multiply": _set("lens_multiply"),
+    "lens_bullet_mult": _max("lens_bullet_mult", 1, int),
+    "lens_damage_bonus": _add("lens_damage_bonus"),
+    "lens_split": _max("lens_split", 1, int),
+    "lens_enlarge": _max("lens_enlarge", 1.0, float),
+
+    # ===== EVOLUTIONS =====
+    "lightning_active": _flag("lightning_active"),
+    "lightning_interval": _set("lightning_interval"),
+    "lightning_damage": _set("lightning_damage"),
+    "lightning_chain": _set("lightning_chain"),
+    "summon_count_mult": _summon_count_mult,
+    "summon_damage_mult": _mul("summon_damage_mult"),
+}
+
+
+def _validate_effect_handlers():
+    """Fail at import if an upgrade or evolution uses an unhandled effect key."""
+    missing = set()
+    for tree in ALL_TREES:
+        for upgrade in tree["upgrades"]:
+            missing.update(k for k in upgrade.effects if k not in EFFECT_HANDLERS)
+    for evo in EVOLUTIONS.values():
+        missing.update(k for k in evo["effects"] if k not in EFFECT_HANDLERS)
+    if missing:
+        raise KeyError(f"No upgrade effect handler for: {', '.join(sorted(missing))}")
+
+
+_validate_effect_handlers()
 
 
 class UpgradeManager:
     """Manages player's upgrade state and applies effects."""
     
-    def __init__(self, player):
+    def __init__(self, player, rng=None):
         self.player = player
+        # Game.rng streams: "upgrades" for options and procs, "combat" for dodge
+        self.rng = rng if rng is not None else RandomStreams()
         self.owned_upgrades: Set[str] = set()
+        # Bitsets over UPGRADE_ORDER; available_mask is kept up to date as
+        # upgrades are owned (see _mark_owned)
+        self.owned_mask = 0
+        self.available_mask = INITIAL_AVAILABLE_MASK
         self.active_evolutions: List[dict] = []
         
         # Tracking counters
@@ -41,45 +379,23 @@ class UpgradeManager:
     
     def get_available_options(self, count: int = 3) -> List[Upgrade]:
         """Get random selection of available upgrades for level-up screen."""
-        available = []
-        for tree in ALL_TREES:
-            for upgrade in tree["upgrades"]:
-                if upgrade.id in self.owned_upgrades:
-                    continue
-                
-                # Check explicit requirements first (cross-tree dependencies)
-                if upgrade.requires:
-                    if not all(req in self.owned_upgrades for req in upgrade.requires):
-                        continue
-                
-                # Check tier requirements within the same tree
-                if upgrade.tier == 1:
-                    # Tier 1 with no explicit requires is always available
-                    if not upgrade.requires:
-                        available.append(upgrade)
-                    else:
-                        # Tier 1 with requires already passed the check above
-                        available.append(upgrade)
-                elif upgrade.tier == 2:
-                    # Need tier 1 of same tree OR explicit requires satisfied
-                    tier1_owned = any(
-                        u.id in self.owned_upgrades 
-                        for u in tree["upgrades"] if u.tier == 1
-                    )
-                    if tier1_owned or upgrade.requires:
-                        available.append(upgrade)
-                elif upgrade.tier == 3:
-                    # Need at least one tier 2 of same tree OR explicit requires satisfied
-                    tier2_owned = any(
-                        u.id in self.owned_upgrades 
-                        for u in tree["upgrades"] if u.tier == 2
-                    )
-                    if tier2_owned or upgrade.requires:
-                        available.append(upgrade)
-        
+        available = [UPGRADE_ORDER[i] for i in iter_mask(self.available_mask)]
         if len(available) <= count:
             return available
-        return random.sample(available, count)
+        return self.rng.upgrades.sample(available, count)
+    
+    def _mark_owned(self, upgrade_id: str):
+        """Own an upgrade and re-check only the upgrades that depend on it."""
+        bits = UPGRADE_BITS[upgrade_id]
+        self.owned_upgrades.add(upgrade_id)
+        self.owned_mask |= bits
+        self.available_mask &= ~bits
+        for index in iter_mask(bits):
+            for dep in UPGRADE_DEPENDENTS[index]:
+                if is_upgrade_available(dep, self.owned_mask):
+                    self.available_mask |= 1 << dep
+                else:
+                    self.available_mask &= ~(1 << dep)
     
     def get_tier3_options(self) -> List[Upgrade]:
         """Get all tier 3 upgrades for test mode."""
@@ -105,14 +421,15 @@ class UpgradeManager:
             tree = TREES_BY_ID.get(upgrade.tree_id)
             if tree:
                 for u in tree["upgrades"]:
-                    self.owned_upgrades.add(u.id)
+                    self._mark_owned(u.id)
         else:
             # Normal application
             self._apply_effects(upgrade.effects)
-            self.owned_upgrades.add(upgrade_id)
+            self._mark_owned(upgrade_id)
         
         # Check for available evolutions
         self._check_evolutions()
+        self.player.refresh_stats()
         return True
     
     def apply_evolution(self, evolution_id: str) -> bool:
@@ -123,400 +440,89 @@ class UpgradeManager:
         evo = EVOLUTIONS[evolution_id]
         self._apply_effects(evo["effects"])
         self.active_evolutions.append(evo)
+        self.player.refresh_stats()
         return True
     
     def _apply_effects(self, effects: dict):
         """Apply a dictionary of effects to the player."""
         p = self.player
-        
         for key, value in effects.items():
-            # ===== CANNONS =====
-            if key == "cannon_count":
-                p.cannon_count = max(getattr(p, "cannon_count", 1), int(value))
-                p.bullet_count = p.cannon_count  # Sync shooting with visual cannons
-            elif key == "cannon_spread":
-                p.cannon_spread = value
-            elif key == "has_rear_cannon":
-                p.has_rear_cannon = True
-            elif key == "cannon_pattern":
-                p.cannon_pattern = value
-            
-            # ===== BULLET PROPERTIES =====
-            elif key == "damage_mult":
-                p.damage = int(p.damage * value)
-            elif key == "bullet_speed_mult":
-                p.bullet_speed *= value
-            elif key == "fire_rate_mult":
-                p.fire_rate *= value
-                p.fire_cd = 1.0 / p.fire_rate
-            elif key == "bullet_size_mult":
-                p.bullet_size_mult = getattr(p, "bullet_size_mult", 1.0) * value
-            elif key == "pierce_count":
-                p.pierce_count = getattr(p, "pierce_count", 0) + int(value)
-                p.piercing = True
-            elif key == "bullet_count":
-                p.bullet_count += int(value)
-            elif key == "hitscan_range":
-                p.hitscan_range = value
-            elif key == "explosive_bullets":
-                p.explosive_bullets = True
-            elif key == "explosion_radius":
-                p.explosion_radius = value
-            elif key == "spray_mode":
-                p.spray_mode = True
-            elif key == "spread_angle":
-                p.spread_angle_deg = value
-            elif key == "homing_bullets":
-                p.guided_shots = True
-            elif key == "homing_strength":
-                p.homing_strength = value
-            
-            # ===== BOUNCING =====
-            elif key == "bounce_count":
-                p.bounce_count = max(getattr(p, "bounce_count", 0), int(value))
-            elif key == "bounce_damage_bonus":
-                p.bounce_damage_bonus = getattr(p, "bounce_damage_bonus", 0) + value
-            elif key == "bounce_homing":
-                p.bounce_homing = True
-            
-            # ===== PLAYER STATS =====
-            elif key == "move_speed_mult":
-                p.speed *= value
-                p.base_speed *= value
-            elif key == "boost_recharge_mult":
-                p.boost_recharge *= value
-            elif key == "boost_invuln":
-                p.boost_invuln = True
-            elif key == "mag_size_bonus":
-                p.mag_size += int(value)
-                p.ammo = min(p.ammo + int(value), p.mag_size)
-            elif key == "reload_speed_mult":
-                p.reload_time /= value  # Faster reload = lower time
-            elif key == "ammo_save_chance":
-                p.ammo_save_chance = getattr(p, "ammo_save_chance", 0) + value
-                p.homing_strength = value
-            
-            # ===== ELEMENTS =====
-            elif key == "burn_chance":
-                p.burn_chance = value
-                p.bullet_status["burn"] = True
-            elif key == "burn_dps":
-                p.base_burn_dps = max(getattr(p, "base_burn_dps", 0), value)
-            elif key == "burn_duration":
-                p.burn_duration = value
-            elif key == "burn_dps_mult":
-                p.burn_bonus_mult *= value
-            elif key == "burn_spread":
-                p.burn_spread = True
-            elif key == "burn_explosion":
-                p.burn_explosion = True
-            elif key == "explosion_damage":
-                p.explosion_damage = value
-            elif key == "burn_chain_explosions":
-                p.burn_chain_explosions = value
-            
-            elif key == "freeze_chance":
-                p.freeze_chance = value
-                p.bullet_status["ice"] = True
-            elif key == "slow_amount":
-                p.slow_amount = value
-            elif key == "freeze_duration":
-                p.freeze_duration = value
-            elif key == "frozen_damage_bonus":
-                p.frozen_damage_bonus = getattr(p, "frozen_damage_bonus", 0) + value
-            elif key == "shatter_on_death":
-                p.shatter_on_death = True
-            elif key == "shatter_damage":
-                p.shatter_damage = value
-            elif key == "deep_freeze":
-                p.deep_freeze = True
-            elif key == "shatter_chain":
-                p.shatter_chain = value
-            
-            elif key == "poison_chance":
-                p.poison_chance = value
-                p.bullet_status["poison"] = True
-            elif key == "poison_dps":
-                p.base_poison_dps = max(getattr(p, "base_poison_dps", 0), value)
-            elif key == "poison_duration":
-                p.poison_duration = value
-            elif key == "poison_spread":
-                p.poison_spread = True
-            elif key == "spread_radius":
-                p.spread_radius = value
-            elif key == "poison_weaken":
-                p.poison_weaken = value
-            elif key == "poison_infinite_spread":
-                p.poison_infinite_spread = True
-            elif key == "poison_death_explosion":
-                p.poison_death_explosion = True
-            
-            # ===== ORBS =====
-            elif key == "orb_count":
-                p.aura_unlocked = True  # Enable aura orb system
-                p.aura_orb_count = max(getattr(p, "aura_orb_count", 0), int(value))
-                p.rebuild_aura_orbs()
-            elif key == "orb_damage":
-                p.aura_orb_damage = value
-            elif key == "orb_radius":
-                p.aura_orb_radius = value
-            elif key == "orb_speed_mult":
-                p.aura_orb_speed *= value
-            elif key == "orb_damage_mult":
-                p.aura_orb_damage = int(p.aura_orb_damage * value)
-            elif key == "orb_burn":
-                if "fire" not in p.aura_orb_elements:
-                    p.aura_orb_elements.append("fire")
-            elif key == "orb_burn_dps":
-                p.orb_burn_dps = value
-            elif key == "orb_freeze":
-                if "ice" not in p.aura_orb_elements:
-                    p.aura_orb_elements.append("ice")
-            elif key == "orb_slow":
-                p.orb_slow = value
-            elif key == "orb_poison":
-                if "poison" not in p.aura_orb_elements:
-                    p.aura_orb_elements.append("poison")
-            elif key == "orb_poison_dps":
-                p.orb_poison_dps = value
-            elif key == "orb_all_elements":
-                p.aura_orb_elements = ["fire", "ice", "poison"]
-            elif key == "orb_trail":
-                p.orb_trail = True
-            elif key == "orb_trail_damage":
-                p.orb_trail_damage = value
-            elif key == "orb_pulse":
-                p.orb_pulse = True
-            
-            # ===== DEFENSE - SHIELD =====
-            elif key == "shield_active":
-                p.shield_active = True
-                # Initialize shield HP to match segments if not set
-                if getattr(p, "shield_hp", 0) == 0:
-                    p.shield_hp = getattr(p, "shield_segments", 1)
-            elif key == "shield_segments":
-                p.shield_segments = max(getattr(p, "shield_segments", 0), int(value))
-                # Update HP to match segments
-                if getattr(p, "shield_hp", 0) < int(value):
-                    p.shield_hp = int(value)
-            elif key == "shield_radius":
-                p.shield_radius = value
-            elif key == "shield_hp":
-                p.shield_hp = getattr(p, "shield_hp", 1) + int(value)
-            elif key == "shield_reflect":
-                p.shield_reflect = True
-            elif key == "shield_regen":
-                p.shield_regen = True
-            elif key == "shield_regen_time":
-                p.shield_regen_time = value
-            
-            # ===== DEFENSE - HEALTH =====
-            elif key == "max_hp":
-                p.max_hearts += int(value)
-                p.hearts = p.max_hearts
-            elif key == "hp_regen":
-                p.hp_regen = True
-            elif key == "regen_interval":
-                p.regen_interval = value
-            elif key == "revive":
-                p.revives = max(p.revives, int(value))
-            elif key == "revive_full_hp":
-                p.revive_full_hp = True
-            
-            # ===== DEFENSE - SPEED =====
-            elif key == "move_speed_mult":
-                p.speed *= value
-                p.base_speed = p.speed
-            elif key == "dash_ability":
-                p.dash_ability = True
-            elif key == "dash_cooldown":
-                p.dash_cooldown = value
-            elif key == "dodge_chance":
-                p.dodge_chance = getattr(p, "dodge_chance", 0) + value
-            elif key == "dash_trail":
-                p.dash_trail = True
-            
-            # ===== VISION - GLARE =====
-            elif key == "glare_active":
-                p.glare_active = True
-            elif key == "glare_interval":
-                p.glare_interval = value
-            elif key == "glare_damage":
-                p.glare_damage = value
-            elif key == "glare_damage_mult":
-                p.glare_damage = int(getattr(p, "glare_damage", 20) * value)
-            elif key == "glare_slow":
-                p.glare_slow = value
-            elif key == "glare_stun":
-                p.glare_stun = True
-            elif key == "glare_stun_duration":
-                p.glare_stun_duration = value
-            elif key == "glare_execute":
-                p.glare_execute = value
-            
-            # ===== SUMMONS - DRONES (was Ghost) =====
-            elif key == "drone_count":
-                p.drone_count = getattr(p, "drone_count", 0) + int(value)
-            elif key == "drone_damage":
-                p.drone_damage = max(getattr(p, "drone_damage", 0), value)
-            elif key == "drone_pierce":
-                p.drone_pierce = True
-            elif key == "drone_burn":
-                p.drone_burn = True
-            elif key == "drone_poison":
-                p.drone_poison = True
-            elif key == "drone_rapid_fire":
-                p.drone_rapid_fire = True
-            elif key == "drone_all_elements":
-                p.drone_all_elements = True
-                p.drone_burn = True
-                p.drone_poison = True
-            # Legacy ghost support
-            elif key == "ghost_count":
-                p.ghost_count = getattr(p, "ghost_count", 0) + int(value)
-            elif key == "ghost_damage":
-                p.ghost_damage = max(getattr(p, "ghost_damage", 0), value)
-            elif key == "ghost_pierce":
-                p.ghost_piercing = True
-            elif key == "ghost_burn":
-                p.ghost_burn = True
-            elif key == "ghost_poison":
-                p.ghost_poison = True
-            elif key == "ghost_rapid_fire":
-                p.ghost_rapid_fire = True
-            elif key == "ghost_all_elements":
-                p.ghost_all_elements = True
-            
-            # ===== SUMMONS - PHANTOMS (new ghost type) =====
-            elif key == "phantom_count":
-                p.phantom_count = getattr(p, "phantom_count", 0) + int(value)
-            elif key == "phantom_damage":
-                p.phantom_damage = getattr(p, "phantom_damage", 0) + value
-            elif key == "phantom_slow":
-                p.phantom_slow = True
-            elif key == "phantom_lifesteal":
-                p.phantom_lifesteal = True
-            elif key == "phantom_speed":
-                p.phantom_speed = value
-            
-            # ===== SUMMONS - DRAGON =====
-            elif key == "dragon_egg":
-                p.has_dragon_egg = True
-            elif key == "dragon_hatch_time":
-                p.dragon_hatch_time = value
-            elif key == "dragon_active":
-                p.dragon_active = True
-                self.dragon_hatched = True  # Also mark as hatched
-            elif key == "dragon_damage":
-                p.dragon_damage = max(getattr(p, "dragon_damage", 0), value)
-            elif key == "dragon_fire_breath":
-                p.dragon_fire_breath = True
-            elif key == "dragon_burn_dps":
-                p.dragon_burn_dps = value
-            elif key == "dragon_growth":
-                p.dragon_growth = True
-            elif key == "dragon_damage_growth":
-                p.dragon_damage_growth = value
-            elif key == "elder_dragon":
-                p.elder_dragon = True
-            elif key == "dragon_size":
-                p.dragon_size = value
-            
-            # ===== SUMMONS - LENS =====
-            elif key == "lens_count":
-                p.lens_count = max(getattr(p, "lens_count", 0), int(value))
-            elif key == "lens_multiply":
-                p.lens_multiply = value
-            elif key == "lens_bullet_mult":
-                p.lens_bullet_mult = max(getattr(p, "lens_bullet_mult", 1), int(value))
-            elif key == "lens_damage_bonus":
-                p.lens_damage_bonus = getattr(p, "lens_damage_bonus", 0) + value
-            elif key == "lens_split":
-                p.lens_split = max(getattr(p, "lens_split", 1), int(value))
-            elif key == "lens_enlarge":
-                p.lens_enlarge = max(getattr(p, "lens_enlarge", 1.0), float(value))
-            
-            # ===== EVOLUTIONS =====
-            elif key == "lightning_active":
-                p.lightning_active = True
-            elif key == "lightning_interval":
-                p.lightning_interval = value
-            elif key == "lightning_damage":
-                p.lightning_damage = value
-            elif key == "lightning_chain":
-                p.lightning_chain = value
-            elif key == "summon_count_mult":
-                p.ghost_count = int(p.ghost_count * value)
-            elif key == "summon_damage_mult":
-                p.summon_damage_mult = getattr(p, "summon_damage_mult", 1.0) * value
+            handler = EFFECT_HANDLERS.get(key)
+            if handler is None:
+                raise KeyError(f"Unknown upgrade effect: {key!r}")
+            handler(self, p, value)
     
     def _check_evolutions(self):
         """Check if any evolutions are now available."""
-        available = get_available_evolutions(list(self.owned_upgrades))
+        available = get_available_evolutions(self.owned_mask)
         # Store for UI to access
         self.available_evolutions = available
     
     def update(self, dt: float, is_moving: bool = False, is_stationary: bool = False):
         """Update timed effects."""
         p = self.player
+        s = p.stats
         
         # Siege mode - 40% chance not to use ammo when stationary
-        if is_stationary and getattr(p, "siege_mode", False):
+        if is_stationary and s.siege_mode:
             p.siege_active = True
         else:
             p.siege_active = False
         
         # Dragon hatching (instant if hatch_time is 0 or very small)
-        if p.has_dragon_egg and not self.dragon_hatched:
-            if p.dragon_hatch_time <= 0.1:
+        if s.has_dragon_egg and not self.dragon_hatched:
+            if s.dragon_hatch_time <= 0.1:
                 # Instant hatch for elder dragon or test mode
                 self.dragon_hatched = True
                 p.dragon_active = True
+                p.refresh_stats()
             else:
                 self.dragon_age += dt
-                if self.dragon_age >= p.dragon_hatch_time:
+                if self.dragon_age >= s.dragon_hatch_time:
                     self.dragon_hatched = True
                     p.dragon_active = True
+                    p.refresh_stats()
         
         # Dragon growth
-        if getattr(p, "dragon_growth", False) and self.dragon_hatched:
-            growth_time = getattr(self, "dragon_growth_time", 0) + dt
+        if s.dragon_growth and self.dragon_hatched:
+            growth_time = self.dragon_growth_time + dt
             self.dragon_growth_time = growth_time
             if growth_time >= 60.0:  # Every 60 seconds
-                p.dragon_damage += getattr(p, "dragon_damage_growth", 5)
+                p.dragon_damage += s.dragon_damage_growth
                 self.dragon_growth_time = 0
+                p.refresh_stats()
         
         # HP Regen
-        if getattr(p, "hp_regen", False):
+        if s.hp_regen:
             self.regen_timer += dt
-            interval = getattr(p, "regen_interval", 30.0)
+            interval = s.regen_interval
             if self.regen_timer >= interval:
                 self.regen_timer = 0
                 if p.hearts < p.max_hearts:
                     p.hearts += 1
         
         # Glare timer
-        if getattr(p, "glare_active", False):
+        if s.glare_active:
             self.glare_timer += dt
         
         # Lightning timer
-        if getattr(p, "lightning_active", False):
+        if s.lightning_active:
             self.lightning_timer += dt
         
         # Shield regen
-        if getattr(p, "shield_regen", False):
-            if getattr(p, "shield_hp", 0) < getattr(p, "shield_segments", 1):
+        if s.shield_regen:
+            if p.shield_hp < s.shield_segments:
                 self.shield_regen_timer += dt
-                if self.shield_regen_timer >= getattr(p, "shield_regen_time", 10.0):
+                if self.shield_regen_timer >= s.shield_regen_time:
                     self.shield_regen_timer = 0
-                    p.shield_hp = getattr(p, "shield_hp", 0) + 1
+                    p.shield_hp += 1
     
     def should_glare_fire(self) -> bool:
         """Check if glare should fire this frame."""
-        p = self.player
-        if not getattr(p, "glare_active", False):
+        s = self.player.stats
+        if not s.glare_active:
             return False
-        interval = getattr(p, "glare_interval", 5.0)
+        interval = s.glare_interval
         if self.glare_timer >= interval:
             self.glare_timer = 0
             return True
@@ -524,10 +530,10 @@ class UpgradeManager:
     
     def should_lightning_fire(self) -> bool:
         """Check if lightning should fire this frame."""
-        p = self.player
-        if not getattr(p, "lightning_active", False):
+        s = self.player.stats
+        if not s.lightning_active:
             return False
-        interval = getattr(p, "lightning_interval", 2.0)
+        interval = s.lightning_interval
         if self.lightning_timer >= interval:
             self.lightning_timer = 0
             return True
@@ -540,22 +546,19 @@ class UpgradeManager:
     
     def check_siege_ammo_save(self, is_stationary: bool) -> bool:
         """Check if siege mode should save ammo (40% chance when stationary)."""
-        import random
-        p = self.player
-        if is_stationary and getattr(p, "siege_mode", False):
-            return random.random() < 0.4
+        if is_stationary and self.player.stats.siege_mode:
+            return self.rng.upgrades.random() < 0.4
         return False
     
     def on_shot(self) -> dict:
         """Called when player fires. Returns any triggered effects."""
-        import random
         p = self.player
         effects = {}
         
         # Lightning on shot
-        if getattr(p, "lightning_active", False) and self.should_lightning_fire():
+        if p.stats.lightning_active and self.should_lightning_fire():
             effects["lightning"] = {
-                "damage": getattr(p, "lightning_damage", 15),
+                "damage": p.stats.lightning_damage,
                 "area_mult": getattr(p, "lightning_area_mult", 1.0)
             }
         
@@ -582,14 +585,11 @@ class UpgradeManager:
     
     def check_dodge(self) -> bool:
         """Check if player dodges an attack."""
-        import random
-        p = self.player
-        dodge_chance = getattr(p, "dodge_chance", 0)
-        return dodge_chance > 0 and random.random() < dodge_chance
+        dodge_chance = self.player.stats.dodge_chance
+        return dodge_chance > 0 and self.rng.combat.random() < dodge_chance
     
     def on_kill(self, enemy=None, enemy_was_cursed: bool = False, enemy_was_frozen: bool = False):
         """Called when an enemy is killed."""
-        import random
         p = self.player
         self.kill_counter += 1
         
@@ -610,7 +610,7 @@ class UpgradeManager:
         
         # Bloodsuckers: summon kills can drop healing
         if getattr(p, "bloodsuckers_active", False):
-            if random.random() < 0.1:  # 10% chance
+            if self.rng.upgrades.random() < 0.1:  # 10% chance
                 pass  # Healing pickup spawned by game.py
     
     def on_hit(self):
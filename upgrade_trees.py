@@ -1127,6 +1127,71 @@ for tree in ALL_TREES:
     for upgrade in tree["upgrades"]:
         UPGRADES_BY_ID[upgrade.id] = upgrade
 
+# ============================================================================
+# PREREQUISITE DAG
+# ============================================================================
+# Every upgrade entry gets one bit, in ALL_TREES order, so sets of owned
+# upgrades are plain ints. Ownership is by id, so entries sharing an id are
+# owned together (UPGRADE_BITS). For each entry:
+#   UPGRADE_REQUIRES[i] - explicit (cross-tree) requirements, all needed
+#   UPGRADE_GATE[i]     - previous tier of the same tree, any one needed
+#                         (0 for tier 1 and for upgrades with explicit requires)
+#   UPGRADE_DEPENDENTS[i] - entries whose availability can change when i is owned
+UPGRADE_ORDER = [upgrade for tree in ALL_TREES for upgrade in tree["upgrades"]]
+UPGRADE_BITS = {}
+for i, upgrade in enumerate(UPGRADE_ORDER):
+    UPGRADE_BITS[upgrade.id] = UPGRADE_BITS.get(upgrade.id, 0) | 1 << i
+UPGRADE_REQUIRES = []
+UPGRADE_GATE = []
+for upgrade in UPGRADE_ORDER:
+    requires = 0
+    for req in upgrade.requires:
+        requires |= UPGRADE_BITS[req]
+    gate = 0
+    if upgrade.tier in (2, 3) and not upgrade.requires:
+        for i, u in enumerate(UPGRADE_ORDER):
+            if u.tree_id == upgrade.tree_id and u.tier == upgrade.tier - 1:
+                gate |= 1 << i
+    UPGRADE_REQUIRES.append(requires)
+    UPGRADE_GATE.append(gate)
+UPGRADE_DEPENDENTS = [
+    tuple(j for j in range(len(UPGRADE_ORDER))
+          if (UPGRADE_REQUIRES[j] | UPGRADE_GATE[j]) >> i & 1)
+    for i in range(len(UPGRADE_ORDER))
+]
+
+
+def is_upgrade_available(index: int, owned_mask: int) -> bool:
+    """Whether upgrade ``index`` can be offered given the owned bitset."""
+    if owned_mask >> index & 1:
+        return False
+    requires = UPGRADE_REQUIRES[index]
+    if owned_mask & requires != requires:
+        return False
+    gate = UPGRADE_GATE[index]
+    return not gate or bool(owned_mask & gate)
+
+
+def upgrade_mask(upgrade_ids) -> int:
+    """Bitset of the given upgrade ids."""
+    mask = 0
+    for upgrade_id in upgrade_ids:
+        mask |= UPGRADE_BITS[upgrade_id]
+    return mask
+
+
+def iter_mask(mask: int):
+    """Yield the bit indices set in ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+INITIAL_AVAILABLE_MASK = sum(
+    1 << i for i in range(len(UPGRADE_ORDER)) if is_upgrade_available(i, 0)
+)
+
 # Categories for UI organization
 CATEGORIES = {
     "CANNONS": ["cannons"],
@@ -1147,12 +1212,19 @@ def get_tier3_upgrades():
                 tier3.append(upgrade)
     return tier3
 
+# Combined full-tree effects per tree_id; trees are static so this is built once
+_TREE_EFFECTS_CACHE = {}
+
 def get_all_effects_for_tier3(tier3_upgrade):
     """Get combined effects of tier 1, 2, and 3 when selecting a tier 3."""
     tree = TREES_BY_ID.get(tier3_upgrade.tree_id)
     if not tree:
         return tier3_upgrade.effects.copy()
     
+    cached = _TREE_EFFECTS_CACHE.get(tree["tree_id"])
+    if cached is not None:
+        return dict(cached)
+    
     combined = {}
     for upgrade in tree["upgrades"]:
         for key, value in upgrade.effects.items():
@@ -1174,13 +1246,19 @@ def get_all_effects_for_tier3(tier3_upgrade):
                     combined[key] = value
             else:
                 combined[key] = value
-    return combined
+    _TREE_EFFECTS_CACHE[tree["tree_id"]] = combined
+    return dict(combined)
+
+# (required bitset, evolution) in EVOLUTIONS order
+EVOLUTION_REQUIRES = [
+    (upgrade_mask(evo.get("requires_upgrades", [])), evo) for evo in EVOLUTIONS.values()
+]
+
+def get_available_evolutions(owned_upgrades):
+    """Check which evolutions are available based on owned upgrades.
 
-def get_available_evolutions(owned_upgrades: list):
-    """Check which evolutions are available based on owned upgrades."""
-    available = []
-    for evo_id, evo in EVOLUTIONS.items():
-        required = evo.get("requires_upgrades", [])
-        if all(req in owned_upgrades for req in required):
-            available.append(evo)
-    return available
+    ``owned_upgrades`` is either an iterable of upgrade ids or an owned bitset.
+    """
+    if not isinstance(owned_upgrades, int):
+        owned_upgrades = upgrade_mask(owned_upgrades)
+    return [evo for required, evo in EVOLUTION_REQUIRES if owned_upgrades & required == required]